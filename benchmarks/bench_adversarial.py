@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Adversarial worst-case latency benchmark.
+
+Builds hostile inputs aimed at the extractor regexes and the relative-time
+pipeline (long digit and delimiter runs, repeated month names with optional
+punctuation, thousands of "in 2020" fragments, megabyte-long single tokens),
+runs ``parse_dates`` on each under ``profile_stages()``, and records the
+worst-case latency of every stage together with the input that caused it.
+
+--budget-ms fails the run (exit 1) when any single input exceeds the budget,
+which catches catastrophic backtracking introduced by a pattern change.
+
+Usage:
+    python -m benchmarks.bench_adversarial
+    python -m benchmarks.bench_adversarial --size 1000000 --budget-ms 5000
+"""
+
+import argparse
+import sys
+from time import perf_counter_ns
+
+from fast_parse_time import parse_dates, profile_stages
+
+from benchmarks.harness import print_table, write_results
+
+
+def _repeat(unit: str, size: int) -> str:
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+# Single tokens are at least a megabyte whatever --size is
+MIN_TOKEN_SIZE = 1_000_000
+
+# name -> builder(size); every input is `size` characters long except the tokens
+ADVERSARIAL_INPUTS = {
+    'digit_run': lambda n: '1' * n,
+    'slash_digits': lambda n: _repeat('12/', n),
+    'hyphen_digits': lambda n: _repeat('12-', n),
+    'dot_digits': lambda n: _repeat('1.2.', n),
+    'mixed_delimiters': lambda n: _repeat('1/2-3.4 ', n),
+    'spaced_numbers': lambda n: _repeat('12 ', n),
+    'hyphen_years': lambda n: _repeat('2020-', n),
+    'repeated_months': lambda n: _repeat('March ', n),
+    'month_punctuation': lambda n: _repeat('Mar., ', n),
+    'month_ordinals': lambda n: _repeat('March 3rd, ', n),
+    'month_hyphens': lambda n: _repeat('Oct-Oct-', n),
+    'in_2020': lambda n: _repeat('in 2020 ', n),
+    'prepositions': lambda n: _repeat('as of since by ', n),
+    'iso_prefixes': lambda n: _repeat('2017-02-03T', n),
+    'ago_run': lambda n: _repeat('ago ', n),
+    'number_words': lambda n: _repeat('twenty ', n),
+    'compact_tokens': lambda n: _repeat('1d2y ', n),
+    'comma_run': lambda n: _repeat(', ', n),
+    'long_token': lambda n: 'a' * max(n, MIN_TOKEN_SIZE),
+    'long_alnum_token': lambda n: _repeat('a1', max(n, MIN_TOKEN_SIZE)),
+    'long_digit_token': lambda n: _repeat('2020', max(n, MIN_TOKEN_SIZE)),
+}
+
+
+def run(size: int, repeat: int) -> dict:
+    results = {}
+    for name, build in ADVERSARIAL_INPUTS.items():
+        text = build(size)
+        best_ns, best_profile = None, None
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            with profile_stages() as prof:
+                parse_dates(text)
+            elapsed_ns = perf_counter_ns() - start
+            if best_ns is None or elapsed_ns < best_ns:
+                best_ns, best_profile = elapsed_ns, prof
+        results[name] = {
+            'total_ms': round(best_ns / 1e6, 2),
+            'stages_ms': {
+                stage_name: round(d['total_ns'] / 1e6, 2)
+                for stage_name, d in best_profile.to_dict().items()
+                if stage_name != 'parse_dates'
+            },
+        }
+        print(f'  {name:<18} {best_ns / 1e6:>10.2f} ms', file=sys.stderr)
+    return results
+
+
+def worst_case_by_stage(results: dict) -> dict:
+    """{stage: {'ms': worst latency, 'input': input name}} across all inputs."""
+    worst = {}
+    for input_name, d in results.items():
+        for stage_name, ms in d['stages_ms'].items():
+            if stage_name not in worst or ms > worst[stage_name]['ms']:
+                worst[stage_name] = {'ms': ms, 'input': input_name}
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size', type=int, default=100_000, help='characters per input')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--budget-ms', type=float, help='exit 1 if any input takes longer')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/adversarial.json)')
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat)
+    worst = worst_case_by_stage(results)
+
+    print_table(
+        [(stage_name, w['ms'], w['input']) for stage_name, w in sorted(worst.items())],
+        ('stage', 'worst ms', 'input'))
+
+    path = write_results('adversarial', {
+        'size': args.size, 'inputs': results, 'worst_by_stage': worst}, args.output)
+    print(f'\nWritten: {path}')
+
+    if args.budget_ms is not None:
+        over = [name for name, d in results.items() if d['total_ms'] > args.budget_ms]
+        if over:
+            print(f"\nOver {args.budget_ms} ms budget: {', '.join(over)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
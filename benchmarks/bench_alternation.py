@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Lexicon alternation benchmark.
+
+Compares the prefix-factored alternations from ``build_alternation`` (used by
+the explicit extractor for month names and year prepositions) with the flat
+``a|b|c`` alternations they replaced, on month-dense text: written dates and
+bare month names mixed with words that share a month prefix ('maybe',
+'decided', 'junior', 'augment') so most branch attempts fail late.
+
+Reported per pattern: matches per document, mean latency of ``finditer`` over
+each document for both forms, nanoseconds per match and the speedup.  Both
+forms must find identical spans; the script exits 1 if they do not.
+
+Usage:
+    python -m benchmarks.bench_alternation
+    python -m benchmarks.bench_alternation --size 1000 --min-speedup 1.2
+"""
+
+import argparse
+import random
+import re
+import sys
+
+from fast_parse_time.core import build_alternation
+from fast_parse_time.explicit.dto import MONTH_NAMES
+
+from benchmarks.corpus import MONTHS_ABBREV, MONTHS_FULL, PREPOSITIONS, SEED, _filler
+from benchmarks.harness import print_table, summarize, time_calls, write_results
+
+
+NEAR_MISSES = [
+    'maybe', 'mayor', 'marked', 'market', 'decided', 'decimal', 'junior', 'justice',
+    'augment', 'audit', 'octave', 'novel', 'notice', 'separate', 'sepsis', 'janitor',
+    'feature', 'apply', 'approve', 'julep',
+]
+
+YEAR_PREPOSITIONS = [
+    'as of', 'back to', 'prior to',
+    'in', 'since', 'by', 'until', 'before', 'after',
+    'during', 'circa', 'around', 'from', 'through',
+]
+
+
+def _flat(words: list[str]) -> str:
+    return '|'.join(re.escape(word).replace(r'\ ', r'\s+') for word in sorted(words, key=len, reverse=True))
+
+
+# (name, pattern template, lexicon); {alt} is replaced by either alternation
+PATTERNS = [
+    ('month_word', r'(?i)\b({alt})\b', sorted(MONTH_NAMES)),
+    ('written_date', r'(?i)({alt})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}', sorted(MONTH_NAMES)),
+    ('month_number', r'(?i)(?:(?:in|on)\s+)?({alt})\s+\d{{2}}(?!\d)', sorted(MONTH_NAMES)),
+    ('prose_year', r'(?i)\b(?:{alt})\s+(\d{{4}})\b', YEAR_PREPOSITIONS),
+]
+
+
+def generate_month_dense(size: int, seed: int = SEED) -> list[str]:
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(size):
+        words = []
+        for _ in range(rng.randint(20, 60)):
+            roll = rng.random()
+            if roll < 0.25:
+                month = rng.choice(MONTHS_FULL + MONTHS_ABBREV)
+                words.append(rng.choice([
+                    month, f'{month} {rng.randint(1, 28)}, {rng.randint(1990, 2030)}',
+                    f'{month} {rng.randint(10, 28)}', f'{rng.randint(1, 28)} {month}']))
+            elif roll < 0.55:
+                words.append(rng.choice(NEAR_MISSES))
+            elif roll < 0.65:
+                words.append(f'{rng.choice(PREPOSITIONS)} {rng.randint(1990, 2030)}')
+            else:
+                words.append(_filler(rng, 1, 1))
+        documents.append(' '.join(words))
+    return documents
+
+
+def run(size: int, repeat: int) -> dict:
+    documents = generate_month_dense(size)
+
+    results = {}
+    for name, template, lexicon in PATTERNS:
+        flat = re.compile(template.format(alt=_flat(lexicon)))
+        trie = re.compile(template.format(alt=build_alternation(lexicon)))
+
+        mismatches = sum(
+            [m.span() for m in flat.finditer(text)] != [m.span() for m in trie.finditer(text)]
+            for text in documents)
+        matches = sum(len(flat.findall(text)) for text in documents) / len(documents)
+
+        row = {
+            'matches_per_doc': round(matches, 1),
+            'flat': summarize(time_calls(lambda text: list(flat.finditer(text)), documents, repeat)),
+            'trie': summarize(time_calls(lambda text: list(trie.finditer(text)), documents, repeat)),
+            'mismatched_docs': mismatches,
+        }
+        if matches:
+            row['flat_ns_per_match'] = round(row['flat']['mean_us'] * 1000 / matches)
+            row['trie_ns_per_match'] = round(row['trie']['mean_us'] * 1000 / matches)
+        row['speedup'] = round(row['flat']['mean_us'] / row['trie']['mean_us'], 2) if row['trie']['mean_us'] else None
+        results[name] = row
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size', type=int, default=500, help='documents')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-speedup', type=float,
+                        help='exit 1 if any pattern is slower than this multiple of the flat form')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/alternation.json)')
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat)
+
+    rows = [(name, row['matches_per_doc'], row['flat']['mean_us'], row['trie']['mean_us'],
+             row.get('flat_ns_per_match', '-'), row.get('trie_ns_per_match', '-'),
+             row['speedup'], row['mismatched_docs'])
+            for name, row in results.items()]
+    print_table(rows, ('pattern', 'matches/doc', 'flat us', 'trie us',
+                       'flat ns/match', 'trie ns/match', 'speedup', 'mismatches'))
+
+    path = write_results('alternation', {'size': args.size, 'repeat': args.repeat,
+                                         'results': results}, args.output)
+    print(f'\nWritten: {path}')
+
+    mismatched = [name for name, row in results.items() if row['mismatched_docs']]
+    if mismatched:
+        print(f"\nDifferent matches: {', '.join(mismatched)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.min_speedup is not None:
+        slow = [name for name, row in results.items() if row['speedup'] < args.min_speedup]
+        if slow:
+            print(f"\nBelow {args.min_speedup}x: {', '.join(slow)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
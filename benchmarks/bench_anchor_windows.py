@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Anchor-window extraction benchmark.
+
+Long documents with few dates: a fixed number of date fragments (one of
+every shape in ``iter_fragments``) spread through prose of growing length,
+from 10 KB up to --max-bytes.  ``parse_dates(text)`` is compared with
+``parse_dates(text, anchor_windows=True)``, which only runs the extractors on
+the windows around anchor tokens.
+
+Reported per size: latency of both, the speedup, the share of the text kept by
+the explicit and relative windows, and whether both results are identical
+(the script exits 1 if any is not).  The growth exponent of each mode is
+fitted over all sizes: with a fixed number of dates the windowed mode should
+grow far slower than the full one (only the single anchor scan is linear).
+
+Usage:
+    python -m benchmarks.bench_anchor_windows
+    python -m benchmarks.bench_anchor_windows --max-bytes 1000000 --dates 50
+"""
+
+import argparse
+import random
+import sys
+import time
+from itertools import islice
+
+from fast_parse_time import parse_dates
+from fast_parse_time.explicit.bp import ExplicitTimeExtractor
+from fast_parse_time.explicit.svc import normalize_text
+from fast_parse_time.implicit.svc import AnalyzeTimeReferences
+
+from benchmarks.bench_scaling import fit_exponent
+from benchmarks.corpus import SEED, _filler, iter_fragments
+from benchmarks.harness import print_table, write_results
+
+
+SIZES = [10_000, 30_000, 100_000, 300_000, 1_000_000, 3_000_000]
+
+
+def generate_document(n_bytes: int, dates: int, seed: int = SEED) -> str:
+    """About n_bytes of prose with `dates` date fragments at random positions."""
+    rng = random.Random(f'{seed}:anchor_windows:{n_bytes}')
+    fragments = list(islice(iter_fragments(seed), dates))
+
+    paragraphs, total = [], 0
+    while total < n_bytes:
+        paragraph = _filler(rng, 20, 60) + '.'
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 1
+
+    for fragment in fragments:
+        paragraphs.insert(rng.randrange(len(paragraphs) + 1), fragment + '.')
+    return '\n'.join(paragraphs)
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def run(sizes: list[int], dates: int, repeat: int) -> dict:
+    results = {}
+    for size in sizes:
+        text = generate_document(size, dates)
+
+        full = parse_dates(text)
+        windowed = parse_dates(text, anchor_windows=True)
+
+        results[size] = {
+            'full_ms': round(best_ms(lambda: parse_dates(text), repeat), 2),
+            'windowed_ms': round(best_ms(lambda: parse_dates(text, anchor_windows=True), repeat), 2),
+            'explicit_coverage': round(
+                ExplicitTimeExtractor.anchor_windows(normalize_text(text)).coverage, 4),
+            'relative_coverage': round(AnalyzeTimeReferences.anchor_windows(text).coverage, 4),
+            'dates_found': len(full.explicit_dates) + len(full.relative_times),
+            'identical': (full.explicit_dates == windowed.explicit_dates
+                          and full.relative_times == windowed.relative_times),
+        }
+        row = results[size]
+        row['speedup'] = round(row['full_ms'] / row['windowed_ms'], 1) if row['windowed_ms'] else None
+        print(f"  {size:>10,} B  full {row['full_ms']:>9.2f} ms  "
+              f"windowed {row['windowed_ms']:>8.2f} ms", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--max-bytes', type=int, default=3_000_000)
+    parser.add_argument('--dates', type=int, default=20, help='date fragments per document')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/anchor_windows.json)')
+    args = parser.parse_args()
+
+    sizes = [n for n in SIZES if n <= args.max_bytes]
+    results = run(sizes, args.dates, args.repeat)
+
+    rows = [(f'{size:,}', row['dates_found'], row['full_ms'], row['windowed_ms'], row['speedup'],
+             f"{row['explicit_coverage']:.1%}", f"{row['relative_coverage']:.1%}", row['identical'])
+            for size, row in results.items()]
+    print_table(rows, ('bytes', 'found', 'full ms', 'windowed ms', 'speedup',
+                       'explicit kept', 'relative kept', 'identical'))
+
+    exponents = {
+        mode: round(fit_exponent(sizes, [results[n][f'{mode}_ms'] for n in sizes]), 3)
+        for mode in ('full', 'windowed')
+    }
+    print(f"\nGrowth exponent: full {exponents['full']}, windowed {exponents['windowed']}")
+
+    path = write_results('anchor_windows', {'dates': args.dates, 'repeat': args.repeat,
+                                            'exponents': exponents, 'results': results}, args.output)
+    print(f'\nWritten: {path}')
+
+    different = [size for size, row in results.items() if not row['identical']]
+    if different:
+        print(f"\nDifferent results at: {', '.join(map(str, different))}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Comparative benchmark against dateparser, datefinder and parsedatetime.
+
+Runs the corpora behind the parity suites in ``tests/compat/`` through this
+library and through every competitor that is installed locally (missing
+libraries are skipped).  For each library and corpus it reports throughput,
+p50/p99 latency, peak traced memory of one pass, and the agreement rate with
+fast-parse-time on whether each input contains a date or time at all.
+
+The corpus for ``tests/compat/<library>/`` is every string literal passed as
+the first argument of a fast_parse_time API call in that directory's test
+modules, so it stays in step with the parity suites without a second copy.
+
+Usage:
+    python -m benchmarks.bench_compat
+    python -m benchmarks.bench_compat --repeat 5 --min-speedup 10
+"""
+
+import argparse
+import ast
+import importlib
+import os
+import sys
+import tracemalloc
+from typing import Callable, Optional
+
+import fast_parse_time
+
+from benchmarks.harness import print_table, summarize, time_calls, write_results
+
+
+COMPAT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'compat')
+
+COMPETITORS = ['dateparser', 'datefinder', 'parsedatetime']
+
+
+def load_corpus(library: str) -> list[str]:
+    """Collect the inputs used by the parity suite for one library (ordered, unique)."""
+    directory = os.path.join(COMPAT_DIR, library)
+    texts = {}
+    for file_name in sorted(os.listdir(directory)):
+        if not (file_name.startswith('test_') and file_name.endswith('.py')):
+            continue
+        with open(os.path.join(directory, file_name), encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Name)
+                    and node.func.id in fast_parse_time.__all__
+                    and node.args
+                    and isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str)):
+                texts[node.args[0].value] = None
+    return list(texts)
+
+
+def _fast_parse_time() -> Callable[[str], bool]:
+    def detect(text: str) -> bool:
+        return fast_parse_time.parse_dates(text).has_dates
+    return detect
+
+
+def _dateparser() -> Callable[[str], bool]:
+    from dateparser.search import search_dates
+
+    def detect(text: str) -> bool:
+        return bool(search_dates(text, languages=['en']))
+    return detect
+
+
+def _datefinder() -> Callable[[str], bool]:
+    import datefinder
+
+    def detect(text: str) -> bool:
+        return next(datefinder.find_dates(text), None) is not None
+    return detect
+
+
+def _parsedatetime() -> Callable[[str], bool]:
+    import parsedatetime
+    calendar = parsedatetime.Calendar()
+
+    def detect(text: str) -> bool:
+        return bool(calendar.nlp(text))
+    return detect
+
+
+ADAPTERS = {
+    'fast_parse_time': _fast_parse_time,
+    'dateparser': _dateparser,
+    'datefinder': _datefinder,
+    'parsedatetime': _parsedatetime,
+}
+
+
+def load_adapter(library: str) -> Optional[Callable[[str], bool]]:
+    """Return a detect(text) -> bool callable, or None if the library is not installed."""
+    try:
+        detect = ADAPTERS[library]()
+    except ImportError:
+        return None
+
+    def safe_detect(text: str) -> bool:
+        # competitors raise on some inputs; a raise counts as "nothing found"
+        try:
+            return detect(text)
+        except Exception:
+            return False
+    return safe_detect
+
+
+def library_version(library: str) -> str:
+    try:
+        module = importlib.import_module(library)
+    except ImportError:
+        return 'not installed'
+    return getattr(module, '__version__', 'unknown')
+
+
+def peak_memory_kb(detect: Callable[[str], bool], texts: list[str]) -> float:
+    """Peak traced allocation (KB) during one pass over `texts`, after a warmup pass."""
+    for text in texts:
+        detect(text)
+    tracemalloc.start()
+    try:
+        for text in texts:
+            detect(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def run(repeat: int, libraries: list[str]) -> dict:
+    corpora = {name: load_corpus(name) for name in COMPETITORS}
+    results, detections = {}, {}
+
+    for library in libraries:
+        detect = load_adapter(library)
+        if detect is None:
+            print(f'  skipping {library}: not installed', file=sys.stderr)
+            results[library] = {'skipped': True}
+            continue
+
+        per_corpus = {}
+        for corpus_name, texts in corpora.items():
+            stats = summarize(time_calls(detect, texts, repeat=repeat))
+            stats['peak_kb'] = peak_memory_kb(detect, texts)
+            detections[library, corpus_name] = [detect(text) for text in texts]
+            per_corpus[corpus_name] = stats
+        results[library] = {'skipped': False, 'version': library_version(library),
+                            'corpora': per_corpus}
+
+    # agreement with fast-parse-time on "does this input contain a date or time"
+    baseline = results['fast_parse_time']['corpora']
+    for library, d in results.items():
+        if d['skipped']:
+            continue
+        for corpus_name, stats in d['corpora'].items():
+            ours = detections['fast_parse_time', corpus_name]
+            theirs = detections[library, corpus_name]
+            stats['agreement'] = round(
+                sum(a == b for a, b in zip(ours, theirs)) / len(ours), 3) if ours else 1.0
+            stats['detected'] = sum(theirs)
+            stats['speedup'] = round(
+                baseline[corpus_name]['ops_per_sec'] / stats['ops_per_sec'], 2
+            ) if library != 'fast_parse_time' and stats['ops_per_sec'] else 1.0
+
+    return {'corpus_sizes': {name: len(texts) for name, texts in corpora.items()},
+            'libraries': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=3, help='passes over each corpus')
+    parser.add_argument('--library', action='append', choices=COMPETITORS,
+                        help='only compare against this library (repeatable)')
+    parser.add_argument('--min-speedup', type=float,
+                        help='exit 1 if fast-parse-time is not at least this many times '
+                             'faster than every installed competitor on every corpus')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/compat.json)')
+    args = parser.parse_args()
+
+    libraries = ['fast_parse_time'] + (args.library or COMPETITORS)
+    results = run(args.repeat, libraries)
+
+    rows, slow = [], []
+    for library, d in results['libraries'].items():
+        if d['skipped']:
+            rows.append((library, '-', 'not installed', '', '', '', '', '', ''))
+            continue
+        for corpus_name, s in d['corpora'].items():
+            rows.append((library, corpus_name, s['ops_per_sec'], s['p50_us'], s['p99_us'],
+                         s['peak_kb'], s['detected'], f"{s['agreement']:.1%}", f"{s['speedup']}x"))
+            if (args.min_speedup is not None and library != 'fast_parse_time'
+                    and s['speedup'] < args.min_speedup):
+                slow.append(f'{library}/{corpus_name} ({s["speedup"]}x)')
+    print_table(rows, ('library', 'corpus', 'ops/sec', 'p50 us', 'p99 us',
+                       'peak KB', 'detected', 'agreement', 'our speedup'))
+    print(f"\nCorpus sizes: {results['corpus_sizes']}")
+
+    path = write_results('compat', {'repeat': args.repeat, **results}, args.output)
+    print(f'Written: {path}')
+
+    if slow:
+        print(f"\nSpeedup below {args.min_speedup}x: {', '.join(slow)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Batch deduplication benchmark.
+
+A log-like corpus in which most lines repeat: a pool of distinct lines (one
+of every corpus category) is sampled with a Zipf-like skew, and some copies
+get extra whitespace, until --lines lines are drawn.  --duplicate-ratio sets
+the share of lines that are repeats.
+
+``parse_dates`` per line is compared with ``parse_dates_batch`` (which parses
+each distinct line once) with the default table and with a table budget of
+--small-table-bytes, which forces evictions.  Reported per mode: lines/sec,
+speedup, and the table's entries, peak bytes, hit rate and evictions.  The
+script exits 1 if a batch result differs from ``parse_dates`` of the line
+with its whitespace normalized.
+
+Usage:
+    python -m benchmarks.bench_dedupe
+    python -m benchmarks.bench_dedupe --lines 50000 --duplicate-ratio 0.9
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+
+from fast_parse_time import DedupeTable, parse_dates, parse_dates_batch
+
+from benchmarks.corpus import CATEGORIES, SEED, generate_corpus
+from benchmarks.harness import print_table, write_results
+
+
+def generate_lines(lines: int, duplicate_ratio: float, seed: int = SEED) -> list[str]:
+    """`lines` lines of which about duplicate_ratio are repeats of earlier ones."""
+    rng = random.Random(f'{seed}:dedupe')
+    unique = max(1, round(lines * (1 - duplicate_ratio)))
+    per_category = unique // len(CATEGORIES) + 1
+    corpus = generate_corpus(per_category, seed)
+    pool = [text for category in CATEGORIES for text in corpus[category] if text]
+    pool = list(dict.fromkeys(pool))[:unique]
+    rng.shuffle(pool)
+
+    # every pool line appears once, the rest are skewed towards the first lines
+    drawn = list(pool)
+    weights = [1 / (rank + 1) for rank in range(len(pool))]
+    drawn += rng.choices(pool, weights=weights, k=lines - len(drawn))
+    rng.shuffle(drawn)
+
+    # a tenth of the lines carry whitespace that normalization removes
+    return [f'  {text.replace(" ", "  ")}\n' if rng.random() < 0.1 else text for text in drawn]
+
+
+def best_seconds(fn, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(lines: list[str], repeat: int, small_table_bytes: int) -> dict:
+    reference = datetime.now()
+    results = {}
+
+    seconds = best_seconds(lambda: [parse_dates(text, reference=reference) for text in lines], repeat)
+    results['parse_dates'] = {'seconds': seconds}
+
+    seconds = best_seconds(lambda: parse_dates_batch(lines, dedupe=False, reference=reference), repeat)
+    results['batch'] = {'seconds': seconds}
+
+    expected = [parse_dates(' '.join(text.split()), reference=reference) for text in lines]
+    for mode, max_bytes in (('batch_dedupe', None), ('batch_dedupe_small', small_table_bytes)):
+        tables = []
+
+        def batch():
+            tables.append(DedupeTable() if max_bytes is None else DedupeTable(max_bytes))
+            return parse_dates_batch(lines, table=tables[-1], reference=reference)
+
+        seconds = best_seconds(batch, repeat)
+        stats = tables[-1].stats()
+        got = batch()
+        results[mode] = {
+            'seconds': seconds,
+            **stats,
+            'hit_rate': round(stats['hits'] / len(lines), 4),
+            'identical': all(
+                (a.explicit_dates, a.relative_times) == (b.explicit_dates, b.relative_times)
+                for a, b in zip(got, expected)),
+        }
+
+    base = results['parse_dates']['seconds']
+    for row in results.values():
+        row['lines_per_sec'] = round(len(lines) / row['seconds'])
+        row['speedup'] = round(base / row['seconds'], 2)
+        row['seconds'] = round(row['seconds'], 4)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=20_000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.75)
+    parser.add_argument('--small-table-bytes', type=int, default=64 * 1024)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/dedupe.json)')
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines, args.duplicate_ratio)
+    distinct = len({' '.join(text.split()) for text in lines})
+    print(f'{len(lines):,} lines, {distinct:,} distinct ({1 - distinct / len(lines):.1%} duplicates)')
+
+    results = run(lines, args.repeat, args.small_table_bytes)
+
+    rows = [(mode, f"{row['lines_per_sec']:,}", row['speedup'], row.get('entries', '-'),
+             f"{row['peak_bytes']:,}" if 'peak_bytes' in row else '-',
+             f"{row['hit_rate']:.1%}" if 'hit_rate' in row else '-',
+             row.get('evictions', '-'), row.get('identical', '-'))
+            for mode, row in results.items()]
+    print_table(rows, ('mode', 'lines/sec', 'speedup', 'entries', 'peak bytes',
+                       'hit rate', 'evictions', 'identical'))
+
+    path = write_results('dedupe', {'lines': len(lines), 'distinct': distinct,
+                                    'repeat': args.repeat, 'results': results}, args.output)
+    print(f'\nWritten: {path}')
+
+    if not all(row.get('identical', True) for row in results.values()):
+        print('\nBatch results differ from parse_dates', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
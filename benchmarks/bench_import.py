@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Import-time / cold-start benchmark.
+
+Launches fresh interpreters and measures:
+    import      ``python -X importtime -c "import fast_parse_time"``, with the
+                top modules by self time and a breakdown by group (KB literal
+                modules, baseblock, explicit.dto, the rest of the package,
+                other)
+    first call  wall time of ``import fast_parse_time`` plus the first
+                ``parse_dates`` call, and of the whole process
+
+Both are measured with a cold ``.pyc`` cache (the package is copied to a
+temporary directory without ``__pycache__`` and bytecode writing is disabled,
+so every run compiles) and a warm one (the same copy after compileall).
+Figures are the median of --runs launches.  --max-ms exits 1 when the warm
+time to first result is over the limit.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 10 --top 25
+"""
+
+import argparse
+import compileall
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter_ns
+
+from benchmarks.harness import print_table, write_results
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# First matching pattern wins
+MODULE_GROUPS = [
+    ('kb_literals', re.compile(r'^fast_parse_time\.implicit\.dto\.\w+_kb$')),
+    ('baseblock', re.compile(r'^baseblock(\.|$)')),
+    ('explicit_dto', re.compile(r'^fast_parse_time\.explicit\.dto$')),
+    ('fast_parse_time_other', re.compile(r'^fast_parse_time(\.|$)')),
+    ('other', re.compile(r'')),
+]
+
+_FIRST_CALL_PROBE = '''
+from time import perf_counter_ns
+start = perf_counter_ns()
+import fast_parse_time
+imported = perf_counter_ns()
+fast_parse_time.parse_dates('Meeting on 04/08/2024 about issues from 5 days ago')
+done = perf_counter_ns()
+print(imported - start, done - imported)
+'''
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$')
+
+
+def _python(args: list, pythonpath: str, cold: bool) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    if cold:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+    # run from the copy: `-c` puts the working directory first on sys.path
+    return subprocess.run([sys.executable] + args, capture_output=True, text=True,
+                          check=True, env=env, cwd=pythonpath)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """{module: self time us} from -X importtime output."""
+    self_us = {}
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            name = m.group(3).strip()
+            self_us[name] = self_us.get(name, 0) + int(m.group(1))
+    return self_us
+
+
+def group_of(module: str) -> str:
+    for name, pattern in MODULE_GROUPS:
+        if pattern.match(module):
+            return name
+
+
+def measure(pythonpath: str, cold: bool, runs: int) -> dict:
+    """Median figures over `runs` fresh interpreters."""
+    importtimes, first_imports, first_calls, processes = [], [], [], []
+    for _ in range(runs):
+        result = _python(['-X', 'importtime', '-c', 'import fast_parse_time'], pythonpath, cold)
+        importtimes.append(parse_importtime(result.stderr))
+
+        start = perf_counter_ns()
+        result = _python(['-c', _FIRST_CALL_PROBE], pythonpath, cold)
+        processes.append(perf_counter_ns() - start)
+        import_ns, call_ns = map(int, result.stdout.split())
+        first_imports.append(import_ns)
+        first_calls.append(call_ns)
+
+    modules = {
+        name: statistics.median(run.get(name, 0) for run in importtimes)
+        for name in importtimes[0]
+    }
+    groups = {name: 0 for name, _ in MODULE_GROUPS}
+    for name, us in modules.items():
+        groups[group_of(name)] += us
+
+    return {
+        'import_ms': round(statistics.median(first_imports) / 1e6, 2),
+        'first_parse_ms': round(statistics.median(first_calls) / 1e6, 2),
+        'time_to_first_result_ms': round(
+            statistics.median(a + b for a, b in zip(first_imports, first_calls)) / 1e6, 2),
+        'process_ms': round(statistics.median(processes) / 1e6, 2),
+        'importtime_total_ms': round(sum(modules.values()) / 1e3, 2),
+        'groups_ms': {name: round(us / 1e3, 2) for name, us in groups.items()},
+        'modules_ms': {name: round(us / 1e3, 2) for name, us in
+                       sorted(modules.items(), key=lambda kv: kv[1], reverse=True)},
+    }
+
+
+def run(runs: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(os.path.join(ROOT, 'fast_parse_time'),
+                        os.path.join(tmp, 'fast_parse_time'),
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        cold = measure(tmp, cold=True, runs=runs)
+        compileall.compile_dir(os.path.join(tmp, 'fast_parse_time'), quiet=1)
+        warm = measure(tmp, cold=False, runs=runs)
+    return {'cold': cold, 'warm': warm}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per measurement')
+    parser.add_argument('--top', type=int, default=15, help='modules to list')
+    parser.add_argument('--max-ms', type=float,
+                        help='exit 1 if the warm-.pyc time to first result exceeds this')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/import.json)')
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    cold, warm = results['cold'], results['warm']
+
+    summary = ['import_ms', 'first_parse_ms', 'time_to_first_result_ms', 'process_ms']
+    print_table([(key, cold[key], warm[key]) for key in summary], ('cold start', 'cold .pyc', 'warm .pyc'))
+    print()
+    print_table([(name, cold['groups_ms'][name], warm['groups_ms'][name]) for name, _ in MODULE_GROUPS],
+                ('group (importtime self ms)', 'cold .pyc', 'warm .pyc'))
+    print()
+    print_table([(name, ms, cold['modules_ms'].get(name, 0))
+                 for name, ms in list(warm['modules_ms'].items())[:args.top]],
+                ('module (importtime self ms)', 'warm .pyc', 'cold .pyc'))
+
+    path = write_results('import', {'runs': args.runs, **results}, args.output)
+    print(f'\nWritten: {path}')
+
+    if args.max_ms is not None and warm['time_to_first_result_ms'] > args.max_ms:
+        print(f"\nWarm time to first result {warm['time_to_first_result_ms']} ms "
+              f'exceeds {args.max_ms} ms', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Log template benchmark.
+
+A machine-log corpus: --templates line templates (drawn from a set of log
+shapes with random words) whose variable fields are IDs, counters, IP
+addresses, durations, numeric dates and ISO 8601 timestamps, filled in until
+--lines lines are drawn.  Almost no two lines are equal, so the dedupe table
+alone saves little; a tenth of the shapes carry a relative-time word and are
+always parsed in full.
+
+``parse_dates`` per line is compared with ``parse_dates_batch`` with dedupe
+only and with ``log_templates=True``.  Reported per mode: lines/sec, speedup,
+and for the template mode the number of templates and the share of lines
+replayed from one.  The script exits 1 if a batch result differs from
+``parse_dates`` of the line.
+
+Usage:
+    python -m benchmarks.bench_log_templates
+    python -m benchmarks.bench_log_templates --lines 100000 --templates 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+
+from fast_parse_time import (
+    DedupeTable,
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    parse_dates,
+    parse_dates_batch,
+    reset_metrics,
+)
+
+from benchmarks.corpus import SEED
+from benchmarks.harness import print_table, write_results
+
+
+WORDS = ('worker', 'job', 'request', 'session', 'upload', 'shard', 'queue', 'cache',
+         'replica', 'batch', 'client', 'task', 'node', 'lease', 'index', 'export')
+
+LEVELS = ('INFO', 'WARN', 'ERROR', 'DEBUG')
+
+# {w}: a word of the template; {id}, {n}, {ip}, {ms}, {date}, {iso}, {ts}: variable fields
+SHAPES = (
+    '{iso} {level} {w} {id} finished in {ms} ms status={n}',
+    '[{ts}] {level} {w} {id} failed after {n} retries (code {n})',
+    '{w} {id} logged in from {ip} port {id}',
+    '{level} {w}={id} {w}={n} {w}={n}',
+    'invoice {id} dated {date} for {w} {n}',
+    '{iso} {w} {id} renewed, expires {date}',
+    '{w} {id} moved {n} items to {w} {n} of {n}',
+    '{level} {w} {id} lag {ms} ms since {iso}',
+    '{w} {id} {w} {n}/{n} complete',
+    # relative-time words: parsed in full
+    '{level} {w} {id} will retry in {n} minutes',
+)
+
+
+def _field(rng: random.Random, name: str) -> str:
+    if name == 'id':
+        return str(rng.randint(10_000, 99_999_999))
+    if name == 'n':
+        return str(rng.randint(0, 999))
+    if name == 'ms':
+        return str(rng.randint(1, 5000))
+    if name == 'ip':
+        return '.'.join(str(rng.randint(1, 254)) for _ in range(4))
+    if name == 'date':
+        return f'{rng.randint(1, 12):02}/{rng.randint(1, 28):02}/{rng.randint(2019, 2026)}'
+    if name == 'iso':
+        return (f'{rng.randint(2019, 2026)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}'
+                f'T{rng.randint(0, 23):02}:{rng.randint(0, 59):02}:{rng.randint(0, 59):02}Z')
+    if name == 'ts':
+        return (f'{rng.randint(2019, 2026)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02} '
+                f'{rng.randint(0, 23):02}:{rng.randint(0, 59):02}:{rng.randint(0, 59):02},'
+                f'{rng.randint(0, 999):03}')
+    raise KeyError(name)
+
+
+def generate_lines(lines: int, templates: int, seed: int = SEED) -> list[str]:
+    """`lines` log lines cut from `templates` templates."""
+    rng = random.Random(f'{seed}:log_templates')
+
+    # a template fixes the shape, its words and its level; the fields vary per line
+    pool = []
+    for _ in range(templates):
+        template = rng.choice(SHAPES).replace('{level}', rng.choice(LEVELS))
+        while '{w}' in template:
+            template = template.replace('{w}', rng.choice(WORDS), 1)
+        pool.append(template)
+
+    weights = [1 / (rank + 1) for rank in range(len(pool))]
+    drawn = []
+    for template in rng.choices(pool, weights=weights, k=lines):
+        parts = template.split('{')
+        line = [parts[0]]
+        for part in parts[1:]:
+            name, rest = part.split('}', 1)
+            line.append(_field(rng, name) + rest)
+        drawn.append(''.join(line))
+    return drawn
+
+
+def best_seconds(fn, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(lines: list[str], repeat: int) -> dict:
+    reference = datetime.now()
+    results = {}
+
+    seconds = best_seconds(lambda: [parse_dates(text, reference=reference) for text in lines], repeat)
+    results['parse_dates'] = {'seconds': seconds}
+
+    seconds = best_seconds(lambda: parse_dates_batch(lines, reference=reference), repeat)
+    results['batch_dedupe'] = {'seconds': seconds}
+
+    tables = []
+
+    def batch():
+        tables.append(DedupeTable())
+        return parse_dates_batch(lines, templates=tables[-1], reference=reference)
+
+    seconds = best_seconds(batch, repeat)
+
+    reset_metrics()
+    enable_metrics()
+    try:
+        got = batch()
+        samples = metrics_snapshot()['fast_parse_time_cache_requests']['samples']
+    finally:
+        disable_metrics()
+        reset_metrics()
+    counts = {s['labels']['result']: s['value'] for s in samples
+              if s['labels']['cache'] == 'log_templates'}
+
+    expected = [parse_dates(text, reference=reference) for text in lines]
+    results['batch_log_templates'] = {
+        'seconds': seconds,
+        'templates': tables[-1].stats()['entries'],
+        'replayed': round(counts.get('hit', 0) / len(lines), 4),
+        'identical': all(
+            (a.explicit_dates, a.relative_times) == (b.explicit_dates, b.relative_times)
+            for a, b in zip(got, expected)),
+    }
+
+    base = results['parse_dates']['seconds']
+    for row in results.values():
+        row['lines_per_sec'] = round(len(lines) / row['seconds'])
+        row['speedup'] = round(base / row['seconds'], 2)
+        row['seconds'] = round(row['seconds'], 4)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=20_000)
+    parser.add_argument('--templates', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/log_templates.json)')
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines, args.templates)
+    distinct = len(set(lines))
+    print(f'{len(lines):,} lines from {args.templates:,} templates, {distinct:,} distinct')
+
+    results = run(lines, args.repeat)
+
+    rows = [(mode, f"{row['lines_per_sec']:,}", row['speedup'], row.get('templates', '-'),
+             f"{row['replayed']:.1%}" if 'replayed' in row else '-', row.get('identical', '-'))
+            for mode, row in results.items()]
+    print_table(rows, ('mode', 'lines/sec', 'speedup', 'templates', 'replayed', 'identical'))
+
+    path = write_results('log_templates', {'lines': len(lines), 'distinct': distinct,
+                                           'templates': args.templates, 'repeat': args.repeat,
+                                           'results': results}, args.output)
+    print(f'\nWritten: {path}')
+
+    if not all(row.get('identical', True) for row in results.values()):
+        print('\nBatch results differ from parse_dates', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Memory footprint benchmark.
+
+Reports:
+    import      memory retained by each KB module (index_by_slot_kb,
+                index_by_keyterm_kb, keyterm_counter_kb) and the resident-set
+                growth of ``import fast_parse_time``, each in a fresh interpreter
+    per call    tracemalloc peak and retained memory of one parse_dates call
+                on a representative document of every corpus category
+    batch       tracemalloc peak and retained memory of parse_dates over the
+                whole corpus
+
+KB modules are measured as the deep size of the objects they keep alive, not
+with tracemalloc: index_by_slot_kb is a single 118k-line dict literal, and
+tracemalloc resolves the line number within that one code object for every
+allocation, which makes a traced import take minutes.
+
+Measurements are compared with the budgets in ``benchmarks/budgets.json``;
+any value over budget exits 1, so KB growth from the scripts/generate_*_kb.py
+generators shows up as a number.  After an intentional change, re-record the
+budgets (measured values plus --headroom) with --write-budgets.
+
+Usage:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --write-budgets
+"""
+
+import argparse
+import compileall
+import gc
+import json
+import math
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from benchmarks.corpus import CATEGORIES, generate_category, generate_corpus
+from benchmarks.harness import print_table, write_results
+
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KB_MODULES = ['keyterm_counter_kb', 'index_by_slot_kb', 'index_by_keyterm_kb']
+KB_DIR = os.path.join(ROOT, 'fast_parse_time', 'implicit', 'dto')
+
+# Run in a fresh interpreter so nothing is already imported.  The KB modules
+# only depend on `typing`, so each can be loaded on its own from its file.
+_IMPORT_PROBE = '''
+import gc, importlib.util, json, os, resource, sys, types
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def deep_size(obj, seen):
+    stack, total = [obj], 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, types.ModuleType, types.FunctionType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+target = sys.argv[1]
+gc.collect()
+before = rss_kb()
+if target == 'fast_parse_time':
+    import fast_parse_time
+    result = {}
+else:
+    spec = importlib.util.spec_from_file_location(target, sys.argv[2])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    seen = set()
+    result = {'retained_kb': round(sum(
+        deep_size(value, seen) for name, value in vars(module).items()
+        if not name.startswith('__')) / 1024, 1)}
+gc.collect()
+result['rss_kb'] = rss_kb() - before
+result['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps(result))
+'''
+
+
+def measure_import(target: str) -> dict:
+    args = [sys.executable, '-c', _IMPORT_PROBE, target]
+    if target != 'fast_parse_time':
+        args.append(os.path.join(KB_DIR, f'{target}.py'))
+    out = subprocess.run(args, capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    return json.loads(out)
+
+
+def measure_calls(fn, texts: list) -> dict:
+    """Peak and retained (after gc) traced memory of calling fn on every text."""
+    for text in texts[:1]:
+        fn(text)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [fn(text) for text in texts]
+        _, peak = tracemalloc.get_traced_memory()
+        del results
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {
+        'peak_kb': round((peak - before) / 1024, 1),
+        'retained_kb': round((retained - before) / 1024, 1),
+    }
+
+
+def run(batch_size: int) -> dict:
+    results = {'import': {}, 'per_call': {}, 'batch': {}}
+
+    # measure imports from up-to-date .pyc files, as a deployed worker would
+    compileall.compile_dir(os.path.join(ROOT, 'fast_parse_time'), quiet=1)
+    for target in KB_MODULES + ['fast_parse_time']:
+        results['import'][target] = measure_import(target)
+
+    from fast_parse_time import parse_dates
+
+    for category in CATEGORIES:
+        results['per_call'][category] = measure_calls(parse_dates, generate_category(category, 1))
+
+    corpus = generate_corpus(batch_size)
+    batch = [text for category in CATEGORIES for text in corpus[category]]
+    results['batch'] = dict(measure_calls(parse_dates, batch), documents=len(batch))
+
+    return results
+
+
+def flatten_budgeted(results: dict) -> dict:
+    """{'import.index_by_slot_kb.retained_kb': value, ...} for every budgeted figure."""
+    flat = {}
+    for target in KB_MODULES:
+        flat[f'import.{target}.retained_kb'] = results['import'][target]['retained_kb']
+    flat['import.fast_parse_time.rss_kb'] = results['import']['fast_parse_time']['rss_kb']
+    for category, d in results['per_call'].items():
+        flat[f'per_call.{category}.peak_kb'] = d['peak_kb']
+    flat['batch.peak_kb'] = results['batch']['peak_kb']
+    flat['batch.retained_kb'] = results['batch']['retained_kb']
+    return flat
+
+
+def load_budgets() -> dict:
+    if not os.path.exists(BUDGETS_PATH):
+        return {}
+    with open(BUDGETS_PATH, encoding='utf-8') as f:
+        return json.load(f).get('memory', {})
+
+
+def write_budgets(measured: dict, headroom: float) -> None:
+    budgets = {}
+    if os.path.exists(BUDGETS_PATH):
+        with open(BUDGETS_PATH, encoding='utf-8') as f:
+            budgets = json.load(f)
+    # small figures get an absolute floor so allocator noise does not fail the run
+    budgets['memory'] = {
+        key: max(64, math.ceil(value * (1 + headroom) / 64) * 64)
+        for key, value in sorted(measured.items())
+    }
+    with open(BUDGETS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(budgets, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--batch-size', type=int, default=100, help='documents per category in the batch')
+    parser.add_argument('--write-budgets', action='store_true',
+                        help='record the measured values (plus headroom) in benchmarks/budgets.json')
+    parser.add_argument('--headroom', type=float, default=0.1)
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/memory.json)')
+    args = parser.parse_args()
+
+    results = run(args.batch_size)
+    measured = flatten_budgeted(results)
+    budgets = load_budgets()
+
+    rows, over = [], []
+    for key, value in measured.items():
+        budget = budgets.get(key)
+        status = '' if budget is None else ('ok' if value <= budget else 'OVER')
+        if status == 'OVER':
+            over.append(key)
+        rows.append((key, value, '-' if budget is None else budget, status))
+    print_table(rows, ('measurement', 'KB', 'budget KB', 'status'))
+    rss = results['import']['fast_parse_time']['max_rss_kb']
+    print(f'\nmax RSS of a process that only imports fast_parse_time: {rss:,} KB')
+
+    path = write_results('memory', {
+        'batch_size': args.batch_size, 'measurements': results, 'budgets': budgets}, args.output)
+    print(f'Written: {path}')
+
+    if args.write_budgets:
+        write_budgets(measured, args.headroom)
+        print(f'Budgets written: {BUDGETS_PATH}')
+    elif over:
+        print(f"\nOver budget: {', '.join(over)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
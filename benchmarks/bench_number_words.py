@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Number-word normalization benchmark.
+
+Compares the compiled number-word lexicon (``NumberWordParser``, used by
+``DigitTextReplacer``) with the previous behaviour of calling
+``w2n.word_to_num`` on every token and catching the ``ValueError`` raised for
+every non-number word.  Inputs are the lowercased, whitespace-split documents
+of every corpus category plus a ``cardinals`` category of embedded
+multi-token cardinals ('twenty five days ago', 'one hundred and ten minutes').
+
+Reported per category: ops/sec and mean latency of both, the speedup, the
+exceptions the word2number path raises per document, and how many documents
+come out differently (multi-token cardinals are now combined into one number,
+which word2number never did).  The word2number side is skipped if the package
+is not installed.
+
+Usage:
+    python -m benchmarks.bench_number_words
+    python -m benchmarks.bench_number_words --size 500 --min-speedup 5
+"""
+
+import argparse
+import random
+import sys
+
+from fast_parse_time.implicit.dmo import NumberWordParser
+
+from benchmarks.corpus import CATEGORIES, SEED, _embed, generate_corpus
+from benchmarks.harness import print_table, summarize, time_calls, write_results
+
+try:
+    from word2number import w2n
+except ImportError:  # pragma: no cover - optional comparison
+    w2n = None
+
+
+CARDINALS = [
+    'twenty five', 'thirty one', 'twenty-three', 'one hundred', 'one hundred and ten',
+    'two hundred and fifty', 'a hundred', 'ninety-nine', 'three thousand',
+    'one thousand two hundred and five', 'seven', 'twelve',
+]
+UNITS = ['days ago', 'minutes ago', 'weeks from now', 'years ago', 'hours later']
+
+
+def generate_cardinals(size: int, seed: int = SEED) -> list[str]:
+    rng = random.Random(seed)
+    return [_embed(rng, f'{rng.choice(CARDINALS)} {rng.choice(UNITS)}') for _ in range(size)]
+
+
+class Word2NumberReplacer(object):
+    """The per-token word2number loop NumberWordParser replaced."""
+
+    def __init__(self):
+        self.exceptions = 0
+
+    def process(self, tokens: list) -> list:
+        normalized = []
+        for token in tokens:
+            try:
+                normalized.append(str(w2n.word_to_num(token)))
+            except ValueError:
+                self.exceptions += 1
+                normalized.append(token)
+        return normalized
+
+
+def run(size: int, repeat: int) -> dict:
+    corpus = generate_corpus(size)
+    corpus['cardinals'] = generate_cardinals(size)
+
+    parser = NumberWordParser()
+    results = {}
+    for category in CATEGORIES + ['cardinals']:
+        documents = [text.lower().split() for text in corpus[category]]
+        lexicon = summarize(time_calls(parser.process, documents, repeat))
+        row = {'lexicon': lexicon}
+
+        if w2n is not None:
+            legacy = Word2NumberReplacer()
+            row['word2number'] = summarize(time_calls(legacy.process, documents, repeat))
+            legacy.exceptions = 0
+            row['differing_docs'] = sum(
+                parser.process(tokens) != legacy.process(tokens) for tokens in documents)
+            row['exceptions_per_doc'] = round(legacy.exceptions / len(documents), 1)
+            row['speedup'] = round(
+                row['word2number']['mean_us'] / lexicon['mean_us'], 1) if lexicon['mean_us'] else None
+
+        results[category] = row
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size', type=int, default=200, help='documents per category')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-speedup', type=float,
+                        help='exit 1 if any category is slower than this multiple of word2number')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/number_words.json)')
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat)
+
+    rows = []
+    for category, row in results.items():
+        legacy = row.get('word2number', {})
+        rows.append((category, row['lexicon']['ops_per_sec'], row['lexicon']['mean_us'],
+                     legacy.get('ops_per_sec', '-'), legacy.get('mean_us', '-'),
+                     row.get('speedup', '-'), row.get('exceptions_per_doc', '-'),
+                     row.get('differing_docs', '-')))
+    print_table(rows, ('category', 'lexicon ops/s', 'lexicon us', 'w2n ops/s', 'w2n us',
+                       'speedup', 'w2n exc/doc', 'differing docs'))
+    if w2n is None:
+        print('\nword2number is not installed; only the lexicon was measured')
+
+    path = write_results('number_words', {'size': args.size, 'repeat': args.repeat,
+                                          'results': results}, args.output)
+    print(f'\nWritten: {path}')
+
+    if args.min_speedup is not None and w2n is not None:
+        slow = [c for c, row in results.items() if row['speedup'] < args.min_speedup]
+        if slow:
+            print(f"\nBelow {args.min_speedup}x: {', '.join(slow)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
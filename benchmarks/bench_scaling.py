@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Input-size scaling benchmark.
+
+Runs ``parse_dates`` on documents from 100 B to 10 MB at a fixed hit density,
+collects per-stage timings with ``profile_stages()``, and fits the growth
+exponent k in time ~ size^k for every stage (least squares on log-log, using
+sizes at or above --fit-from, 100 KB by default).  A stage fails when its exponent exceeds the
+exponent of n log n over the same sizes by more than --tolerance.
+
+Exits with status 1 if any stage fails, so it can gate CI.
+
+Usage:
+    python -m benchmarks.bench_scaling
+    python -m benchmarks.bench_scaling --max-bytes 1000000 --repeat 3
+"""
+
+import argparse
+import math
+import sys
+
+from fast_parse_time import parse_dates, profile_stages
+
+from benchmarks.corpus import generate_sized_document
+from benchmarks.harness import print_table, write_results
+
+
+SIZES = [
+    100, 300,
+    1_000, 3_000,
+    10_000, 30_000,
+    100_000, 300_000,
+    1_000_000, 3_000_000,
+    10_000_000,
+]
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Least-squares slope of log(time) against log(size)."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if t > 0]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx if sxx else 0.0
+
+
+def measure(sizes: list[int], repeat: int) -> dict[int, dict[str, int]]:
+    """Return {size: {stage: best total_ns over `repeat` runs}}."""
+    timings = {}
+    for size in sizes:
+        text = generate_sized_document(size)
+        best = {}
+        for _ in range(repeat):
+            with profile_stages() as prof:
+                parse_dates(text)
+            for stage_name, d in prof.to_dict().items():
+                best[stage_name] = min(best.get(stage_name, d['total_ns']), d['total_ns'])
+        timings[size] = best
+        print(f"  {size:>10,} B  parse_dates {best['parse_dates'] / 1e6:>10.2f} ms", file=sys.stderr)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--max-bytes', type=int, default=10_000_000)
+    parser.add_argument('--fit-from', type=int, default=100_000,
+                        help='smallest size used for the fit (small inputs are overhead-dominated '
+                             'and do not yet contain every fragment shape)')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='allowed exponent above n log n')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/scaling.json)')
+    args = parser.parse_args()
+
+    sizes = [n for n in SIZES if n <= args.max_bytes]
+    timings = measure(sizes, args.repeat)
+
+    fit_sizes = [n for n in sizes if n >= args.fit_from]
+    if len(fit_sizes) < 2:
+        parser.error('need at least two sizes between --fit-from and --max-bytes')
+    limit = fit_exponent(fit_sizes, [n * math.log(n) for n in fit_sizes]) + args.tolerance
+
+    stages = sorted({name for per_size in timings.values() for name in per_size})
+    results, rows, failed = {}, [], []
+    for stage_name in stages:
+        times = [timings[n].get(stage_name, 0) for n in fit_sizes]
+        exponent = fit_exponent(fit_sizes, times)
+        ok = exponent <= limit
+        if not ok:
+            failed.append(stage_name)
+        results[stage_name] = {
+            'exponent': round(exponent, 3),
+            'ok': ok,
+            'total_ns': {str(n): timings[n].get(stage_name, 0) for n in sizes},
+        }
+        rows.append((stage_name, f'{exponent:.3f}', 'ok' if ok else 'FAIL',
+                     f'{timings[sizes[-1]].get(stage_name, 0) / 1e6:.2f}'))
+
+    print_table(rows, ('stage', 'exponent', 'status', f'ms @ {sizes[-1]:,} B'))
+    print(f'\nLimit: exponent <= {limit:.3f} (n log n + {args.tolerance})')
+
+    path = write_results('scaling', {
+        'sizes': sizes, 'fit_sizes': fit_sizes, 'limit': round(limit, 3), 'stages': results,
+    }, args.output)
+    print(f'Written: {path}')
+
+    if failed:
+        print(f"\nSuper-linear stages: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
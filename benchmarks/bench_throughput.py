@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Corpus throughput benchmark.
+
+Reports ops/sec and p50/p99 latency for every public API function and every
+``ExplicitTimeExtractor.extract_*`` method, per corpus category.  The ``empty``
+and ``negative`` categories expose fixed per-call overhead.
+
+Usage:
+    python -m benchmarks.bench_throughput
+    python -m benchmarks.bench_throughput --size 500 --repeat 3 --output before.json
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+
+import fast_parse_time
+from fast_parse_time import ExplicitTimeExtractor
+from fast_parse_time.explicit.svc import normalize_text
+
+from benchmarks.corpus import CATEGORIES, generate_corpus
+from benchmarks.harness import print_table, summarize, time_calls, write_results
+
+
+# Public API functions that take a single text argument
+API_FUNCTIONS = [
+    'parse_dates',
+    'parse_time_references',
+    'extract_explicit_dates',
+    'extract_relative_times',
+    'parse_dates_with_type',
+    'resolve_to_datetime',
+    'resolve_to_timedelta',
+    'extract_ambiguous_dates',
+    'extract_full_dates_only',
+    'has_temporal_info',
+    'extract_past_references',
+    'extract_future_references',
+    'parse_and_resolve',
+    'get_date_range',
+    'extract_numeric_dates',
+]
+
+EXTRACTOR_METHODS = sorted(
+    name for name in dir(ExplicitTimeExtractor)
+    if name.startswith('extract_') and callable(getattr(ExplicitTimeExtractor, name))
+)
+
+
+def build_targets() -> dict:
+    """Return {target name: callable(text)} for every benchmarked entry point."""
+    targets = {
+        f'api.{name}': getattr(fast_parse_time, name)
+        for name in API_FUNCTIONS
+    }
+
+    extractor = ExplicitTimeExtractor()
+    for name in EXTRACTOR_METHODS:
+        method = getattr(extractor, name)
+        # extractors are called on normalized text, as extract_explicit_dates does
+        targets[f'extractor.{name}'] = (
+            lambda text, method=method: method(input_text=normalize_text(text)))
+
+    return targets
+
+
+def run(size: int, repeat: int, targets: list[str] = None) -> dict:
+    corpus = generate_corpus(size)
+    all_targets = build_targets()
+    names = targets or list(all_targets)
+
+    results = {}
+    for name in names:
+        fn = all_targets[name]
+        per_category, all_latencies = {}, []
+        for category in CATEGORIES:
+            latencies = time_calls(fn, corpus[category], repeat=repeat)
+            per_category[category] = summarize(latencies)
+            all_latencies.extend(latencies)
+        results[name] = {'all': summarize(all_latencies), 'categories': per_category}
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size', type=int, default=200, help='documents per category')
+    parser.add_argument('--repeat', type=int, default=1, help='passes over the corpus')
+    parser.add_argument('--target', action='append', help='only run this target (repeatable)')
+    parser.add_argument('--output', help='JSON output path (default: benchmarks/results/throughput.json)')
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat, args.target)
+
+    rows = []
+    for name, d in results.items():
+        a = d['all']
+        rows.append((name, a['ops_per_sec'], a['p50_us'], a['p99_us'],
+                     d['categories']['empty']['p50_us'], d['categories']['negative']['p50_us']))
+    print_table(rows, ('target', 'ops/sec', 'p50 us', 'p99 us', 'empty p50', 'negative p50'))
+
+    path = write_results('throughput', {
+        'size': args.size, 'repeat': args.repeat, 'targets': results}, args.output)
+    print(f'\nWritten: {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Compare two benchmark result files written by the benchmark scripts.
+
+Prints the relative change of every shared metric, e.g. throughput of each
+target before and after a change.
+
+Usage:
+    python -m benchmarks.compare before.json after.json
+    python -m benchmarks.compare before.json after.json --metric p99_us --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.harness import print_table
+
+
+def flatten(d: dict, prefix: str = '') -> dict:
+    """Flatten nested result dicts to {'a.b.c': number}."""
+    flat = {}
+    for key, value in d.items():
+        path = f'{prefix}.{key}' if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files')
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--metric', action='append',
+                        help='leaf metric name to compare (default: ops_per_sec, p50_us, p99_us)')
+    parser.add_argument('--threshold', type=float, default=0.0,
+                        help='only show changes larger than this many percent')
+    args = parser.parse_args()
+
+    with open(args.before, encoding='utf-8') as f:
+        before = json.load(f)
+    with open(args.after, encoding='utf-8') as f:
+        after = json.load(f)
+
+    if before.get('benchmark') != after.get('benchmark'):
+        sys.exit(f"Different benchmarks: {before.get('benchmark')} vs {after.get('benchmark')}")
+
+    metrics = set(args.metric or ['ops_per_sec', 'p50_us', 'p99_us'])
+    flat_before, flat_after = flatten(before['results']), flatten(after['results'])
+
+    rows = []
+    for path in sorted(set(flat_before) & set(flat_after)):
+        if path.rsplit('.', 1)[-1] not in metrics:
+            continue
+        a, b = flat_before[path], flat_after[path]
+        change = ((b - a) / a * 100) if a else 0.0
+        if abs(change) >= args.threshold:
+            rows.append((path, a, b, f'{change:+.1f}%'))
+
+    print(f"before: {before['environment']['revision']}  after: {after['environment']['revision']}\n")
+    print_table(rows, ('metric', 'before', 'after', 'change'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Deterministic synthetic corpus for benchmarks.
+
+Every category is generated from a seeded ``random.Random`` so two revisions
+benchmarked on different machines (or days) see byte-identical input.
+
+Categories:
+    empty       - the empty string (fixed per-call overhead)
+    negative    - prose with no date or time information
+    numeric     - delimited numeric dates (04/08/2024, 3/24, 2023-06-05)
+    written     - written month dates (March 15, 2024 / 15 Mar 2024)
+    iso8601     - ISO 8601 timestamps (2017-02-03T09:04:08Z)
+    prose_year  - preposition + year and year ranges (in 2004, 2014-2015)
+    ordinal     - ordinal day references (the 3rd of March, Dec 12th)
+    relative    - relative time phrases (5 days ago, next week, 2h)
+"""
+
+import random
+
+
+SEED = 20240405
+
+CATEGORIES = [
+    'empty', 'negative', 'numeric', 'written',
+    'iso8601', 'prose_year', 'ordinal', 'relative',
+]
+
+MONTHS_FULL = [
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December',
+]
+MONTHS_ABBREV = [
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+]
+
+FILLER = [
+    'the', 'quarterly', 'report', 'was', 'reviewed', 'by', 'the', 'committee',
+    'and', 'several', 'items', 'were', 'flagged', 'for', 'follow', 'up', 'with',
+    'engineering', 'regarding', 'latency', 'in', 'the', 'billing', 'service',
+    'customer', 'asked', 'about', 'invoice', 'number', 'status', 'please',
+    'confirm', 'receipt', 'of', 'this', 'message', 'team', 'meeting', 'notes',
+]
+
+PREPOSITIONS = ['in', 'since', 'by', 'until', 'before', 'after', 'during', 'from', 'as of']
+
+RELATIVE_PHRASES = [
+    '{n} days ago', '{n} weeks ago', '{n} months ago', '{n} years ago',
+    '{n} hours ago', '{n} minutes ago', 'in {n} days', '{n} days from now',
+    'last week', 'next month', 'a couple of days ago', 'half an hour ago',
+    'last friday', 'next monday', '{n}d', '{n}h ago', '1 year and {n} months ago',
+    'several weeks ago', 'the day before yesterday', 'three days ago',
+]
+
+
+def _ordinal(day: int) -> str:
+    if 11 <= day % 100 <= 13:
+        return f'{day}th'
+    return f'{day}' + {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+
+
+def _filler(rng: random.Random, low: int = 4, high: int = 14) -> str:
+    return ' '.join(rng.choice(FILLER) for _ in range(rng.randint(low, high)))
+
+
+def _embed(rng: random.Random, fragment: str) -> str:
+    return f'{_filler(rng)} {fragment} {_filler(rng, 0, 8)}'.strip()
+
+
+def _numeric(rng: random.Random) -> str:
+    month, day, year = rng.randint(1, 12), rng.randint(1, 28), rng.randint(1990, 2030)
+    return rng.choice([
+        f'{month:02d}/{day:02d}/{year}',
+        f'{month}/{day}',
+        f'{year}-{month:02d}-{day:02d}',
+        f'{day:02d}.{month:02d}.{year}',
+        f'{month}/{year}',
+    ])
+
+
+def _written(rng: random.Random) -> str:
+    month, day, year = rng.choice(MONTHS_FULL), rng.randint(1, 28), rng.randint(1990, 2030)
+    abbrev = rng.choice(MONTHS_ABBREV)
+    return rng.choice([
+        f'{month} {day}, {year}',
+        f'{day} {month} {year}',
+        f'{abbrev} {day}, {year}',
+        f'{abbrev}-{year % 100:02d}',
+        f'{month} {year}',
+    ])
+
+
+def _iso8601(rng: random.Random) -> str:
+    year, month, day = rng.randint(1990, 2030), rng.randint(1, 12), rng.randint(1, 28)
+    hh, mm, ss = rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59)
+    tz = rng.choice(['Z', '+00:00', '-05:00', '.123Z'])
+    if tz == '.123Z':
+        return f'{year}-{month:02d}-{day:02d}T{hh:02d}:{mm:02d}:{ss:02d}.123Z'
+    return f'{year}-{month:02d}-{day:02d}T{hh:02d}:{mm:02d}:{ss:02d}{tz}'
+
+
+def _prose_year(rng: random.Random) -> str:
+    y1 = rng.randint(1950, 2025)
+    y2 = y1 + rng.randint(1, 9)
+    return rng.choice([
+        f'{rng.choice(PREPOSITIONS)} {y1}',
+        f'{y1}-{y2}',
+        f'from {y1} to {y2}',
+        f'between {y1} and {y2}',
+        f'{y1}-{y2 % 100:02d}' if y2 % 100 > 12 else f'{y1} to {y2}',
+    ])
+
+
+def _ordinal_date(rng: random.Random) -> str:
+    month, day = rng.choice(MONTHS_FULL + MONTHS_ABBREV), _ordinal(rng.randint(1, 28))
+    return rng.choice([
+        f'the {day} of {month}',
+        f'{day} day of {month}, {rng.randint(1990, 2030)}',
+        f'{month} {day}',
+        f'{day} {month}',
+    ])
+
+
+def _relative(rng: random.Random, template: str = None) -> str:
+    return (template or rng.choice(RELATIVE_PHRASES)).format(n=rng.randint(2, 30))
+
+
+_GENERATORS = {
+    'numeric': _numeric,
+    'written': _written,
+    'iso8601': _iso8601,
+    'prose_year': _prose_year,
+    'ordinal': _ordinal_date,
+    'relative': _relative,
+}
+
+
+def generate_category(category: str, size: int, seed: int = SEED) -> list[str]:
+    """Generate `size` documents for one category (deterministic for a given seed)."""
+    rng = random.Random(f'{seed}:{category}')
+
+    if category == 'empty':
+        return [''] * size
+    if category == 'negative':
+        return [_filler(rng, 6, 24) for _ in range(size)]
+
+    generator = _GENERATORS[category]
+    return [_embed(rng, generator(rng)) for _ in range(size)]
+
+
+def generate_corpus(size: int = 200, seed: int = SEED) -> dict[str, list[str]]:
+    """Generate `size` documents for every category."""
+    return {
+        category: generate_category(category, size, seed)
+        for category in CATEGORIES
+    }
+
+
+def iter_fragments(seed: int = SEED):
+    """Yield an endless, deterministic stream of fragments cycling through every category.
+
+    Relative phrases also cycle through every template in turn, so rare shapes
+    (e.g. compound '1 year and 2 months ago') occur at a fixed rate rather than
+    at whatever rate the random draws happen to produce.
+    """
+    rng = random.Random(f'{seed}:document')
+    i = relative = 0
+    while True:
+        category = CATEGORIES[1 + i % (len(CATEGORIES) - 1)]
+        if category == 'negative':
+            yield _filler(rng)
+        elif category == 'relative':
+            template = RELATIVE_PHRASES[relative % len(RELATIVE_PHRASES)]
+            yield _embed(rng, _relative(rng, template))
+            relative += 1
+        else:
+            yield _embed(rng, _GENERATORS[category](rng))
+        i += 1
+
+
+def generate_sized_document(n_bytes: int, seed: int = SEED) -> str:
+    """Generate a document of about `n_bytes` characters at a fixed hit density.
+
+    The same fragment stream is used for every size, so a larger document is an
+    extension of a smaller one and the number of date hits grows linearly.
+    """
+    parts, total = [], 0
+    for fragment in iter_fragments(seed):
+        if total >= n_bytes:
+            break
+        parts.append(fragment)
+        total += len(fragment) + 2
+    return '. '.join(parts)[:max(n_bytes, 1)]
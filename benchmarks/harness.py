@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Shared timing, reporting and result-file helpers for the benchmark scripts.
+"""
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import perf_counter_ns
+from typing import Callable, Iterable
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies_ns: list[int]) -> dict:
+    """Reduce per-call latencies to ops/sec and latency percentiles (microseconds)."""
+    latencies_ns = sorted(latencies_ns)
+    total_ns = sum(latencies_ns)
+    n = len(latencies_ns)
+    return {
+        'calls': n,
+        'ops_per_sec': round(n / (total_ns / 1e9), 1) if total_ns else 0.0,
+        'mean_us': round(total_ns / n / 1e3, 2) if n else 0.0,
+        'p50_us': round(percentile(latencies_ns, 50) / 1e3, 2),
+        'p99_us': round(percentile(latencies_ns, 99) / 1e3, 2),
+        'max_us': round(latencies_ns[-1] / 1e3, 2) if n else 0.0,
+    }
+
+
+def time_calls(fn: Callable[[str], object],
+               inputs: Iterable[str],
+               repeat: int = 1,
+               warmup: int = 1) -> list[int]:
+    """Time fn(text) once per input per repeat; returns per-call latencies in ns."""
+    inputs = list(inputs)
+    for text in inputs[:warmup]:
+        fn(text)
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for text in inputs:
+                start = perf_counter_ns()
+                fn(text)
+                latencies.append(perf_counter_ns() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return latencies
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(RESULTS_DIR)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def environment() -> dict:
+    """Metadata recorded alongside every result file."""
+    return {
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def write_results(name: str, results: dict, output: str = None) -> str:
+    """Write {'environment': ..., 'results': ...} as JSON; returns the path written."""
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'{name}.json')
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'benchmark': name, 'environment': environment(), 'results': results},
+                  f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    return output
+
+
+def print_table(rows: list[tuple], headers: tuple) -> None:
+    widths = [max(len(str(x)) for x in column) for column in zip(headers, *rows)]
+    line = '  '.join(f'{{:<{w}}}' if i == 0 else f'{{:>{w}}}' for i, w in enumerate(widths))
+    print(line.format(*headers))
+    print(line.format(*['-' * w for w in widths]))
+    for row in rows:
+        print(line.format(*row))
@@ -21,10 +21,13 @@ from fast_parse_time.api import (
     ExplicitDate,
     ParseResult,
     DateType,
+    ParserConfig,
 
     # Simple high-level API (recommended for most users)
     parse_dates,
     parse_time_references,
+    parse_dates_batch,
+    open_result_cache,
 
     # Specific API functions
     extract_explicit_dates,
@@ -45,8 +48,31 @@ from fast_parse_time.api import (
     get_date_range,
 )
 
-# Backward compatibility - keep old function name
-from fast_parse_time.explicit.bp import ExplicitTimeExtractor
+# Optional instrumentation (off by default)
+from fast_parse_time.core import (
+    register_event_sink,
+    clear_event_sink,
+    profile_stages,
+    StageProfile,
+    enable_metrics,
+    disable_metrics,
+    reset_metrics,
+    metrics_snapshot,
+    render_openmetrics,
+    record_slow_inputs,
+    stop_recording_slow_inputs,
+    SlowInputRecorder,
+    DedupeTable,
+    PersistentCache,
+)
+
+# ExplicitTimeExtractor: backward compatibility; the rest: custom explicit extractors
+from fast_parse_time.explicit.bp import (
+    ExplicitTimeExtractor,
+    ExplicitExtractor,
+    register_extractor,
+    unregister_extractor,
+)
 
 
 def extract_numeric_dates(input_text: str):
@@ -65,10 +91,15 @@ __all__ = [
     'ExplicitDate',
     'ParseResult',
     'DateType',
+    'ParserConfig',
 
     # Simple high-level API
     'parse_dates',
     'parse_time_references',
+    'parse_dates_batch',
+    'DedupeTable',
+    'open_result_cache',
+    'PersistentCache',
 
     # Specific API functions
     'extract_explicit_dates',
@@ -88,6 +119,25 @@ __all__ = [
     'parse_and_resolve',
     'get_date_range',
 
+    # Instrumentation
+    'register_event_sink',
+    'clear_event_sink',
+    'profile_stages',
+    'StageProfile',
+    'enable_metrics',
+    'disable_metrics',
+    'reset_metrics',
+    'metrics_snapshot',
+    'render_openmetrics',
+    'record_slow_inputs',
+    'stop_recording_slow_inputs',
+    'SlowInputRecorder',
+
+    # Custom explicit extractors
+    'ExplicitExtractor',
+    'register_extractor',
+    'unregister_extractor',
+
     # Backward compatibility
     'extract_numeric_dates',
     'ExplicitTimeExtractor',
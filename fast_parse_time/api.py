@@ -13,14 +13,31 @@ Design principles:
 - Type hints for IDE support
 """
 
-from typing import Dict, List, Optional
+import json
+from hashlib import blake2b
+from importlib.metadata import PackageNotFoundError, version
+from itertools import islice
+from sys import getsizeof
+from time import perf_counter, perf_counter_ns
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-
-from fast_parse_time.explicit.dto import DateType
-from fast_parse_time.explicit.bp import ExplicitTimeExtractor
+from dataclasses import dataclass, field
+
+from fast_parse_time.core import DedupeTable, PersistentCache, StageProfile, profile_stages, stage
+from fast_parse_time.core.metrics import METRICS
+from fast_parse_time.core.slow_inputs import get_slow_input_recorder
+from fast_parse_time.explicit.dto import DateType, ParserConfig, default_config
+from fast_parse_time.explicit.bp import (
+    EXPLICIT_EXTRACTORS,
+    ExplicitExtractor,
+    ExplicitTimeExtractor,
+    LogTemplate,
+    register_extractor,
+    unregister_extractor,
+)
 from fast_parse_time.explicit.svc import normalize_text
 from fast_parse_time.implicit.svc import AnalyzeTimeReferences, ResolveTimeReferences
+from fast_parse_time.implicit.dto import kb_fingerprint
 from fast_parse_time.implicit.dto.index_by_slot_kb import Slot
 
 
@@ -68,6 +85,11 @@ class ParseResult:
     """Combined result containing all temporal information found"""
     explicit_dates: List[ExplicitDate]
     relative_times: List[RelativeTime]
+    # Per-stage timings, populated only by parse_dates(text, profile=True)
+    profile: Optional[StageProfile] = field(default=None, repr=False, compare=False)
+    # True when parse_dates stopped early (deadline_ms) or cut the input (max_input_chars);
+    # the dates found so far are still returned
+    truncated: bool = False
 
     @property
     def has_dates(self) -> bool:
@@ -79,7 +101,13 @@ class ParseResult:
 # Simple High-Level API (Most Common Use Cases)
 # ============================================================================
 
-def parse_dates(text: str) -> ParseResult:
+def parse_dates(text: str,
+                profile: bool = False,
+                deadline_ms: Optional[float] = None,
+                max_input_chars: Optional[int] = None,
+                anchor_windows: bool = False,
+                config: Optional[ParserConfig] = None,
+                reference: Optional[datetime] = None) -> ParseResult:
     """
     Extract all temporal information from text (both explicit and relative).
 
@@ -88,6 +116,31 @@ def parse_dates(text: str) -> ParseResult:
 
     Args:
         text: Input text to parse
+        profile: If True, attach a per-stage timing breakdown as result.profile
+            (use profile_stages() to aggregate across a batch instead)
+        deadline_ms: Optional time budget.  It is checked between extraction
+            stages; once exceeded, the remaining stages are skipped and the
+            dates found so far are returned with result.truncated set.
+            A single stage is never interrupted, so pair this with
+            max_input_chars for a hard bound on untrusted input.
+        max_input_chars: Optional input length limit.  Longer text is cut at
+            the last whitespace before the limit (so no token is split) and
+            result.truncated is set.
+        anchor_windows: If True, first find the tokens a date or time reference
+            cannot do without (digits, month names next to them, keyterms such
+            as 'ago' or 'next', number words) and run the extractors only on
+            the windows around them.  The result is the same; on long
+            documents with few dates it is found much faster.
+        config: Optional ParserConfig for the explicit extractors (year
+            window, enabled extractors, month names, delimiters, day-first
+            policy).  Defaults to one whose year window follows the calendar.
+        reference: Optional date that weekday references ('next friday',
+            'last monday') are counted from.  Defaults to today; pass it to
+            make the result independent of when the call is made.
+
+    Raises:
+        ValueError: a deadline_ms that is not positive, or a negative
+            max_input_chars
 
     Returns:
         ParseResult containing both explicit dates and relative time references
@@ -99,8 +152,89 @@ def parse_dates(text: str) -> ParseResult:
         >>> result.relative_times
         [RelativeTime(cardinality=5, frame='day', tense='past')]
     """
-    explicit = extract_explicit_dates(text)
-    relative = extract_relative_times(text)
+    if deadline_ms is not None and not deadline_ms > 0:
+        raise ValueError(f'Deadline must be positive: {deadline_ms}')
+    if max_input_chars is not None and max_input_chars < 0:
+        raise ValueError(f'Max Input Chars must not be negative: {max_input_chars}')
+
+    recorder = get_slow_input_recorder()
+    is_timed = METRICS.enabled or recorder is not None
+
+    if is_timed:
+        start = perf_counter_ns()
+
+    deadline = _Deadline(deadline_ms) if deadline_ms is not None else None
+
+    is_cut = False
+    if max_input_chars is not None and isinstance(text, str):
+        text, is_cut = _truncate_text(text, max_input_chars)
+
+    if profile or recorder is not None:
+        with profile_stages() as stage_profile:
+            result = _parse_dates(text, deadline, anchor_windows, config, reference)
+        if profile:
+            result.profile = stage_profile
+    else:
+        result = _parse_dates(text, deadline, anchor_windows, config, reference)
+
+    if is_cut:
+        result.truncated = True
+        if METRICS.enabled:
+            METRICS.inc('fast_parse_time_truncated', ('max_input_chars',))
+    if deadline is not None and deadline.is_expired:
+        result.truncated = True
+        if METRICS.enabled:
+            METRICS.inc('fast_parse_time_truncated', ('deadline',))
+
+    if is_timed:
+        elapsed_ns = perf_counter_ns() - start
+        if METRICS.enabled:
+            METRICS.observe('fast_parse_time_latency_seconds', ('parse_dates',), elapsed_ns / 1e9)
+        if recorder is not None and isinstance(text, str):
+            recorder.offer(text, elapsed_ns, stage_profile)
+
+    return result
+
+
+class _Deadline(object):
+    """ Wall-clock budget for one call, polled between extraction stages """
+
+    __slots__ = ('expires_ns', 'is_expired')
+
+    def __init__(self, deadline_ms: float):
+        self.expires_ns = perf_counter_ns() + int(deadline_ms * 1_000_000)
+        self.is_expired = False
+
+    def expired(self) -> bool:
+        if not self.is_expired and perf_counter_ns() >= self.expires_ns:
+            self.is_expired = True
+        return self.is_expired
+
+
+def _truncate_text(text: str, max_chars: int) -> tuple:
+    """Cut text to at most max_chars without splitting a token; returns (text, was_cut)."""
+    if len(text) <= max_chars:
+        return text, False
+
+    head = text[:max_chars]
+    if not text[max_chars].isspace() and not head[-1:].isspace():
+        # drop the partial token at the cut ('04/08/2024' must not become '04/08/20')
+        parts = head.rsplit(None, 1)
+        head = parts[0] if len(parts) == 2 else ''
+    return head, True
+
+
+def _parse_dates(text: str,
+                 deadline: Optional[_Deadline] = None,
+                 anchor_windows: bool = False,
+                 config: Optional[ParserConfig] = None,
+                 reference: Optional[datetime] = None) -> ParseResult:
+    with stage('parse_dates'):
+        explicit = _explicit_dates(text, deadline, anchor_windows, config)
+        if deadline is not None and deadline.expired():
+            relative = []
+        else:
+            relative = extract_relative_times(text, anchor_windows, reference)
 
     explicit_list = [
         ExplicitDate(text=date_str, date_type=date_type)
@@ -113,7 +247,255 @@ def parse_dates(text: str) -> ParseResult:
     )
 
 
-def parse_time_references(text: str) -> List[RelativeTime]:
+def parse_dates_batch(texts: Iterable[str],
+                      dedupe: bool = True,
+                      table: Optional[DedupeTable] = None,
+                      cache: Optional[PersistentCache] = None,
+                      log_templates: bool = False,
+                      templates: Optional[DedupeTable] = None,
+                      anchor_windows: bool = False,
+                      config: Optional[ParserConfig] = None,
+                      reference: Optional[datetime] = None) -> List[ParseResult]:
+    """
+    Parse many texts, each distinct text only once.
+
+    With dedupe, texts that are equal once whitespace is normalized (runs of
+    whitespace collapsed, ends stripped) are parsed once and share one
+    ParseResult object: treat the results as read-only.  Explicit date spans
+    are reported from the normalized text ('Jun 20, 2011' for 'Jun\\n20,\\n2011').
+
+    Args:
+        texts: Input texts
+        dedupe: If False, parse every text as parse_dates would
+        table: Optional DedupeTable holding the unique results.  Pass one to
+            bound its memory (max_bytes), to read its size and hit counts
+            (table.stats()) or to share results across batches.  A new table
+            with a 64 MiB budget is used by default; once a table is full it
+            evicts its least recently used entries.
+        cache: Optional persistent cache (see open_result_cache).  Results
+            it holds are not parsed again; new results are written to it.
+            Requires dedupe.
+        log_templates: If True, texts that differ only in their digits (lines
+            cut from one log template: 'job 1842 done in 35 ms') are parsed
+            once per template.  The first text of a template records where
+            the extractors match; for the others only the matched numbers are
+            checked (day, month and year ranges).  The results are the same.
+            Templates whose texts have a month name, a relative-time word or
+            a custom extractor's trigger are parsed in full.  Requires dedupe.
+        templates: Optional DedupeTable holding the learned templates (see
+            table); a new one is used by default.  Implies log_templates.
+        anchor_windows: See parse_dates
+        config: See parse_dates
+        reference: Date weekday references are counted from.  Defaults to
+            today, read once for the whole batch.
+
+    Raises:
+        ValueError: a cache or log templates without dedupe
+
+    Returns:
+        One ParseResult per text, in input order
+
+    Example:
+        >>> results = parse_dates_batch(["job failed 5 days ago"] * 3)
+        >>> results[0] is results[2]
+        True
+    """
+    # one clock read: duplicates must not straddle a change of date
+    if reference is None:
+        reference = datetime.now()
+
+    if templates is None and log_templates:
+        templates = DedupeTable()
+
+    if not dedupe:
+        if cache is not None:
+            raise ValueError('A Result Cache Requires dedupe=True')
+        if templates is not None:
+            raise ValueError('Log Templates Require dedupe=True')
+        return [parse_dates(text, anchor_windows=anchor_windows, config=config,
+                            reference=reference) for text in texts]
+
+    if table is None:
+        table = DedupeTable()
+    if config is None:
+        config = default_config()
+    # the parts of a result that do not come from the text
+    context = (config, reference.weekday())
+
+    def lookup(text, parsed: list = None) -> ParseResult:
+        if not isinstance(text, str):
+            return parse_dates(text, anchor_windows=anchor_windows, config=config,
+                               reference=reference)
+
+        normalized = ' '.join(text.split())
+        key = (normalized, context)
+        result = table.get(key)
+        if result is None:
+            if templates is not None:
+                result = _template_result(normalized, templates, config)
+            if result is None:
+                result = parse_dates(normalized, anchor_windows=anchor_windows, config=config,
+                                     reference=reference)
+            table.put(key, result, _result_bytes(normalized, result))
+            if parsed is not None:
+                parsed.append((normalized, result))
+            if METRICS.enabled:
+                METRICS.inc('fast_parse_time_cache_requests', ('batch_dedupe', 'miss'))
+        elif METRICS.enabled:
+            METRICS.inc('fast_parse_time_cache_requests', ('batch_dedupe', 'hit'))
+        return result
+
+    if cache is None:
+        return [lookup(text) for text in texts]
+
+    results = []
+    context_digest = _cache_context(cache, config, reference)
+    texts = iter(texts)
+    while chunk := list(islice(texts, _CACHE_CHUNK)):
+        # read the stored results of the distinct texts not in the table in bulk
+        digests = {}
+        for text in chunk:
+            if isinstance(text, str):
+                normalized = ' '.join(text.split())
+                if normalized not in digests and (normalized, context) not in table:
+                    digest = context_digest.copy()
+                    digest.update(normalized.encode('utf-8', 'surrogatepass'))
+                    digests[normalized] = digest.digest()
+
+        stored = cache.get_many(digests.values()) if digests else {}
+        for normalized, digest in digests.items():
+            value = stored.get(digest)
+            if value is not None:
+                result = _deserialize_result(value)
+                table.put((normalized, context), result, _result_bytes(normalized, result))
+
+        if METRICS.enabled and digests:
+            METRICS.inc('fast_parse_time_cache_requests', ('result_cache', 'hit'), len(stored))
+            METRICS.inc('fast_parse_time_cache_requests', ('result_cache', 'miss'),
+                        len(digests) - len(stored))
+
+        parsed = []
+        results.extend(lookup(text, parsed) for text in chunk)
+        cache.put_many({digests[normalized]: _serialize_result(result)
+                        for normalized, result in parsed if normalized in digests})
+
+    return results
+
+
+# texts per bulk read and write of a result cache
+_CACHE_CHUNK = 1000
+
+# stored in a template table for the signatures whose texts are parsed in full
+_NO_TEMPLATE = False
+
+# estimated bytes of a learned template besides its signature
+_TEMPLATE_BYTES = 1024
+
+
+def _template_result(text: str,
+                     templates: DedupeTable,
+                     config: ParserConfig) -> Optional[ParseResult]:
+    """The result of a normalized text replayed from its log template, or None to parse it."""
+    signature = LogTemplate.signature(text)
+    key = (signature, config)
+    template = templates.get(key)
+    is_learned = template is not None and (
+        template is _NO_TEMPLATE or template.extractors is EXPLICIT_EXTRACTORS.extractors)
+
+    if not is_learned:
+        # a relative time reference can depend on more than the matched numbers
+        template = _NO_TEMPLATE
+        if not AnalyzeTimeReferences.has_word_anchor(text):
+            template = LogTemplate.learn(text, config) or _NO_TEMPLATE
+        templates.put(key, template, getsizeof(signature) + _TEMPLATE_BYTES)
+
+    if METRICS.enabled:
+        METRICS.inc('fast_parse_time_cache_requests',
+                    ('log_templates', 'hit' if is_learned and template is not _NO_TEMPLATE else 'miss'))
+    if template is _NO_TEMPLATE:
+        return None
+
+    return ParseResult(
+        explicit_dates=[ExplicitDate(text=date_str, date_type=date_type)
+                        for date_str, date_type in template.extract(text).items()],
+        relative_times=[])
+
+
+def open_result_cache(path: str, max_bytes: int = 256 * 1024 * 1024) -> PersistentCache:
+    """
+    Open (or create) a persistent cache of parse results for parse_dates_batch.
+
+    Entries are keyed by a hash of the normalized text, the library version,
+    the relative-time KB content, the ParserConfig, the registered explicit
+    extractors and the reference weekday.  Opening the cache with another
+    library version or KB empties it, so an upgrade never returns stale
+    results.  The SQLite file uses WAL mode and can be shared by worker
+    processes.
+
+    Args:
+        path: The database file; created if missing
+        max_bytes: Budget of the stored results.  Once exceeded, the least
+            recently read results are evicted.
+
+    Returns:
+        PersistentCache: pass it as parse_dates_batch(..., cache=...)
+
+    Example:
+        >>> with open_result_cache("parse_cache.sqlite") as cache:
+        ...     results = parse_dates_batch(documents, cache=cache)
+    """
+    return PersistentCache(path, namespace=_cache_namespace(), max_bytes=max_bytes)
+
+
+def _cache_namespace() -> str:
+    """What every cached result depends on besides its own key: code and KB."""
+    try:
+        library_version = version('fast-parse-time')
+    except PackageNotFoundError:
+        library_version = 'unknown'
+    return f'{library_version}:{kb_fingerprint()}'
+
+
+def _cache_context(cache: PersistentCache, config: ParserConfig, reference: datetime):
+    """A hash of everything a batch's results depend on but the text, to be copied per text."""
+    context = json.dumps([
+        cache.namespace,
+        config.min_year, config.max_year, sorted(config.month_names), config.date_delims,
+        config.two_digit_years, config.day_first,
+        sorted(config.extractors) if config.extractors is not None else None,
+        sorted(extractor.name for extractor in EXPLICIT_EXTRACTORS.extractors),
+        reference.weekday(),
+    ])
+    return blake2b(context.encode('utf-8') + b'\0', digest_size=16)
+
+
+def _serialize_result(result: ParseResult) -> str:
+    return json.dumps([
+        [[d.text, d.date_type] for d in result.explicit_dates],
+        [[r.cardinality, r.frame, r.tense] for r in result.relative_times],
+    ], separators=(',', ':'))
+
+
+def _deserialize_result(value: str) -> ParseResult:
+    explicit_dates, relative_times = json.loads(value)
+    return ParseResult(
+        explicit_dates=[ExplicitDate(text, date_type) for text, date_type in explicit_dates],
+        relative_times=[RelativeTime(*relative) for relative in relative_times])
+
+
+def _result_bytes(text: str, result: ParseResult) -> int:
+    """Estimated bytes held by a dedupe table entry: the key text and the result."""
+    size = (getsizeof(text) + getsizeof(result) + getsizeof(result.__dict__)
+            + getsizeof(result.explicit_dates) + getsizeof(result.relative_times))
+    for explicit in result.explicit_dates:
+        size += getsizeof(explicit) + getsizeof(explicit.__dict__) + getsizeof(explicit.text)
+    for relative in result.relative_times:
+        size += getsizeof(relative) + getsizeof(relative.__dict__)
+    return size
+
+
+def parse_time_references(text: str,
+                          reference: Optional[datetime] = None) -> List[RelativeTime]:
     """
     Extract only relative time references (like '5 days ago', 'next week').
 
@@ -121,6 +503,7 @@ def parse_time_references(text: str) -> List[RelativeTime]:
 
     Args:
         text: Input text to parse
+        reference: Date weekday references are counted from (defaults to today)
 
     Returns:
         List of RelativeTime objects
@@ -130,14 +513,16 @@ def parse_time_references(text: str) -> List[RelativeTime]:
         [RelativeTime(cardinality=5, frame='day', tense='past'),
          RelativeTime(cardinality=1, frame='week', tense='past')]
     """
-    return extract_relative_times(text)
+    return extract_relative_times(text, reference=reference)
 
 
 # ============================================================================
 # Specific API Functions (For Precise Control)
 # ============================================================================
 
-def extract_explicit_dates(text: str) -> Dict[str, str]:
+def extract_explicit_dates(text: str,
+                           anchor_windows: bool = False,
+                           config: Optional[ParserConfig] = None) -> Dict[str, str]:
     """
     Extract explicit/numeric dates from text.
 
@@ -149,6 +534,9 @@ def extract_explicit_dates(text: str) -> Dict[str, str]:
 
     Args:
         text: Input text to parse
+        anchor_windows: If True, only match in the windows around digit tokens
+            (same result, faster on long documents; see parse_dates)
+        config: Optional ParserConfig (see parse_dates)
 
     Returns:
         Dictionary mapping date strings to their DateType classification
@@ -160,63 +548,46 @@ def extract_explicit_dates(text: str) -> Dict[str, str]:
         >>> extract_explicit_dates("Event on March 15, 2024")
         {'March 15, 2024': 'FULL_EXPLICIT_DATE'}
     """
+    return _explicit_dates(text, anchor_windows=anchor_windows, config=config)
+
+
+def _explicit_dates(text: str,
+                    deadline: Optional[_Deadline] = None,
+                    anchor_windows: bool = False,
+                    config: Optional[ParserConfig] = None) -> Dict[str, str]:
+    if not METRICS.enabled:
+        return _extract_explicit_dates(text, deadline, anchor_windows, config)
+
+    start = perf_counter()
+    result = _extract_explicit_dates(text, deadline, anchor_windows, config)
+    METRICS.inc('fast_parse_time_documents', ('explicit',))
+    _observe_latency('extract_explicit_dates', start)
+    return result
+
+
+def _extract_explicit_dates(text: str,
+                            deadline: Optional[_Deadline] = None,
+                            anchor_windows: bool = False,
+                            config: Optional[ParserConfig] = None) -> Dict[str, str]:
     if not isinstance(text, str):
         return {}
 
-    text = normalize_text(text)
-    extractor = ExplicitTimeExtractor()
-
-    # Try numeric dates first
-    result = extractor.extract_numeric_dates(input_text=text)
-    if result is None:
-        result = {}
-
-    # Also try written month formats
-    written_result = extractor.extract_written_dates(input_text=text)
-    if written_result:
-        result.update(written_result)
-
-    # Also try hyphen-delimited month-year formats (Oct-23, 2023-Oct, March-2023, etc.)
-    hyphen_result = extractor.extract_hyphen_month_year(input_text=text)
-    if hyphen_result:
-        result.update(hyphen_result)
-
-    # Also try prose year patterns (in 2004, since 2019, 2014-2015, from 2004 to 2008)
-    prose_result = extractor.extract_prose_year(input_text=text)
-    if prose_result:
-        result.update(prose_result)
-
-    # Also try ISO 8601 datetime strings (2017-02-03T09:04:08Z, +00:00 offset, etc.)
-    # Related GitHub Issue:
-    #     #23 - Gap: ISO 8601 datetime strings not extracted
-    #     https://github.com/craigtrim/fast-parse-time/issues/23
-    iso_result = extractor.extract_iso8601_dates(input_text=text)
-    if iso_result:
-        result.update(iso_result)
-
-    # Also try ordinal day patterns (12th day of December, the 3rd of March, Dec 12th, etc.)
-    # Related GitHub Issue:
-    #     #22 - Gap: ordinal day format not supported (12th day of December, 19th day of May)
-    #     https://github.com/craigtrim/fast-parse-time/issues/22
-    ordinal_result = extractor.extract_ordinal_dates(input_text=text)
-    if ordinal_result:
-        result.update(ordinal_result)
-
-    # Also try space-delimited MonthName + 2-digit-number patterns (Oct 23, March 15, etc.)
-    # Related GitHub Issue:
-    #     #38 - Gap: space-delimited MonthName+2-digit-number not classified
-    #     https://github.com/craigtrim/fast-parse-time/issues/38
-    space_month_result = extractor.extract_space_month_number(input_text=text)
-    if space_month_result:
-        # Only add keys not already classified by earlier (higher-priority) extractors
-        for key, val in space_month_result.items():
-            if key not in result:
-                result[key] = val
+    with stage('explicit.normalize_text'):
+        text = normalize_text(text)
+    if anchor_windows:
+        with stage('explicit.anchor_windows'):
+            text = ExplicitTimeExtractor.anchor_windows(text).text
 
-    return result
+    # Only the extractors whose trigger holds for this text run; with a deadline,
+    # each one after the first runs only if time remains and whatever has been
+    # found so far is returned.
+    return EXPLICIT_EXTRACTORS.run(
+        text, deadline.expired if deadline is not None else None, config)
 
 
-def extract_relative_times(text: str) -> List[RelativeTime]:
+def extract_relative_times(text: str,
+                           anchor_windows: bool = False,
+                           reference: Optional[datetime] = None) -> List[RelativeTime]:
     """
     Extract relative time references from text.
 
@@ -228,6 +599,12 @@ def extract_relative_times(text: str) -> List[RelativeTime]:
 
     Args:
         text: Input text to parse
+        anchor_windows: If True, only match in the windows around keyterms,
+            digits and number words (same result, faster on long documents;
+            see parse_dates)
+        reference: Date weekday references are counted from (defaults to
+            today).  'next friday' is RelativeTime(days to that Friday, 'day',
+            'future'); every other reference depends on the text alone.
 
     Returns:
         List of RelativeTime objects (empty list if none found)
@@ -236,8 +613,15 @@ def extract_relative_times(text: str) -> List[RelativeTime]:
         >>> extract_relative_times("Show records from 5 days ago")
         [RelativeTime(cardinality=5, frame='day', tense='past')]
     """
+    if METRICS.enabled:
+        start = perf_counter()
+
+    if anchor_windows and isinstance(text, str):
+        with stage('relative.anchor_windows'):
+            text = AnalyzeTimeReferences.anchor_windows(text).text
+
     analyzer = AnalyzeTimeReferences()
-    result = analyzer.process(text)
+    result = analyzer.process(text, reference)
 
     relative_times = []
     for item in result.get('result', []):
@@ -247,9 +631,19 @@ def extract_relative_times(text: str) -> List[RelativeTime]:
             tense=item.tense
         ))
 
+    if METRICS.enabled:
+        METRICS.inc('fast_parse_time_documents', ('relative',))
+        for item in relative_times:
+            METRICS.inc('fast_parse_time_relative_solutions', (item.frame, item.tense))
+        _observe_latency('extract_relative_times', start)
+
     return relative_times
 
 
+def _observe_latency(api_name: str, start: float) -> None:
+    METRICS.observe('fast_parse_time_latency_seconds', (api_name,), perf_counter() - start)
+
+
 def parse_dates_with_type(text: str, date_type: Optional[str] = None) -> Dict[str, str]:
     """
     Extract explicit dates, optionally filtering by type.
@@ -298,11 +692,15 @@ def resolve_to_datetime(
         >>> resolve_to_datetime("Show me data from 5 days ago")
         [datetime.datetime(2025, 11, 14, ...)]  # 5 days before now
     """
-    relative_times = extract_relative_times(text)
+    # one clock read: every reference in the text is resolved against the same instant
+    if reference is None:
+        reference = datetime.now()
+    relative_times = extract_relative_times(text, reference=reference)
     return [rt.to_datetime(reference) for rt in relative_times]
 
 
-def resolve_to_timedelta(text: str) -> List[timedelta]:
+def resolve_to_timedelta(text: str,
+                         reference: Optional[datetime] = None) -> List[timedelta]:
     """
     Extract relative time references and convert to timedelta objects.
 
@@ -310,6 +708,7 @@ def resolve_to_timedelta(text: str) -> List[timedelta]:
 
     Args:
         text: Input text to parse
+        reference: Date weekday references are counted from (defaults to today)
 
     Returns:
         List of timedelta objects
@@ -318,7 +717,7 @@ def resolve_to_timedelta(text: str) -> List[timedelta]:
         >>> resolve_to_timedelta("5 days ago")
         [timedelta(days=5)]
     """
-    relative_times = extract_relative_times(text)
+    relative_times = extract_relative_times(text, reference=reference)
     return [rt.to_timedelta() for rt in relative_times]
 
 
@@ -446,7 +845,9 @@ def parse_and_resolve(text: str, reference: Optional[datetime] = None) -> Dict[s
             'resolved': [datetime.datetime(2025, 11, 14, ...)]
         }
     """
-    result = parse_dates(text)
+    if reference is None:
+        reference = datetime.now()
+    result = parse_dates(text, reference=reference)
     resolved = [rt.to_datetime(reference) for rt in result.relative_times]
 
     return {
@@ -455,7 +856,8 @@ def parse_and_resolve(text: str, reference: Optional[datetime] = None) -> Dict[s
     }
 
 
-def get_date_range(text: str) -> Optional[tuple[datetime, datetime]]:
+def get_date_range(text: str,
+                   reference: Optional[datetime] = None) -> Optional[tuple[datetime, datetime]]:
     """
     Extract a date range from text containing two relative time references.
 
@@ -463,6 +865,7 @@ def get_date_range(text: str) -> Optional[tuple[datetime, datetime]]:
 
     Args:
         text: Input text to parse
+        reference: Reference point for calculation (defaults to now)
 
     Returns:
         Tuple of (start_date, end_date) if two references found, None otherwise
@@ -471,12 +874,14 @@ def get_date_range(text: str) -> Optional[tuple[datetime, datetime]]:
         >>> get_date_range("data from 7 days ago to 3 days ago")
         (datetime(...), datetime(...))  # 7 days ago to 3 days ago
     """
-    times = extract_relative_times(text)
+    if reference is None:
+        reference = datetime.now()
+    times = extract_relative_times(text, reference=reference)
 
     if len(times) != 2:
         return None
 
-    datetimes = [t.to_datetime() for t in times]
+    datetimes = [t.to_datetime(reference) for t in times]
     return (min(datetimes), max(datetimes))
 
 
@@ -490,10 +895,13 @@ __all__ = [
     'ExplicitDate',
     'ParseResult',
     'DateType',
+    'ParserConfig',
 
     # Simple high-level API
     'parse_dates',
     'parse_time_references',
+    'parse_dates_batch',
+    'open_result_cache',
 
     # Specific API functions
     'extract_explicit_dates',
@@ -512,4 +920,9 @@ __all__ = [
     # Recipe functions
     'parse_and_resolve',
     'get_date_range',
+
+    # Custom explicit extractors
+    'ExplicitExtractor',
+    'register_extractor',
+    'unregister_extractor',
 ]
@@ -6,13 +6,56 @@ import time
 import logging
 from logging import Logger
 
+from .anchor_windows import AnchorWindows
+from .dedupe_table import DedupeTable
+from .event_sink import (
+    register_event_sink,
+    clear_event_sink,
+    get_event_sink,
+    baseblock_event_sink,
+)
+from .lexicon import build_alternation
+from .persistent_cache import PersistentCache
+from .metrics import (
+    enable_metrics,
+    disable_metrics,
+    reset_metrics,
+    metrics_snapshot,
+    render_openmetrics,
+)
+from .profiler import (
+    StageProfile,
+    active_profile,
+    profile_stages,
+    stage,
+)
+from .slow_inputs import (
+    SlowInputRecorder,
+    record_slow_inputs,
+    stop_recording_slow_inputs,
+    get_slow_input_recorder,
+)
+
+
+# Library logging convention: never touch the root logger.
+# Handlers and levels belong to the host application; the package logger only
+# carries a NullHandler so unconfigured applications stay silent.
+logging.getLogger('fast_parse_time').addHandler(logging.NullHandler())
+
 
 def configure_logger(name: str) -> Logger:
-    root_logger = logging.getLogger()
-    if len(root_logger.handlers) > 0:
-        root_logger.setLevel(logging.INFO)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    """ Return a library-scoped Logger
+
+    Historically this configured the root logger at INFO (or called basicConfig),
+    which switched on INFO logging for every library in the host process.
+    It now only returns the named logger and leaves configuration to the caller.
+
+    Args:
+        name (str): the module name (typically __name__)
+
+    Returns:
+        Logger: a logger within the 'fast_parse_time' hierarchy
+    """
     return logging.getLogger(name)
 
 
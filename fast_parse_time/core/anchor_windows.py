@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Reduce a Text to the Windows Around its Anchor Tokens """
+
+
+import re
+from bisect import bisect_right
+
+
+_TOKEN = re.compile(r'\S+')
+_NON_SPACE = re.compile(r'\S')
+
+# Stands in for each run of tokens dropped between two windows: one token that
+# is no number, month, keyterm or number word, and wide enough that a
+# character-distance context check never reaches from one window into the next
+SEPARATOR = ' ' + 'x' * 32 + ' '
+
+# above this many distinct anchor tokens one token scan beats a str.find pass per token
+_MAX_FIND_TOKENS = 64
+
+# initial look-around when walking tokens; doubled while a long token is in the way
+_SPAN = 256
+
+
+def _tokens_before(text: str, pos: int):
+    """Yield (start, end) of every whole token before pos, nearest first."""
+    hi, span = pos, _SPAN
+    while hi > 0:
+        lo = max(0, hi - span)
+        spans = [m.span() for m in _TOKEN.finditer(text, lo, hi)]
+        if lo > 0 and spans and spans[0][0] == lo and not text[lo - 1].isspace():
+            # the first token is cut by the look-behind; find it whole next time
+            if len(spans) == 1:
+                span *= 2
+                continue
+            hi = spans.pop(0)[1]
+        else:
+            hi = lo
+        yield from reversed(spans)
+
+
+def _tokens_after(text: str, pos: int):
+    """Yield (start, end) of every whole token after pos, nearest first."""
+    n = len(text)
+    lo, span = pos, _SPAN
+    while lo < n:
+        hi = min(n, lo + span)
+        spans = [m.span() for m in _TOKEN.finditer(text, lo, hi)]
+        if hi < n and spans and spans[-1][1] == hi and not text[hi].isspace():
+            # the last token is cut by the look-ahead; find it whole next time
+            if len(spans) == 1:
+                span *= 2
+                continue
+            lo = spans.pop()[0]
+        else:
+            lo = hi
+        yield from spans
+
+
+def _anchor_spans(text: str, anchor_pattern: re.Pattern) -> list[tuple[int, int]]:
+    """(start, end) of every token that anchor_pattern matches whole, in order.
+
+    Each distinct token is tested once; in a long text with few anchors their
+    occurrences are then found with str.find rather than a regex tried at
+    every position.
+    """
+    anchors = {token for token in set(text.split()) if anchor_pattern.fullmatch(token)}
+    if len(anchors) > _MAX_FIND_TOKENS:
+        return [m.span() for m in _TOKEN.finditer(text) if m.group() in anchors]
+
+    n = len(text)
+    spans = []
+    for token in anchors:
+        i = text.find(token)
+        while i >= 0:
+            end = i + len(token)
+            # an occurrence inside a longer token is not an anchor
+            if (i == 0 or text[i - 1].isspace()) and (end == n or text[end].isspace()):
+                spans.append((i, end))
+            i = text.find(token, i + 1)
+    spans.sort()
+    return spans
+
+
+def _extend_left(text: str,
+                 pos: int,
+                 tokens: int,
+                 chars: int,
+                 run_pattern: re.Pattern = None) -> int:
+    """Window start: the run of tokens before pos, then `tokens` tokens and `chars` characters."""
+    start = base = pos
+    count = 0
+    in_run = run_pattern is not None
+    for token_start, token_end in _tokens_before(text, pos):
+        if in_run:
+            if run_pattern.fullmatch(text, token_start, token_end):
+                start = base = token_start
+                continue
+            in_run = False
+        if count >= tokens and start <= base - chars:
+            return start
+        start = token_start
+        count += 1
+    # out of tokens: the window reaches the start of the text
+    return 0
+
+
+def _extend_right(text: str,
+                  pos: int,
+                  tokens: int,
+                  chars: int,
+                  run_pattern: re.Pattern = None) -> int:
+    """Window end: the run of tokens after pos, then `tokens` tokens and `chars` characters."""
+    end = base = pos
+    count = 0
+    in_run = run_pattern is not None
+    for token_start, token_end in _tokens_after(text, pos):
+        if in_run:
+            if run_pattern.fullmatch(text, token_start, token_end):
+                end = base = token_end
+                continue
+            in_run = False
+        if count >= tokens and end >= base + chars:
+            return end
+        end = token_end
+        count += 1
+    return len(text)
+
+
+class AnchorWindows(object):
+    """ Reduce a Text to the Windows Around its Anchor Tokens
+
+    An anchor is a whitespace-delimited token an extractor cannot match
+    without (a digit run, a keyterm).  Every anchor is widened by a number of
+    whole tokens and characters of context on each side; overlapping windows
+    are merged and each run of tokens between two windows is replaced by
+    SEPARATOR.  An extractor whose matches and context checks stay within that
+    context then finds the same results in `text` as in the original, at a
+    cost that depends on the number of anchors rather than the text length.
+
+    Sample Input Text (anchor: digits, 1 token of context):
+        "we talked about it at length and agreed on 5 days of rework"
+    Sample Reduced Text:
+        " xxx...xxx on 5 days xxx...xxx "
+    """
+
+    def __init__(self,
+                 input_text: str,
+                 anchor_pattern: re.Pattern,
+                 context_tokens: int,
+                 context_chars: int = 0,
+                 run_pattern: re.Pattern = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   anchor-window extraction mode for long documents
+
+        Args:
+            input_text (str): the text to reduce
+            anchor_pattern (re.Pattern): an anchor is a whitespace-delimited
+                token this pattern matches in full
+            context_tokens (int): whole tokens kept on each side of an anchor
+            context_chars (int): characters kept on each side of an anchor;
+                windows always start and end on token boundaries
+            run_pattern (re.Pattern): optional; matches whole tokens that can
+                belong to the same match as an anchor.  The window first covers
+                the unbroken run of such tokens on each side of the anchor, and
+                the context is counted from the ends of that run
+        """
+        self.original = input_text
+        self.anchor_count = 0
+
+        # (start, end) of each window in the original text, in order
+        self.spans: list[tuple[int, int]] = []
+
+        start = end = None
+        for anchor_start, anchor_end in _anchor_spans(input_text, anchor_pattern):
+            self.anchor_count += 1
+
+            # an anchor inside the current window only needs its right context
+            if end is not None and anchor_start < end:
+                end = max(end, _extend_right(
+                    input_text, anchor_end, context_tokens, context_chars, run_pattern))
+                continue
+
+            left = _extend_left(input_text, anchor_start, context_tokens, context_chars, run_pattern)
+            right = _extend_right(input_text, anchor_end, context_tokens, context_chars, run_pattern)
+
+            # merge unless at least one token lies between the two windows
+            if end is not None and not _NON_SPACE.search(input_text, end, left):
+                end = max(end, right)
+            else:
+                if end is not None:
+                    self.spans.append((start, end))
+                start, end = left, right
+
+        if end is not None:
+            self.spans.append((start, end))
+
+        self._build_text()
+
+    def _build_text(self) -> None:
+        text = self.original
+        pieces = []
+        self._starts: list[int] = []    # start of each window in self.text
+        length = 0
+        position = 0
+
+        for start, end in self.spans:
+            if _NON_SPACE.search(text, position, start):
+                pieces.append(SEPARATOR)
+                length += len(SEPARATOR)
+            self._starts.append(length)
+            pieces.append(text[start:end])
+            length += end - start
+            position = end
+
+        if self.spans and _NON_SPACE.search(text, position):
+            pieces.append(SEPARATOR)
+
+        self.text = ''.join(pieces)
+
+    @property
+    def coverage(self) -> float:
+        """Share of the original characters kept in the reduced text."""
+        if not self.original:
+            return 1.0
+        return sum(end - start for start, end in self.spans) / len(self.original)
+
+    def to_original(self, offset: int) -> int:
+        """Map an offset in the reduced text back to the original text.
+
+        Args:
+            offset (int): a character offset in self.text
+
+        Raises:
+            ValueError: the offset falls inside a SEPARATOR
+
+        Returns:
+            int: the corresponding offset in the original text
+        """
+        i = bisect_right(self._starts, offset) - 1
+        if i >= 0:
+            start, end = self.spans[i]
+            original = start + offset - self._starts[i]
+            if original <= end:
+                return original
+        raise ValueError(f'Offset Not In Window: {offset}')
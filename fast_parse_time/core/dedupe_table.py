@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Uniqueness Table for Batch Deduplication
+
+Results keyed by normalized input, so a batch parses each distinct text once
+and shares its result with every duplicate.
+
+The table keeps every entry until its estimated size reaches ``max_bytes``;
+from then on it behaves as an LRU cache of that size, evicting the least
+recently used entries.  Its counters report how well the batch deduplicated
+and what the table cost.
+
+Usage:
+    >>> from fast_parse_time import DedupeTable, parse_dates_batch
+    >>> table = DedupeTable(max_bytes=16 * 1024 * 1024)
+    >>> results = parse_dates_batch(lines, table=table)
+    >>> table.stats()
+    {'entries': 412, 'bytes': 301_552, 'peak_bytes': 301_552, ...}
+"""
+
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional
+
+
+# default budget of a table created by parse_dates_batch
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# estimated bytes of one OrderedDict entry (hash slot, linked-list node, key ref)
+_ENTRY_OVERHEAD = 104
+
+
+class DedupeTable(object):
+    """ Size-Bounded Table of Shared Results """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+
+        Args:
+            max_bytes (int): estimated size the entries may take up before the
+                least recently used ones are evicted
+        """
+        if max_bytes < 1:
+            raise ValueError(f'Max Bytes must be positive: {max_bytes}')
+
+        self.max_bytes = max_bytes
+
+        self._lock = Lock()
+        self._entries: OrderedDict = OrderedDict()    # key -> (value, size)
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """ Return the value stored for key (and count a hit or miss) """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: object, size: int) -> None:
+        """ Store value for key
+
+        Args:
+            key (Hashable): the normalized input
+            value (object): the shared result
+            size (int): estimated bytes of key and value
+        """
+        size += _ENTRY_OVERHEAD
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self.bytes += size
+            if self.bytes > self.peak_bytes:
+                self.peak_bytes = self.bytes
+
+            # an entry larger than the whole budget still replaces the rest
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """ Return the size and usage counters as plain data """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'peak_bytes': self.peak_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
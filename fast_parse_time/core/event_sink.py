@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Optional, Pluggable Event Sink
+
+Service event records are no longer generated on every call.
+A sink must be registered explicitly; until then the pipeline builds nothing.
+
+A sink is any callable with the signature of
+``baseblock.ServiceEventGenerator().process``::
+
+    sink(service_name: str, event_name: str, stopwatch: Stopwatch, data: dict) -> Optional[dict]
+
+Whatever the sink returns (if not None) is surfaced in the 'events' list
+of ``AnalyzeTimeReferences.process``.
+"""
+
+
+from typing import Callable, Optional
+
+
+EventSink = Callable[..., Optional[dict]]
+
+_event_sink: Optional[EventSink] = None
+
+
+def register_event_sink(sink: EventSink) -> None:
+    """ Install a process-wide event sink
+
+    Args:
+        sink (EventSink): callable invoked once per analyzed document
+
+    Raises:
+        TypeError: the sink is not callable
+    """
+    global _event_sink
+
+    if not callable(sink):
+        raise TypeError(f'Event sink must be callable: {sink!r}')
+
+    _event_sink = sink
+
+
+def clear_event_sink() -> None:
+    """ Remove the installed event sink (event generation is off by default) """
+    global _event_sink
+    _event_sink = None
+
+
+def get_event_sink() -> Optional[EventSink]:
+    """ Return the installed event sink, or None """
+    return _event_sink
+
+
+def baseblock_event_sink() -> EventSink:
+    """ Build a sink backed by baseblock's ServiceEventGenerator
+
+    This restores the historical event record format.  baseblock is imported
+    here (not at module import) so callers who never install a sink never load it.
+
+    Returns:
+        EventSink: the bound ServiceEventGenerator.process method
+    """
+    from baseblock import ServiceEventGenerator
+    return ServiceEventGenerator().process
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Compile a Lexicon into a Prefix-Factored Regex Alternation """
+
+
+import re
+from collections.abc import Iterable
+
+
+# marks the end of a word inside a trie node
+_END = ''
+
+
+def _atom(char: str) -> str:
+    # a space inside a lexicon entry ('as of') matches any run of whitespace
+    if char == ' ':
+        return r'\s+'
+    return re.escape(char)
+
+
+def _is_single_atom(pattern: str) -> bool:
+    """True if `?` can follow pattern directly ('e', '\\.'); '\\s+' needs a group."""
+    return len(pattern) == 1 or (len(pattern) == 2 and pattern[0] == '\\')
+
+
+def _render(node: dict) -> str:
+    branches = [_atom(char) + _render(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+
+    body = '|'.join(branches)
+    if _END in node:
+        # greedy: the longer word is tried before the word ending here
+        if len(branches) == 1 and _is_single_atom(body):
+            return body + '?'
+        return f'(?:{body})?'
+    if len(branches) == 1:
+        return body
+    return f'(?:{body})'
+
+
+def build_alternation(words: Iterable[str]) -> str:
+    """
+    Build one regex alternation matching any word of a lexicon.
+
+    The words are merged into a character trie, so shared prefixes are matched
+    once and every branch point is a single character test:
+
+        ['jan', 'january', 'june', 'jun', 'jul', 'july']
+            => 'j(?:an(?:uary)?|u(?:ly?|ne?))'
+
+    At any position the longest word is preferred, exactly like a flat
+    alternation sorted longest-first.  A space inside an entry matches one or
+    more whitespace characters.  Alternatives are always inside a group, so the
+    result can be embedded as is, e.g. in '(...)' to capture the word.
+
+    Args:
+        words (Iterable[str]): the lexicon; empty strings are ignored
+
+    Raises:
+        ValueError: the lexicon has no non-empty word
+
+    Returns:
+        str: a regex pattern
+    """
+    trie: dict = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = None
+
+    if not trie:
+        raise ValueError('Empty Lexicon')
+
+    return _render(trie)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Process-Wide Metrics Counters
+
+Cheap, in-process counters and fixed-bucket latency histograms describing what
+the library is doing: documents parsed, prefilter rejections, hits per extractor,
+relative-time solutions by frame and tense, compound expansions and cache usage.
+
+Collection is off by default.  Call ``enable_metrics()`` once at service startup;
+instrumented code checks ``METRICS.enabled`` before touching the registry.
+
+Usage:
+    >>> from fast_parse_time import enable_metrics, metrics_snapshot, render_openmetrics
+    >>> enable_metrics()
+    >>> parse_dates('filed in 2019')
+    >>> metrics_snapshot()['fast_parse_time_extractor_hits']['samples']
+    [{'labels': {'extractor': 'extract_prose_year'}, 'value': 1}]
+    >>> print(render_openmetrics())   # serve from /metrics
+"""
+
+
+from threading import Lock
+
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0,
+)
+
+# name -> (type, help, label names)
+METRIC_DEFINITIONS = {
+    'fast_parse_time_documents': (
+        'counter', 'Documents processed, by pipeline', ('pipeline',)),
+    'fast_parse_time_prefilter_rejected': (
+        'counter', 'Documents rejected by a cheap prefilter before full extraction', ('check',)),
+    'fast_parse_time_extractor_hits': (
+        'counter', 'Dates returned, by explicit extractor', ('extractor',)),
+    'fast_parse_time_relative_solutions': (
+        'counter', 'Relative-time solutions, by frame and tense', ('frame', 'tense')),
+    'fast_parse_time_compound_expansions': (
+        'counter', 'Compound multi-unit sequences expanded into sub-expressions', ()),
+    'fast_parse_time_truncated': (
+        'counter', 'parse_dates calls cut short, by reason', ('reason',)),
+    'fast_parse_time_cache_requests': (
+        'counter', 'Cache lookups, by cache and result', ('cache', 'result')),
+    'fast_parse_time_latency_seconds': (
+        'histogram', 'Per-call latency of public API functions', ('api',)),
+}
+
+
+class MetricsRegistry(object):
+    """ Thread-safe counters and histograms keyed by (metric name, label values) """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = Lock()
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._histograms: dict[str, dict[tuple, list]] = {}
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + value
+
+    def observe(self, name: str, labels: tuple, seconds: float) -> None:
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            h = series.get(labels)
+            if h is None:
+                # [bucket counts..., +Inf count, sum]
+                h = series[labels] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+            for i, upper in enumerate(LATENCY_BUCKETS):
+                if seconds <= upper:
+                    h[i] += 1
+                    break
+            else:
+                h[len(LATENCY_BUCKETS)] += 1
+            h[-1] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def snapshot(self) -> dict:
+        """ Return every defined metric with its samples as plain, JSON-serializable data """
+        with self._lock:
+            counters = {k: dict(v) for k, v in self._counters.items()}
+            histograms = {k: {lk: list(lv) for lk, lv in v.items()}
+                          for k, v in self._histograms.items()}
+
+        d = {}
+        for name, (metric_type, help_text, label_names) in METRIC_DEFINITIONS.items():
+            samples = []
+            if metric_type == 'counter':
+                for labels, value in sorted(counters.get(name, {}).items()):
+                    samples.append({
+                        'labels': dict(zip(label_names, labels)),
+                        'value': value,
+                    })
+            else:
+                for labels, h in sorted(histograms.get(name, {}).items()):
+                    cumulative, buckets = 0, {}
+                    for upper, count in zip(LATENCY_BUCKETS, h):
+                        cumulative += count
+                        buckets[str(upper)] = cumulative
+                    cumulative += h[len(LATENCY_BUCKETS)]
+                    buckets['+Inf'] = cumulative
+                    samples.append({
+                        'labels': dict(zip(label_names, labels)),
+                        'buckets': buckets,
+                        'count': cumulative,
+                        'sum': h[-1],
+                    })
+            d[name] = {'type': metric_type, 'help': help_text, 'samples': samples}
+
+        return d
+
+
+METRICS = MetricsRegistry()
+
+
+def enable_metrics() -> None:
+    """ Start collecting process-wide metrics """
+    METRICS.enabled = True
+
+
+def disable_metrics() -> None:
+    """ Stop collecting metrics (existing values are kept until reset) """
+    METRICS.enabled = False
+
+
+def reset_metrics() -> None:
+    """ Zero all counters and histograms """
+    METRICS.reset()
+
+
+def metrics_snapshot() -> dict:
+    """ Return the current metric values as a dict (see MetricsRegistry.snapshot) """
+    return METRICS.snapshot()
+
+
+def _format_labels(labels: dict, extra: str = '') -> str:
+    parts = []
+    for k, v in labels.items():
+        v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{k}="{v}"')
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def render_openmetrics(snapshot: dict = None) -> str:
+    """ Render a metrics snapshot in OpenMetrics (Prometheus-compatible) text format
+
+    Args:
+        snapshot (dict, optional): output of metrics_snapshot(); taken now if omitted
+
+    Returns:
+        str: exposition text terminated by '# EOF'
+    """
+    if snapshot is None:
+        snapshot = metrics_snapshot()
+
+    lines = []
+    for name, metric in snapshot.items():
+        lines.append(f"# TYPE {name} {metric['type']}")
+        lines.append(f"# HELP {name} {metric['help']}")
+
+        for sample in metric['samples']:
+            labels = sample['labels']
+            if metric['type'] == 'counter':
+                lines.append(f"{name}_total{_format_labels(labels)} {sample['value']}")
+            else:
+                for upper, count in sample['buckets'].items():
+                    le = 'le="' + upper + '"'
+                    lines.append(f"{name}_bucket{_format_labels(labels, le)} {count}")
+                lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {sample['sum']}")
+
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Persistent Key-Value Cache on SQLite
+
+A size-bounded, on-disk cache shared by worker processes, for results that
+are expensive to recompute and asked for again across runs.
+
+*   Bulk reads and writes: one statement per batch, one transaction per write
+*   WAL journal, so readers in other processes are not blocked by a writer
+*   Bounded: when the stored values exceed max_bytes, the least recently read
+    entries are evicted
+*   Namespaced: the cache records the namespace it was written under (e.g. a
+    library version and KB hash); opening it under another namespace empties it
+
+Usage:
+    >>> cache = PersistentCache('results.sqlite', namespace='v1', max_bytes=2**28)
+    >>> cache.put_many({b'key': 'value'})
+    >>> cache.get_many([b'key', b'missing'])
+    {b'key': 'value'}
+"""
+
+
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Iterable
+
+
+# default budget of the stored values
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# eviction frees space down to this share of max_bytes, so it runs rarely
+_EVICT_TO = 0.9
+
+# reads refresh an entry's access time at most this often (seconds)
+_TOUCH_INTERVAL = 60
+
+# host parameters per statement (SQLite's default limit is 32766)
+_MAX_VARIABLES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class PersistentCache(object):
+    """ Size-Bounded Key-Value Cache on SQLite """
+
+    def __init__(self,
+                 path: str,
+                 namespace: str = '',
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+
+        Args:
+            path (str): the database file; created if missing
+            namespace (str): what the stored values depend on.  Entries
+                written under another namespace are deleted on open
+            max_bytes (int): budget of the stored keys and values
+
+        Raises:
+            ValueError: a budget that is not positive
+        """
+        if max_bytes < 1:
+            raise ValueError(f'Max Bytes must be positive: {max_bytes}')
+
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = Lock()
+        # worker processes wait for each other's write transactions
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        with self._transaction():
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'namespace'").fetchone()
+            if row is None or row[0] != namespace:
+                self._db.execute('DELETE FROM entries')
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('namespace', ?)", (namespace,))
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('bytes', '0')")
+            # a smaller budget than the one the cache was filled under
+            total = self._add_bytes(0)
+            if total > max_bytes:
+                self._evict(total - int(max_bytes * _EVICT_TO))
+
+    def _transaction(self):
+        return _Transaction(self._db)
+
+    def get_many(self, keys: Iterable[bytes]) -> dict[bytes, str]:
+        """ Return the stored value of every key that has one
+
+        Args:
+            keys (Iterable[bytes]): the keys to look up
+
+        Returns:
+            dict[bytes, str]: key -> value, for the keys found
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        stale = []
+        now = int(time())
+        with self._lock:
+            for start in range(0, len(keys), _MAX_VARIABLES):
+                chunk = keys[start:start + _MAX_VARIABLES]
+                rows = self._db.execute(
+                    f"SELECT key, value, accessed FROM entries WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk)
+                for key, value, accessed in rows:
+                    found[key] = value
+                    if accessed < now - _TOUCH_INTERVAL:
+                        stale.append((now, key))
+
+            if stale:
+                with self._transaction():
+                    self._db.executemany('UPDATE entries SET accessed = ? WHERE key = ?', stale)
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: dict[bytes, str]) -> None:
+        """ Store values, then evict the least recently read entries if over budget
+
+        A key another process stored first keeps its value: equal keys are
+        expected to hold equal values.
+
+        Args:
+            items (dict[bytes, str]): key -> value
+        """
+        if not items:
+            return
+
+        now = int(time())
+        with self._lock, self._transaction():
+            added = 0
+            for key, value in items.items():
+                # the budget is in stored bytes: values are stored as UTF-8 text
+                size = len(key) + len(value.encode())
+                cursor = self._db.execute(
+                    'INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?)', (key, value, size, now))
+                if cursor.rowcount:
+                    added += size
+            total = self._add_bytes(added)
+            if total > self.max_bytes:
+                self._evict(total - int(self.max_bytes * _EVICT_TO))
+
+    def _add_bytes(self, delta: int) -> int:
+        """ Update the running total of stored bytes (inside a transaction) """
+        self._db.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE name = 'bytes'", (delta,))
+        return int(self._db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0])
+
+    def _evict(self, bytes_to_free: int) -> None:
+        """ Delete the least recently read entries until bytes_to_free are freed """
+        freed, keys = 0, []
+        for key, size in self._db.execute('SELECT key, size FROM entries ORDER BY accessed'):
+            keys.append((key,))
+            freed += size
+            if freed >= bytes_to_free:
+                break
+        self._db.executemany('DELETE FROM entries WHERE key = ?', keys)
+        self._add_bytes(-freed)
+        self.evictions += len(keys)
+
+    def clear(self) -> None:
+        with self._lock, self._transaction():
+            self._db.execute('DELETE FROM entries')
+            self._db.execute("UPDATE meta SET value = '0' WHERE name = 'bytes'")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def stats(self) -> dict:
+        """ Return the size of the cache and this connection's usage counters """
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            total = int(self._db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0])
+        return {
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class _Transaction(object):
+    """ BEGIN IMMEDIATE ... COMMIT, rolled back on error """
+
+    __slots__ = ('_db',)
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+
+    def __enter__(self):
+        # take the write lock up front, so concurrent writers queue instead of deadlocking
+        self._db.execute('BEGIN IMMEDIATE')
+
+    def __exit__(self, exc_type, *exc):
+        self._db.execute('ROLLBACK' if exc_type else 'COMMIT')
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Per-Stage Timing Profile
+
+Records call counts and elapsed nanoseconds (``time.perf_counter_ns``) for each
+pipeline stage while a profile is active.  When no profile is active, ``stage()``
+returns a shared no-op context manager, so instrumented code pays only for a
+context-variable lookup.
+
+Usage:
+    >>> from fast_parse_time import parse_dates, profile_stages
+    >>> with profile_stages() as prof:
+    ...     for text in batch:
+    ...         parse_dates(text)
+    >>> prof.to_dict()['explicit.extract_prose_year']
+    {'calls': 1000, 'total_ns': 4210000, 'mean_ns': 4210}
+
+Profiles nest: an inner profile (e.g. ``parse_dates(text, profile=True)`` inside
+a batch-level ``profile_stages()``) is merged into the outer one when it closes.
+"""
+
+
+from time import perf_counter_ns
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class StageProfile(object):
+    """ Aggregated per-stage timings: stage name -> [calls, total_ns] """
+
+    def __init__(self):
+        self.stages: dict[str, list[int]] = {}
+
+    def record(self, stage_name: str, elapsed_ns: int) -> None:
+        entry = self.stages.get(stage_name)
+        if entry is None:
+            self.stages[stage_name] = [1, elapsed_ns]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ns
+
+    def merge(self, other: 'StageProfile') -> None:
+        for stage_name, (calls, total_ns) in other.stages.items():
+            entry = self.stages.get(stage_name)
+            if entry is None:
+                self.stages[stage_name] = [calls, total_ns]
+            else:
+                entry[0] += calls
+                entry[1] += total_ns
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        """ Return {stage: {'calls', 'total_ns', 'mean_ns'}} ordered by total time """
+        ordered = sorted(self.stages.items(), key=lambda kv: kv[1][1], reverse=True)
+        return {
+            stage_name: {
+                'calls': calls,
+                'total_ns': total_ns,
+                'mean_ns': total_ns // calls if calls else 0,
+            }
+            for stage_name, (calls, total_ns) in ordered
+        }
+
+    def __str__(self):
+        lines = [f"{'stage':<40} {'calls':>8} {'total ms':>10} {'mean us':>10}"]
+        for stage_name, d in self.to_dict().items():
+            lines.append(
+                f"{stage_name:<40} {d['calls']:>8} "
+                f"{d['total_ns'] / 1e6:>10.3f} {d['mean_ns'] / 1e3:>10.2f}")
+        return '\n'.join(lines)
+
+
+class _StageTimer(object):
+
+    __slots__ = ('_profile', '_stage_name', '_start')
+
+    def __init__(self, profile: StageProfile, stage_name: str):
+        self._profile = profile
+        self._stage_name = stage_name
+
+    def __enter__(self):
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self._profile.record(self._stage_name, perf_counter_ns() - self._start)
+        return False
+
+
+_active_profile: ContextVar[Optional[StageProfile]] = ContextVar(
+    'fast_parse_time_profile', default=None)
+
+_NO_OP = nullcontext()
+
+
+def active_profile() -> Optional[StageProfile]:
+    """ Return the profile currently collecting timings, or None """
+    return _active_profile.get()
+
+
+def stage(stage_name: str):
+    """ Time a block as the named stage (no-op unless a profile is active) """
+    profile = _active_profile.get()
+    if profile is None:
+        return _NO_OP
+    return _StageTimer(profile, stage_name)
+
+
+@contextmanager
+def profile_stages() -> Iterator[StageProfile]:
+    """ Collect per-stage timings for everything parsed inside the block
+
+    Yields:
+        StageProfile: populated as stages complete; merged into any enclosing profile on exit
+    """
+    parent = _active_profile.get()
+    profile = StageProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        if parent is not None:
+            parent.merge(profile)
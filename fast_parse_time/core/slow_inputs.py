@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Slow-Input Capture for Latency Outliers
+
+An opt-in recorder that keeps a bounded set of the slowest ``parse_dates`` inputs
+together with their per-stage timings and sizes, so pathological documents can be
+reproduced offline after the fact.
+
+Two retention policies:
+    *   threshold_ms=None: keep the N slowest inputs seen (min-heap on latency)
+    *   threshold_ms=X:    keep the N most recent inputs slower than X ms (ring buffer)
+
+Usage:
+    >>> from fast_parse_time import record_slow_inputs
+    >>> recorder = record_slow_inputs(capacity=50)
+    >>> ...                                   # serve traffic
+    >>> recorder.dump_jsonl('slow_inputs.jsonl')
+"""
+
+
+import heapq
+import json
+from time import time
+from threading import Lock
+from collections import deque
+from typing import Optional, TextIO, Union
+
+from .profiler import StageProfile
+
+
+class SlowInputRecorder(object):
+    """ Bounded capture of slow inputs with per-stage timings """
+
+    def __init__(self,
+                 capacity: int = 100,
+                 threshold_ms: Optional[float] = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+
+        Args:
+            capacity (int): maximum number of records retained
+            threshold_ms (float, optional): if set, retain every input slower than
+                this (oldest evicted first); otherwise retain the N slowest
+        """
+        if capacity < 1:
+            raise ValueError(f'Capacity must be positive: {capacity}')
+
+        self.capacity = capacity
+        self.threshold_ms = threshold_ms
+
+        self._lock = Lock()
+        self._counter = 0  # tie-breaker so heap entries never compare dicts
+        self._heap: list = []
+        self._ring: deque = deque(maxlen=capacity)
+
+    def would_keep(self, elapsed_ns: int) -> bool:
+        """ Cheap check made before a record is built """
+        if self.threshold_ms is not None:
+            return elapsed_ns >= self.threshold_ms * 1e6
+        return len(self._heap) < self.capacity or elapsed_ns > self._heap[0][0]
+
+    def offer(self,
+              input_text: str,
+              elapsed_ns: int,
+              stage_profile: Optional[StageProfile] = None) -> bool:
+        """ Consider one parsed input for retention
+
+        Returns:
+            bool: True if the input was retained
+        """
+        if not self.would_keep(elapsed_ns):
+            return False
+
+        record = {
+            'timestamp': time(),
+            'elapsed_ms': elapsed_ns / 1e6,
+            'chars': len(input_text),
+            'bytes': len(input_text.encode('utf-8', errors='replace')),
+            'tokens': len(input_text.split()),
+            'stages': stage_profile.to_dict() if stage_profile else {},
+            'text': input_text,
+        }
+
+        with self._lock:
+            if self.threshold_ms is not None:
+                self._ring.append(record)
+                return True
+
+            self._counter += 1
+            entry = (elapsed_ns, self._counter, record)
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, entry)
+            elif elapsed_ns > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+            else:
+                return False
+
+        return True
+
+    def records(self) -> list[dict]:
+        """ Return retained records, slowest first """
+        with self._lock:
+            if self.threshold_ms is not None:
+                records = list(self._ring)
+            else:
+                records = [entry[2] for entry in self._heap]
+
+        return sorted(records, key=lambda r: r['elapsed_ms'], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap = []
+            self._ring.clear()
+
+    def __len__(self):
+        return len(self._ring) if self.threshold_ms is not None else len(self._heap)
+
+    def dump_jsonl(self, destination: Union[str, TextIO]) -> int:
+        """ Write retained records as JSON Lines (one input per line), slowest first
+
+        Args:
+            destination (str | TextIO): a file path or an open text stream
+
+        Returns:
+            int: the number of records written
+        """
+        records = self.records()
+
+        if isinstance(destination, str):
+            with open(destination, 'w', encoding='utf-8') as f:
+                return self.dump_jsonl(f)
+
+        for record in records:
+            destination.write(json.dumps(record, ensure_ascii=False))
+            destination.write('\n')
+
+        return len(records)
+
+
+_recorder: Optional[SlowInputRecorder] = None
+
+
+def record_slow_inputs(capacity: int = 100,
+                       threshold_ms: Optional[float] = None) -> SlowInputRecorder:
+    """ Install (and return) a process-wide slow-input recorder for parse_dates """
+    global _recorder
+    _recorder = SlowInputRecorder(capacity=capacity, threshold_ms=threshold_ms)
+    return _recorder
+
+
+def stop_recording_slow_inputs() -> Optional[SlowInputRecorder]:
+    """ Uninstall the recorder and return it (its records remain available) """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def get_slow_input_recorder() -> Optional[SlowInputRecorder]:
+    return _recorder
@@ -1 +1,9 @@
 from .explicit_time_extractor import ExplicitTimeExtractor
+from .extractor_registry import (
+    ExplicitExtractor,
+    ExtractorRegistry,
+    EXPLICIT_EXTRACTORS,
+    register_extractor,
+    unregister_extractor,
+)
+from .log_template import LogTemplate
@@ -3,73 +3,242 @@
 """ NLP API for Parsing Dates of all Kinds """
 
 import re
+import logging
+from threading import Lock
 
-from fast_parse_time.core import configure_logger, Stopwatch
-from fast_parse_time.explicit.dto import DateType, MONTH_NAMES, MIN_YEAR, MAX_YEAR
+from fast_parse_time.core import AnchorWindows, configure_logger, build_alternation, Stopwatch
+from fast_parse_time.core.metrics import METRICS
+from fast_parse_time.explicit.dto import (
+    DateType, MONTH_NAMES, MONTH_LEXICON, ParserConfig, default_config)
 from fast_parse_time.explicit.dmo.stdlib_date_validator import try_parse_date
+from fast_parse_time.explicit.dmo.token_position_index import TokenPositionIndex
 from fast_parse_time.explicit.svc import (
-    PreClassifyNumericComponents,
-    TokenizeNumericComponents,
-    ClassifyNumericComponents,
+    ScanNumericComponents,
     ValidateNumericComponents,
 )
 
 
+# Month names as one prefix-factored alternation ('j(?:an(?:uary)?|u(?:ly?|ne?))|...')
+# so the engine tests one character per branch point rather than every name in turn
+_MONTH_ALTERNATION = build_alternation(MONTH_NAMES)
+
+# Prepositions that mark a bare 4-digit year as a year reference ('since 2019');
+# a space matches any whitespace run ('as  of')
+_YEAR_PREPOSITIONS = build_alternation([
+    'as of', 'back to', 'prior to',
+    'in', 'since', 'by', 'until', 'before', 'after',
+    'during', 'circa', 'around', 'from', 'through',
+])
+
+# extract_prose_year: year ranges (run first), then a preposition-preceded single year
+_YEAR_HYPHEN_RANGE = re.compile(r'\b(\d{4})-(\d{4})\b')
+_YEAR_FROM_TO = re.compile(r'(?i)\bfrom\s+(\d{4})\s+(?:to|through)\s+(\d{4})\b')
+_YEAR_BETWEEN = re.compile(r'(?i)\bbetween\s+(\d{4})\s+and\s+(\d{4})\b')
+_YEAR_BARE_TO = re.compile(r'(?i)\b(\d{4})\s+to\s+(\d{4})\b')
+_YEAR_ABBREV_RANGE = re.compile(r'\b(\d{4})-(\d{2})\b')
+_YEAR_ONLY = re.compile(rf'(?i)\b(?:{_YEAR_PREPOSITIONS})\s+(\d{{4}})\b')
+_PROSE_YEAR_PATTERNS = (
+    _YEAR_HYPHEN_RANGE, _YEAR_FROM_TO, _YEAR_BETWEEN, _YEAR_BARE_TO, _YEAR_ABBREV_RANGE, _YEAR_ONLY)
+
+# extract_iso8601_dates: the date of an ISO 8601 / RFC 3339 datetime
+_ISO_8601 = re.compile(
+    r'\b(\d{4}-\d{2}-\d{2})'   # date: YYYY-MM-DD
+    r'T\d{2}:\d{2}:\d{2}'      # time: Thh:mm:ss
+    r'(?:[.,]\d+)?'             # optional fractional seconds (. or ,)
+    r'(?:Z|[+-]\d{2}:\d{2})\b' # timezone: Z or ±HH:MM
+)
+
+# Anchor-window extraction (see ExplicitTimeExtractor.anchor_windows).
+# Every extractor pattern contains a digit, so a token with a digit is an anchor;
+# so is a token with any other non-ASCII word character, which may be numeric
+# for the numeric pre-classifier ('½').  The context covers the longest
+# pattern ('the 3rd day of December'), word_before() and the 20-character
+# month-name guard of the prose year-range check.
+_ANCHOR_PATTERN = re.compile(r'\S*[^\W_a-zA-Z]\S*')
+_ANCHOR_CONTEXT_TOKENS = 4
+_ANCHOR_CONTEXT_CHARS = 32
+
+# ParserConfig -> its compiled extractor, shared by every call with an equal config;
+# the oldest entry is dropped when a new config would exceed the bound
+_COMPILED: dict[ParserConfig, 'ExplicitTimeExtractor'] = {}
+_COMPILED_LOCK = Lock()
+_MAX_COMPILED = 32
+
+
 class ExplicitTimeExtractor(object):
     """ NLP API for Parsing Dates of all Kinds """
 
-    __preclassify_numeric: PreClassifyNumericComponents = None
-    __tokenize_numeric: TokenizeNumericComponents = None
-    __classify_numeric: ClassifyNumericComponents = None
+    __scan_numeric: ScanNumericComponents = None
     __validate_numeric: ValidateNumericComponents = None
 
-    def __init__(self):
+    def __init__(self, config: ParserConfig = None):
         """ Change Log
 
         Created:
             5-Apr-2024
             craigtrim@gmail.com
             *   https://github.com/craigtrim/fast-parse-time/issues/1
+        Updated:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   patterns compiled once from a ParserConfig
+            *   candidate and match spans, so log templates can replay extraction
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config().
+                Prefer ExplicitTimeExtractor.for_config, which shares one
+                instance per configuration
         """
         self.logger = configure_logger(__name__)
+        self.config = config = config or default_config()
+
+        month_pattern = _MONTH_ALTERNATION
+        if config.month_names is not MONTH_LEXICON:
+            month_pattern = build_alternation(config.month_names)
+
+        # extract_written_dates: Month Day, Year / Day Month Year
+        # (optional period after a month abbreviation: Aug., Dec.)
+        self._written_patterns = (
+            re.compile(rf'(?i)({month_pattern})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}'),
+            re.compile(rf'(?i)\d{{1,2}}(?:st|nd|rd|th)?\s+({month_pattern})\.?,?\s+\d{{4}}'),
+        )
+
+        # extract_hyphen_month_year: MonthName-Year / Year-MonthName
+        self._hyphen_forward = re.compile(rf'(?i)\b({month_pattern})\.?-(\d{{4}}|\d{{2}})\b')
+        self._hyphen_reversed = re.compile(rf'(?i)\b(\d{{4}}|\d{{2}})-({month_pattern})\.?\b')
+
+        # extract_ordinal_dates: the four pattern families
+        self._ordinal_patterns = (
+            re.compile(
+                r'\b(\d{1,2})(?:st|nd|rd|th)\s+day\s+of\s+'
+                r'(' + month_pattern + r')\.?'
+                r'(?:,?\s+(\d{4}))?',
+                re.IGNORECASE),
+            re.compile(
+                r'(?:the\s+)?(\d{1,2})(?:st|nd|rd|th)\s+of\s+'
+                r'(' + month_pattern + r')\.?'
+                r'(?:\s+(\d{4}))?\b',
+                re.IGNORECASE),
+            re.compile(
+                r'\b(' + month_pattern + r')\.?\s+(\d{1,2})(?:st|nd|rd|th)\b'
+                r'(?!\s*,?\s*\d{4})',
+                re.IGNORECASE),
+            re.compile(
+                r'\b(\d{1,2})(?:st|nd|rd|th)\s+(' + month_pattern + r')\.?\b'
+                r'(?!,?\s*\d{4})',
+                re.IGNORECASE),
+        )
 
-    def extract_numeric_dates(self, input_text: str) -> dict[str, DateType]:
+        # extract_space_month_number: [in|on] MonthName NN
+        self._space_month_number = re.compile(
+            rf'(?i)'
+            rf'(?:(?P<prep>in|on)\s+)?'
+            rf'(?P<month>{month_pattern})\s+'
+            rf'(?P<nn>\d{{2}})'
+            rf'(?!\d)'           # not followed by more digits
+            rf'(?!(?:st|nd|rd|th))'  # not followed by ordinal suffix
+            rf'(?!,?\s*\d{{4}})'     # not followed by (optional comma +) 4-digit year
+        )
+
+    @classmethod
+    def for_config(cls, config: ParserConfig) -> 'ExplicitTimeExtractor':
+        """The shared extractor compiled for a configuration.
+
+        Equal configurations share one instance, so several configurations
+        can serve side by side without recompiling per call.
+
+        Args:
+            config (ParserConfig): the configuration
+
+        Returns:
+            ExplicitTimeExtractor: compiled on first use of the configuration
         """
-        Extracts numeric dates from the given input text.
+        extractor = _COMPILED.get(config)
+        if extractor is not None:
+            if METRICS.enabled:
+                METRICS.inc('fast_parse_time_cache_requests', ('parser_config', 'hit'))
+            return extractor
+
+        if METRICS.enabled:
+            METRICS.inc('fast_parse_time_cache_requests', ('parser_config', 'miss'))
+        with _COMPILED_LOCK:
+            extractor = _COMPILED.get(config)
+            if extractor is None:
+                if len(_COMPILED) >= _MAX_COMPILED:
+                    del _COMPILED[next(iter(_COMPILED))]
+                extractor = _COMPILED[config] = cls(config)
+        return extractor
+
+    @staticmethod
+    def anchor_windows(input_text: str) -> AnchorWindows:
+        """Reduce normalized input text to the windows around digit tokens.
+
+        Every extract_* method finds the same dates in the reduced text as in
+        the input text.
 
         Args:
-            input_text (str): The input text from which to extract numeric dates.
+            input_text (str): normalized input text
 
         Returns:
-            Optional[List[str]]: A list of extracted numeric dates, or None if no dates were found.
+            AnchorWindows: the reduced text is AnchorWindows.text
         """
-        sw = Stopwatch()
+        return AnchorWindows(input_text, _ANCHOR_PATTERN,
+                             _ANCHOR_CONTEXT_TOKENS, _ANCHOR_CONTEXT_CHARS)
 
-        if not self.__preclassify_numeric:
-            self.__preclassify_numeric = PreClassifyNumericComponents()
+    def numeric_candidate_spans(self, input_text: str) -> list[tuple[int, int]]:
+        """(start, end) of every token extract_numeric_dates classifies, in input order."""
+        if not self.__scan_numeric:
+            self.__scan_numeric = ScanNumericComponents(self.config)
+        return self.__scan_numeric.candidate_spans(input_text)
 
-        if not self.__preclassify_numeric.process(input_text):
-            return None
+    def prose_year_spans(self, input_text: str) -> list[tuple[int, int]]:
+        """(start, end) of every match of the extract_prose_year patterns.
 
-        if not self.__tokenize_numeric:
-            self.__tokenize_numeric = TokenizeNumericComponents()
+        In a text without month names, extract_prose_year depends on the
+        matched text alone.
+        """
+        return [m.span() for pattern in _PROSE_YEAR_PATTERNS for m in pattern.finditer(input_text)]
 
-        date_tokens: list[str] | None = \
-            self.__tokenize_numeric.process(input_text)
-        if not date_tokens or not len(date_tokens):
-            return None
+    @staticmethod
+    def iso8601_date_spans(input_text: str) -> list[tuple[int, int]]:
+        """(start, end) of the date of every datetime extract_iso8601_dates finds."""
+        return [m.span(1) for m in _ISO_8601.finditer(input_text)]
 
-        if not self.__classify_numeric:
-            self.__classify_numeric = ClassifyNumericComponents()
+    def extract_numeric_dates(self,
+                              input_text: str,
+                              candidates: list[str] | None = None) -> dict[str, DateType]:
+        """
+        Extracts numeric dates from the given input text.
 
+        Args:
+            input_text (str): The input text from which to extract numeric dates.
+            candidates (list[str] | None): optional; the candidate tokens of the
+                text in input order, when already known (see numeric_candidate_spans)
+
+        Returns:
+            Optional[List[str]]: A list of extracted numeric dates, or None if no dates were found.
+        """
+        # the stopwatch and log message are only built when debug logging is on
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        sw = Stopwatch() if is_debug else None
+
+        if not self.__scan_numeric:
+            self.__scan_numeric = ScanNumericComponents(self.config)
+
+        # one pass replaces the pre-classify, tokenize and classify stages
         d_classified_dates: dict[str, DateType] | None = \
-            self.__classify_numeric.process(date_tokens)
+            self.__scan_numeric.process(input_text, candidates)
 
-        if not d_classified_dates or not len(d_classified_dates):
+        if d_classified_dates is None:
+            if METRICS.enabled:
+                METRICS.inc('fast_parse_time_prefilter_rejected', ('numeric',))
+            return None
+
+        if not len(d_classified_dates):
             return None
 
         if not self.__validate_numeric:
-            self.__validate_numeric = ValidateNumericComponents()
+            self.__validate_numeric = ValidateNumericComponents(self.config)
 
         d_classified_dates: dict[str, DateType] | None = \
             self.__validate_numeric.process(d_classified_dates)
@@ -77,15 +246,17 @@ class ExplicitTimeExtractor(object):
         if not d_classified_dates or not len(d_classified_dates):
             return None
 
-        self.logger.info(
-            f"Date Classification for '{input_text}' is {d_classified_dates} in {str(sw)}")
+        if is_debug:
+            self.logger.debug(
+                f"Date Classification for '{input_text}' is {d_classified_dates} in {str(sw)}")
 
         return d_classified_dates
 
     def _has_month_name(self, input_text: str) -> bool:
         """Check if text contains a month name."""
         tokens = re.findall(r'[a-zA-Z]+', input_text.lower())
-        return any(token in MONTH_NAMES for token in tokens)
+        month_names = self.config.month_names
+        return any(token in month_names for token in tokens)
 
     def _strip_ordinal(self, text: str) -> str:
         """Strip ordinal suffixes (1st -> 1, 2nd -> 2, etc.) and commas."""
@@ -97,21 +268,11 @@ class ExplicitTimeExtractor(object):
 
     def _extract_date_patterns(self, input_text: str) -> list[str]:
         """Extract potential date patterns from text."""
-        # Build month name pattern
-        month_pattern = '|'.join(sorted(MONTH_NAMES, key=len, reverse=True))
-
-        # Pattern for: Month Day, Year (e.g., March 15, 2024 or Mar 15th, 2024)
-        # Includes optional period after month abbreviation (Aug., Dec., etc.)
-        pattern1 = rf'(?i)({month_pattern})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}'
-
-        # Pattern for: Day Month Year (e.g., 15 March 2024 or 15th March, 2024)
-        # Includes optional period after month abbreviation (Aug., Dec., etc.)
-        # Allow optional comma between month and year
-        pattern2 = rf'(?i)\d{{1,2}}(?:st|nd|rd|th)?\s+({month_pattern})\.?,?\s+\d{{4}}'
-
+        # Month Day, Year (e.g., March 15, 2024 or Mar 15th, 2024), then
+        # Day Month Year (e.g., 15 March 2024 or 15th March, 2024)
         matches = []
-        for pattern in [pattern1, pattern2]:
-            for match in re.finditer(pattern, input_text):
+        for pattern in self._written_patterns:
+            for match in pattern.finditer(input_text):
                 matches.append(match.group())
 
         return matches
@@ -126,8 +287,9 @@ class ExplicitTimeExtractor(object):
         - Forward  (→ MONTH_YEAR): Oct-23, Oct-2023, October-23, October-2023
         - Reversed (→ YEAR_MONTH): 23-Oct, 2023-Oct, 23-October, 2023-October
 
-        Matching is case-insensitive. 2-digit years are accepted as-is.
-        4-digit years must fall within MIN_YEAR–MAX_YEAR.
+        Matching is case-insensitive. 2-digit years are accepted as-is unless
+        the config disables two_digit_years.
+        4-digit years must fall within the config's year window.
 
         Args:
             input_text (str): The input text to search.
@@ -142,29 +304,25 @@ class ExplicitTimeExtractor(object):
         if not input_text or not isinstance(input_text, str):
             return None
 
-        month_pattern = '|'.join(sorted(MONTH_NAMES, key=len, reverse=True))
-
-        # Forward: MonthName-Year  →  MONTH_YEAR
-        # Includes optional period after month abbreviation (Aug., Dec., etc.)
-        pattern_forward = rf'(?i)\b({month_pattern})\.?-(\d{{4}}|\d{{2}})\b'
-        # Reversed: Year-MonthName  →  YEAR_MONTH
-        # Includes optional period after month abbreviation (Aug., Dec., etc.)
-        pattern_reversed = rf'(?i)\b(\d{{4}}|\d{{2}})-({month_pattern})\.?\b'
+        config = self.config
 
         def _valid_year(raw: str) -> bool:
             n = int(raw)
             if len(raw) == 2:
-                return True  # all 2-digit years accepted (interpreted as 2000+YY)
-            return MIN_YEAR <= n <= MAX_YEAR
+                # 2-digit years are interpreted as 2000+YY
+                return config.two_digit_years
+            return config.min_year <= n <= config.max_year
 
         result = {}
 
-        for match in re.finditer(pattern_forward, input_text):
+        # Forward: MonthName-Year  →  MONTH_YEAR
+        for match in self._hyphen_forward.finditer(input_text):
             year_tok = match.group(2)
             if _valid_year(year_tok):
                 result[match.group()] = DateType.MONTH_YEAR.name
 
-        for match in re.finditer(pattern_reversed, input_text):
+        # Reversed: Year-MonthName  →  YEAR_MONTH
+        for match in self._hyphen_reversed.finditer(input_text):
             year_tok = match.group(1)
             if _valid_year(year_tok):
                 result[match.group()] = DateType.YEAR_MONTH.name
@@ -184,7 +342,7 @@ class ExplicitTimeExtractor(object):
             'from 2004 to 2008', 'from 2004 through 2008',
             'between 2010 and 2020', '2014 to 2015', '2025-26'.
 
-        Year validity: 4-digit years are accepted only within MIN_YEAR–MAX_YEAR.
+        Year validity: 4-digit years are accepted only within the config's year window.
         Abbreviated second year (YYYY-YY) uses century-rollover logic.
 
         Args:
@@ -202,10 +360,12 @@ class ExplicitTimeExtractor(object):
         if not input_text or not isinstance(input_text, str):
             return None
 
+        min_year, max_year = self.config.min_year, self.config.max_year
+
         def _valid_year(raw: str) -> bool:
             try:
                 n = int(raw)
-                return MIN_YEAR <= n <= MAX_YEAR
+                return min_year <= n <= max_year
             except ValueError:
                 return False
 
@@ -215,28 +375,25 @@ class ExplicitTimeExtractor(object):
 
         # "YYYY-YYYY" hyphen form (e.g., 2014-2015)
         # The numeric tokenizer rejects single-hyphen tokens, so we detect here.
-        for match in re.finditer(r'\b(\d{4})-(\d{4})\b', input_text):
+        for match in _YEAR_HYPHEN_RANGE.finditer(input_text):
             y1, y2 = match.group(1), match.group(2)
             if _valid_year(y1) and _valid_year(y2) and int(y1) < int(y2):
                 result[match.group()] = DateType.YEAR_RANGE.name
 
         # "from YYYY to YYYY" / "from YYYY through YYYY"
-        pattern_from_to = r'(?i)\bfrom\s+(\d{4})\s+(?:to|through)\s+(\d{4})\b'
-        for match in re.finditer(pattern_from_to, input_text):
+        for match in _YEAR_FROM_TO.finditer(input_text):
             y1, y2 = match.group(1), match.group(2)
             if _valid_year(y1) and _valid_year(y2) and int(y1) < int(y2):
                 result[f'{y1}-{y2}'] = DateType.YEAR_RANGE.name
 
         # "between YYYY and YYYY"
-        pattern_between = r'(?i)\bbetween\s+(\d{4})\s+and\s+(\d{4})\b'
-        for match in re.finditer(pattern_between, input_text):
+        for match in _YEAR_BETWEEN.finditer(input_text):
             y1, y2 = match.group(1), match.group(2)
             if _valid_year(y1) and _valid_year(y2) and int(y1) < int(y2):
                 result[f'{y1}-{y2}'] = DateType.YEAR_RANGE.name
 
         # "YYYY to YYYY" (bare, without "from") — e.g., "2014 to 2015"
-        pattern_bare_to = r'(?i)\b(\d{4})\s+to\s+(\d{4})\b'
-        for match in re.finditer(pattern_bare_to, input_text):
+        for match in _YEAR_BARE_TO.finditer(input_text):
             y1, y2 = match.group(1), match.group(2)
             if _valid_year(y1) and _valid_year(y2) and int(y1) < int(y2):
                 result[f'{y1}-{y2}'] = DateType.YEAR_RANGE.name
@@ -259,8 +416,8 @@ class ExplicitTimeExtractor(object):
         # Related GitHub Issue:
         #     #61 - False positive: written-month date range with hyphen triggers spurious YEAR_RANGE
         #     https://github.com/craigtrim/fast-parse-time/issues/61
-        pattern_abbrev = r'\b(\d{4})-(\d{2})\b'
-        for match in re.finditer(pattern_abbrev, input_text):
+        token_index = None
+        for match in _YEAR_ABBREV_RANGE.finditer(input_text):
             y1_full = int(match.group(1))
             y2_abbrev = int(match.group(2))
 
@@ -270,26 +427,16 @@ class ExplicitTimeExtractor(object):
 
             # Guard 2: Check if this match is part of a written-month date range
             # Pattern: "D Month YYYY - D Month YYYY" → after normalization → "D Month YYYY-D"
-            # We look for month names within a reasonable window before and after the match
+            # We look for month names within ~20 chars before the year
+            # (allows for "day + month + space" like "31 Oct 2021") and ~20 chars
+            # after the 2-digit part (allows for "space + month" like "28 Nov").
+            # Month-name positions are indexed once per text, so each check is a lookup.
+            if token_index is None:
+                token_index = TokenPositionIndex(input_text, self.config.month_names)
             match_start = match.start()
             match_end = match.end()
-
-            # Look back ~20 chars for a month name before the year
-            # (allows for "day + month + space" like "31 Oct 2021")
-            lookback_start = max(0, match_start - 20)
-            lookback_text = input_text[lookback_start:match_start].lower()
-
-            # Look forward ~20 chars for a month name after the 2-digit part
-            # (allows for "space + month" like "28 Nov")
-            lookforward_end = min(len(input_text), match_end + 20)
-            lookforward_text = input_text[match_end:lookforward_end].lower()
-
-            # Import month names from dto
-            from fast_parse_time.explicit.dto import MONTH_NAMES
-
-            # Check if any month name appears in the context
-            has_month_before = any(month in lookback_text for month in MONTH_NAMES)
-            has_month_after = any(month in lookforward_text for month in MONTH_NAMES)
+            has_month_before = token_index.has_month_within(max(0, match_start - 20), match_start)
+            has_month_after = token_index.has_month_within(match_end, match_end + 20)
 
             # If both month names are present, this is likely a false positive
             if has_month_before and has_month_after:
@@ -299,36 +446,26 @@ class ExplicitTimeExtractor(object):
             y2_full = century + y2_abbrev
             if y2_full <= y1_full:
                 y2_full += 100  # century rollover (e.g., 1999-00 → 2000)
-            if (MIN_YEAR <= y1_full <= MAX_YEAR
-                    and MIN_YEAR <= y2_full <= MAX_YEAR
+            if (min_year <= y1_full <= max_year
+                    and min_year <= y2_full <= max_year
                     and y1_full < y2_full):
                 result[match.group()] = DateType.YEAR_RANGE.name
 
         # ── Part A: preposition-preceded single year → YEAR_ONLY ──
 
-        # Multi-word prepositions (must come before single-word to avoid partial matches)
-        multi_word_preps = [
-            r'as\s+of',
-            r'back\s+to',
-            r'prior\s+to',
-        ]
-        single_word_preps = [
-            'in', 'since', 'by', 'until', 'before', 'after',
-            'during', 'circa', 'around', 'from', 'through',
-        ]
-
-        all_preps = multi_word_preps + [re.escape(p) for p in single_word_preps]
-        prep_pattern = '|'.join(all_preps)
-        pattern_year_only = rf'(?i)\b(?:{prep_pattern})\s+(\d{{4}})\b'
-
-        for match in re.finditer(pattern_year_only, input_text):
+        # Every 4-character slice of every YEAR_RANGE key, so "is this year
+        # already part of a range" is a set lookup rather than a scan of the keys
+        range_years = {
+            k[i:i + 4]
+            for k, v in result.items() if v == DateType.YEAR_RANGE.name
+            for i in range(len(k) - 3)
+        }
+
+        for match in _YEAR_ONLY.finditer(input_text):
             year = match.group(1)
             if _valid_year(year):
                 # Skip if this year is already part of a YEAR_RANGE key
-                already_in_range = any(
-                    year in k for k in result if result[k] == DateType.YEAR_RANGE.name
-                )
-                if not already_in_range:
+                if year not in range_years:
                     result[year] = DateType.YEAR_ONLY.name
 
         return result if result else None
@@ -360,13 +497,6 @@ class ExplicitTimeExtractor(object):
         if not input_text or not isinstance(input_text, str):
             return None
 
-        _ISO_8601 = re.compile(
-            r'\b(\d{4}-\d{2}-\d{2})'   # date: YYYY-MM-DD
-            r'T\d{2}:\d{2}:\d{2}'      # time: Thh:mm:ss
-            r'(?:[.,]\d+)?'             # optional fractional seconds (. or ,)
-            r'(?:Z|[+-]\d{2}:\d{2})\b' # timezone: Z or ±HH:MM
-        )
-
         matches = _ISO_8601.findall(input_text)
         if not matches:
             return None
@@ -411,14 +541,15 @@ class ExplicitTimeExtractor(object):
         if not input_text or not isinstance(input_text, str):
             return None
 
-        month_pat = '|'.join(sorted(MONTH_NAMES, key=len, reverse=True))
+        pat1, pat2, pat3, pat4 = self._ordinal_patterns
+        min_year, max_year = self.config.min_year, self.config.max_year
 
         def _valid_day(s: str) -> bool:
             return 1 <= int(s) <= 31
 
         def _valid_year(s: str) -> bool:
             try:
-                return MIN_YEAR <= int(s) <= MAX_YEAR
+                return min_year <= int(s) <= max_year
             except ValueError:
                 return False
 
@@ -431,12 +562,6 @@ class ExplicitTimeExtractor(object):
         # Related GitHub Issue:
         #     #63 - False positive: '19th day of May' (no year) returns DAY_MONTH
         #     https://github.com/craigtrim/fast-parse-time/issues/63
-        pat1 = re.compile(
-            r'\b(\d{1,2})(?:st|nd|rd|th)\s+day\s+of\s+'
-            r'(' + month_pat + r')\.?'
-            r'(?:,?\s+(\d{4}))?',
-            re.IGNORECASE,
-        )
         for m in pat1.finditer(input_text):
             day, year = m.group(1), m.group(3)
             if not _valid_day(day):
@@ -448,12 +573,6 @@ class ExplicitTimeExtractor(object):
         # ── Pattern 2: [the] NNth of Month [YYYY] ────────────────────────────
         # Unlike Pattern 1, "the Nth of Month" without year returns DAY_MONTH.
         # Only "Nth day of Month" requires year (strict mode per #63).
-        pat2 = re.compile(
-            r'(?:the\s+)?(\d{1,2})(?:st|nd|rd|th)\s+of\s+'
-            r'(' + month_pat + r')\.?'
-            r'(?:\s+(\d{4}))?\b',
-            re.IGNORECASE,
-        )
         for m in pat2.finditer(input_text):
             day, year = m.group(1), m.group(3)
             if not _valid_day(day):
@@ -466,11 +585,6 @@ class ExplicitTimeExtractor(object):
         # ── Pattern 3: Month NNth (no year) ──────────────────────────────────
         # Negative lookahead prevents matching when a 4-digit year follows
         # (those are handled by the existing extract_written_dates pipeline).
-        pat3 = re.compile(
-            r'\b(' + month_pat + r')\.?\s+(\d{1,2})(?:st|nd|rd|th)\b'
-            r'(?!\s*,?\s*\d{4})',
-            re.IGNORECASE,
-        )
         for m in pat3.finditer(input_text):
             day = m.group(2)
             if not _valid_day(day):
@@ -481,22 +595,17 @@ class ExplicitTimeExtractor(object):
         # Negative lookahead prevents matching when a 4-digit year follows.
         # Handles both "15th March 2018" and "15th March, 2018" (with comma).
         # "of" before the month is excluded (those are patterns 1/2).
-        pat4 = re.compile(
-            r'\b(\d{1,2})(?:st|nd|rd|th)\s+(' + month_pat + r')\.?\b'
-            r'(?!,?\s*\d{4})',
-            re.IGNORECASE,
-        )
+        token_index = None
         for m in pat4.finditer(input_text):
             day = m.group(1)
             if not _valid_day(day):
                 continue
             # Skip if the ordinal is part of 'NNth of Month' (pattern 2)
             # by checking whether 'of' immediately precedes the month token.
-            before_match = input_text[:m.start(2)].rstrip()
-            if re.search(r'\bof\s*$', before_match, re.IGNORECASE):
-                continue
-            # Skip if 'day of' precedes (pattern 1 territory)
-            if re.search(r'\bday\s+of\s*$', before_match, re.IGNORECASE):
+            # This also covers 'day of' (pattern 1 territory).
+            if token_index is None:
+                token_index = TokenPositionIndex(input_text, self.config.month_names)
+            if token_index.word_before(m.start(2)) == 'of':
                 continue
             result[m.group()] = DateType.DAY_MONTH.name
 
@@ -512,9 +621,12 @@ class ExplicitTimeExtractor(object):
         Returns:
             dict: Dictionary mapping date strings to DateType, or None if no dates found.
         """
-        sw = Stopwatch()
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        sw = Stopwatch() if is_debug else None
 
         if not self._has_month_name(input_text):
+            if METRICS.enabled:
+                METRICS.inc('fast_parse_time_prefilter_rejected', ('month_name',))
             return None
 
         # Try to extract date patterns from text
@@ -529,8 +641,9 @@ class ExplicitTimeExtractor(object):
                     result[date_str] = DateType.FULL_EXPLICIT_DATE.name
 
             if result:
-                self.logger.info(
-                    f"Written Date Classification for '{input_text}' is {result} in {str(sw)}")
+                if is_debug:
+                    self.logger.debug(
+                        f"Written Date Classification for '{input_text}' is {result} in {str(sw)}")
                 return result
 
         # Fallback: try parsing the whole text (for simple cases like "March 15, 2024")
@@ -557,8 +670,9 @@ class ExplicitTimeExtractor(object):
 
         result = {input_text: date_type.name}
 
-        self.logger.info(
-            f"Written Date Classification for '{input_text}' is {result} in {str(sw)}")
+        if is_debug:
+            self.logger.debug(
+                f"Written Date Classification for '{input_text}' is {result} in {str(sw)}")
 
         return result
 
@@ -602,9 +716,6 @@ class ExplicitTimeExtractor(object):
         if not input_text or not isinstance(input_text, str):
             return None
 
-        # Build month-name alternation, longest-first to avoid partial matches
-        month_pattern = '|'.join(sorted(MONTH_NAMES, key=len, reverse=True))
-
         # Match optional preposition + MonthName + exactly 2-digit number.
         # Negative lookahead 1: exclude more digits (NN must be exactly 2 digits).
         # Negative lookahead 2: exclude ordinal suffixes (st/nd/rd/th) — those are
@@ -612,19 +723,9 @@ class ExplicitTimeExtractor(object):
         # Negative lookahead 3: exclude cases where NN is followed by optional
         #   comma/space and a 4-digit year — e.g. "March 15, 2024" must not also
         #   yield a spurious "March 15" hit.
-        pattern = (
-            rf'(?i)'
-            rf'(?:(?P<prep>in|on)\s+)?'
-            rf'(?P<month>{month_pattern})\s+'
-            rf'(?P<nn>\d{{2}})'
-            rf'(?!\d)'           # not followed by more digits
-            rf'(?!(?:st|nd|rd|th))'  # not followed by ordinal suffix
-            rf'(?!,?\s*\d{{4}})'     # not followed by (optional comma +) 4-digit year
-        )
-
         result = {}
 
-        for match in re.finditer(pattern, input_text):
+        for match in self._space_month_number.finditer(input_text):
             prep = (match.group('prep') or '').lower()
             month_tok = match.group('month')
             nn_tok = match.group('nn')
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Registry and Scheduler for Explicit Date Extractors """
+
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+
+from fast_parse_time.core import stage
+from fast_parse_time.core.metrics import METRICS
+from fast_parse_time.explicit.dto import ParserConfig, default_config
+from fast_parse_time.explicit.dmo import DocumentFingerprint
+from fast_parse_time.explicit.bp.explicit_time_extractor import ExplicitTimeExtractor
+
+
+@dataclass(frozen=True)
+class ExplicitExtractor:
+    """ One explicit date extractor and when to run it
+
+    Attributes:
+        name: unique name; also the profiler stage ('explicit.<name>') and the
+            label of the extractor-hit metric
+        extract: called with the normalized text (and the ParserConfig of the
+            call when uses_config is True); returns a dict mapping each date
+            string to a DateType name, or None / {} when nothing is found
+        precedence: results are merged in ascending precedence, so an
+            overwriting extractor replaces the keys found by those before it
+        trigger: cheap predicate over the document fingerprint; when it is
+            False the extractor is not run.  It must be a necessary condition
+            of a match (never False for a text the extractor finds dates in)
+        check: label counted as a prefilter rejection when the trigger is False
+        cost: estimated cost relative to the other extractors (microseconds
+            on a short document that passes the trigger)
+        overwrite: False to only add keys no earlier extractor has found
+        uses_config: True to call extract(text, config)
+    """
+    name: str
+    extract: Callable[[str], dict | None]
+    precedence: int
+    trigger: Callable[[DocumentFingerprint], bool] | None = None
+    check: str | None = None
+    cost: float = 1.0
+    overwrite: bool = True
+    uses_config: bool = False
+
+
+class ExtractorRegistry(object):
+    """ Registry and Scheduler for Explicit Date Extractors
+
+    Only the extractors whose trigger holds for a document are run; their
+    results are merged in precedence order, so the outcome does not depend on
+    the order they run in.
+    """
+
+    def __init__(self, extractors: list[ExplicitExtractor] = ()):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   replaces the fixed extractor sequence in api.extract_explicit_dates
+
+        Args:
+            extractors (list[ExplicitExtractor]): initial extractors
+        """
+        self._lock = Lock()
+        # sorted by precedence; replaced (never mutated) so readers need no lock
+        self._extractors: tuple[ExplicitExtractor, ...] = ()
+        self._names: frozenset[str] = frozenset()
+        for extractor in extractors:
+            self.register(extractor)
+
+    @property
+    def extractors(self) -> tuple[ExplicitExtractor, ...]:
+        """All registered extractors in precedence order."""
+        return self._extractors
+
+    def register(self, extractor: ExplicitExtractor) -> None:
+        """Add an extractor.
+
+        Raises:
+            ValueError: an extractor with the same name is registered
+        """
+        with self._lock:
+            if any(e.name == extractor.name for e in self._extractors):
+                raise ValueError(f'Extractor Already Registered: {extractor.name}')
+            self._extractors = tuple(sorted(
+                self._extractors + (extractor,), key=lambda e: e.precedence))
+            self._names = self._names | {extractor.name}
+
+    def unregister(self, name: str) -> ExplicitExtractor:
+        """Remove an extractor by name and return it.
+
+        Raises:
+            KeyError: no extractor has this name
+        """
+        with self._lock:
+            for extractor in self._extractors:
+                if extractor.name == name:
+                    self._extractors = tuple(e for e in self._extractors if e is not extractor)
+                    self._names = self._names - {name}
+                    return extractor
+        raise KeyError(name)
+
+    def schedule(self,
+                 fingerprint: DocumentFingerprint,
+                 enabled: frozenset[str] | None = None) -> list[ExplicitExtractor]:
+        """The extractors whose trigger holds, in precedence order.
+
+        Args:
+            fingerprint (DocumentFingerprint): the document features
+            enabled (frozenset[str] | None): optional; only these extractors
+                are considered (ParserConfig.extractors)
+
+        Raises:
+            ValueError: an enabled name is not registered
+        """
+        extractors = self._extractors
+        if enabled is not None:
+            unknown = enabled - self._names
+            if unknown:
+                raise ValueError(f'Unknown Extractors: {sorted(unknown)}')
+            extractors = [e for e in extractors if e.name in enabled]
+
+        scheduled = []
+        for extractor in extractors:
+            if extractor.trigger is None or extractor.trigger(fingerprint):
+                scheduled.append(extractor)
+            elif METRICS.enabled:
+                METRICS.inc('fast_parse_time_prefilter_rejected',
+                            (extractor.check or extractor.name,))
+        return scheduled
+
+    def run(self,
+            input_text: str,
+            is_out_of_time: Callable[[], bool] | None = None,
+            config: ParserConfig = None) -> dict[str, str]:
+        """
+        Run the triggered extractors and merge their results.
+
+        Args:
+            input_text (str): normalized input text
+            is_out_of_time (Callable[[], bool] | None): optional deadline check.
+                The first scheduled extractor always runs; the others run
+                cheapest first, each only while time remains
+            config (ParserConfig): optional; defaults to default_config()
+
+        Raises:
+            ValueError: config.extractors names an unregistered extractor
+
+        Returns:
+            dict[str, str]: date string -> DateType name
+        """
+        if config is None:
+            config = default_config()
+        scheduled = self.schedule(
+            DocumentFingerprint(input_text, config.month_names), config.extractors)
+
+        order = scheduled
+        if is_out_of_time is not None:
+            order = scheduled[:1] + sorted(scheduled[1:], key=lambda e: e.cost)
+
+        found = {}
+        for i, extractor in enumerate(order):
+            if i and is_out_of_time is not None and is_out_of_time():
+                break
+            with stage(f'explicit.{extractor.name}'):
+                if extractor.uses_config:
+                    found[extractor.name] = extractor.extract(input_text, config)
+                else:
+                    found[extractor.name] = extractor.extract(input_text)
+
+        result = {}
+        for extractor in scheduled:
+            extracted = found.get(extractor.name)
+            if not extracted:
+                continue
+            if METRICS.enabled:
+                METRICS.inc('fast_parse_time_extractor_hits', (extractor.name,), len(extracted))
+            if extractor.overwrite:
+                result.update(extracted)
+            else:
+                for key, value in extracted.items():
+                    if key not in result:
+                        result[key] = value
+
+        return result
+
+
+def _builtin(method: str) -> Callable[[str, ParserConfig], dict | None]:
+    """Call an ExplicitTimeExtractor method on the extractor compiled for the config."""
+    def extract(input_text: str, config: ParserConfig) -> dict | None:
+        return getattr(ExplicitTimeExtractor.for_config(config), method)(input_text)
+    return extract
+
+
+def _builtin_extractors() -> list[ExplicitExtractor]:
+    def month_name_and(*features: str) -> Callable[[DocumentFingerprint], bool]:
+        # the month-name search is the costliest feature; test the others first
+        return lambda fingerprint: (all(fingerprint.has(f) for f in features)
+                                    and fingerprint.has('month_name'))
+
+    return [
+        # numeric dates first: the precedence all later extractors overwrite
+        ExplicitExtractor(
+            'extract_numeric_dates', _builtin('extract_numeric_dates'), 10,
+            trigger=lambda fingerprint: fingerprint.has('numeric'),
+            check='numeric', cost=50, uses_config=True),
+        ExplicitExtractor(
+            'extract_written_dates', _builtin('extract_written_dates'), 20,
+            trigger=month_name_and('numeric'), check='month_name',
+            cost=500, uses_config=True),
+        # Oct-23, 2023-Oct, March-2023
+        ExplicitExtractor(
+            'extract_hyphen_month_year', _builtin('extract_hyphen_month_year'), 30,
+            trigger=month_name_and('hyphen', 'digit_pair'), check='hyphen_month',
+            cost=20, uses_config=True),
+        # in 2004, since 2019, 2014-2015, from 2004 to 2008
+        ExplicitExtractor(
+            'extract_prose_year', _builtin('extract_prose_year'), 40,
+            trigger=lambda fingerprint: fingerprint.has('year_digits'),
+            check='year_digits', cost=45, uses_config=True),
+        # 2017-02-03T09:04:08Z (#23)
+        ExplicitExtractor(
+            'extract_iso8601_dates', _builtin('extract_iso8601_dates'), 50,
+            trigger=lambda fingerprint: fingerprint.has('iso_time'),
+            check='iso_time', cost=5, uses_config=True),
+        # 12th day of December, the 3rd of March, Dec 12th (#22)
+        ExplicitExtractor(
+            'extract_ordinal_dates', _builtin('extract_ordinal_dates'), 60,
+            trigger=month_name_and('ordinal'), check='ordinal',
+            cost=45, uses_config=True),
+        # Oct 23, March 15 (#38); only keys not classified by an earlier extractor
+        ExplicitExtractor(
+            'extract_space_month_number', _builtin('extract_space_month_number'), 70,
+            trigger=month_name_and('digit_pair'), check='month_number', cost=30,
+            overwrite=False, uses_config=True),
+    ]
+
+
+# the extractors behind extract_explicit_dates and parse_dates
+EXPLICIT_EXTRACTORS = ExtractorRegistry(_builtin_extractors())
+
+# name -> the built-in extractor (not one registered in its place)
+BUILTIN_EXTRACTORS: dict[str, ExplicitExtractor] = {
+    extractor.name: extractor for extractor in EXPLICIT_EXTRACTORS.extractors}
+
+
+def register_extractor(extractor: ExplicitExtractor) -> None:
+    """
+    Add an explicit date extractor to extract_explicit_dates and parse_dates.
+
+    Example:
+        >>> register_extractor(ExplicitExtractor(
+        ...     'extract_quarters', extract_quarters, precedence=80,
+        ...     trigger=lambda fingerprint: 'Q' in fingerprint.text))
+
+    Raises:
+        ValueError: an extractor with the same name is registered
+    """
+    EXPLICIT_EXTRACTORS.register(extractor)
+
+
+def unregister_extractor(name: str) -> ExplicitExtractor:
+    """
+    Remove an explicit date extractor (built-in or registered) by name.
+
+    Raises:
+        KeyError: no extractor has this name
+    """
+    return EXPLICIT_EXTRACTORS.unregister(name)
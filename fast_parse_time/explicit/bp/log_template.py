@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Explicit Date Extraction Replayed for the Lines of a Log Template """
+
+
+from typing import Optional
+
+from fast_parse_time.explicit.dto import DateType, ParserConfig, default_config
+from fast_parse_time.explicit.dmo import DocumentFingerprint
+from fast_parse_time.explicit.svc import normalize_text
+from fast_parse_time.explicit.bp.explicit_time_extractor import ExplicitTimeExtractor
+from fast_parse_time.explicit.bp.extractor_registry import (
+    BUILTIN_EXTRACTORS,
+    EXPLICIT_EXTRACTORS,
+    ExplicitExtractor,
+    ExtractorRegistry,
+)
+
+
+# every ASCII digit masked to '0': lines cut from one template share a signature
+_MASK_DIGITS = str.maketrans('123456789', '000000000')
+
+# the built-in extractors a template replays
+_REPLAYABLE = frozenset({'extract_numeric_dates', 'extract_prose_year', 'extract_iso8601_dates'})
+
+# distinct prose-year match texts whose result a template keeps; the oldest is dropped
+_MAX_PROSE_RESULTS = 64
+
+
+class LogTemplate(object):
+    """ Explicit Date Extraction Replayed for the Lines of a Log Template
+
+    Machine logs are cut from a few templates whose variable fields are numbers,
+    IDs and timestamps.  Lines that differ only in their ASCII digits share a
+    signature, and the extractor patterns and triggers treat every digit
+    alike: for all lines of a signature the same extractors are scheduled and
+    their patterns match at the same positions.  Only the checks on the
+    matched numbers (day, month and year ranges) can differ.
+
+    A template records those positions from one line.  For every other line
+    of the signature it runs only the checks: the numeric classifier on the
+    candidate tokens, the prose-year checks on the year matches (once per
+    distinct match text), and none for ISO 8601 dates, whose pattern has none.
+
+    Sample Use:
+        >>> template = LogTemplate.learn('job 1842 done 2024-03-15T10:22:31Z')
+        >>> template.extract('job 1907 done 2024-03-16T08:00:00Z')
+        {'2024-03-16': 'FULL_EXPLICIT_DATE'}
+    """
+
+    __slots__ = ('extractors', '_extractor', '_steps', '_numeric_spans',
+                 '_prose_spans', '_prose_results', '_iso_spans')
+
+    def __init__(self,
+                 input_text: str,
+                 config: ParserConfig,
+                 scheduled: list[ExplicitExtractor],
+                 extractors: tuple[ExplicitExtractor, ...]):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   log-template-aware extraction for parse_dates_batch
+
+        Args:
+            input_text (str): a normalized line; use LogTemplate.learn
+            config (ParserConfig): the configuration of the lines
+            scheduled (list[ExplicitExtractor]): the extractors scheduled for the line
+            extractors (tuple[ExplicitExtractor, ...]): all registered extractors
+        """
+        extractor = ExplicitTimeExtractor.for_config(config)
+
+        # the registered extractors the template was learned under
+        self.extractors = extractors
+        self._extractor = extractor
+        self._numeric_spans = []
+        self._prose_spans = []
+        self._prose_results: dict[tuple, Optional[dict]] = {}
+        self._iso_spans = []
+
+        # one step per scheduled extractor that matches, in precedence order
+        self._steps = []
+        for scheduled_extractor in scheduled:
+            name = scheduled_extractor.name
+            if name == 'extract_numeric_dates':
+                self._numeric_spans = extractor.numeric_candidate_spans(input_text)
+                if self._numeric_spans:
+                    self._steps.append(self._numeric_dates)
+            elif name == 'extract_prose_year':
+                self._prose_spans = extractor.prose_year_spans(input_text)
+                if self._prose_spans:
+                    self._steps.append(self._prose_year)
+            elif name == 'extract_iso8601_dates':
+                self._iso_spans = extractor.iso8601_date_spans(input_text)
+                if self._iso_spans:
+                    self._steps.append(self._iso8601_dates)
+
+    @staticmethod
+    def signature(input_text: str) -> str:
+        """The text with every ASCII digit masked; equal for the lines of a template."""
+        return input_text.translate(_MASK_DIGITS)
+
+    @classmethod
+    def learn(cls,
+              input_text: str,
+              config: Optional[ParserConfig] = None,
+              registry: ExtractorRegistry = EXPLICIT_EXTRACTORS) -> Optional['LogTemplate']:
+        """ Learn the template of a line
+
+        The lines of a signature are parsed in full instead when normalize_text
+        changes them, they have a month name (the month-name extractors and the
+        prose-year context guard read more than the matched numbers), or an
+        extractor other than the built-in numeric, prose-year and ISO 8601 ones
+        is scheduled.  Each of these is the same for every line of a signature.
+
+        Args:
+            input_text (str): a line, normalized as parse_dates_batch does
+            config (ParserConfig): optional; defaults to default_config()
+            registry (ExtractorRegistry): optional; the explicit extractors
+
+        Returns:
+            Optional[LogTemplate]: None if the lines of this signature must be
+            parsed in full
+        """
+        if config is None:
+            config = default_config()
+        if normalize_text(input_text) != input_text:
+            return None
+
+        fingerprint = DocumentFingerprint(input_text, config.month_names)
+        if fingerprint.has('month_name'):
+            return None
+
+        scheduled = registry.schedule(fingerprint, config.extractors)
+        if any(e is not BUILTIN_EXTRACTORS.get(e.name) or e.name not in _REPLAYABLE
+               for e in scheduled):
+            return None
+        return cls(input_text, config, scheduled, registry.extractors)
+
+    def extract(self, input_text: str) -> dict[str, str]:
+        """ The explicit dates of a line with the template's signature
+
+        Args:
+            input_text (str): the line
+
+        Returns:
+            dict[str, str]: date string -> DateType name, as extract_explicit_dates
+        """
+        result = {}
+        for step in self._steps:
+            extracted = step(input_text)
+            if extracted:
+                result.update(extracted)
+        return result
+
+    def _numeric_dates(self, input_text: str) -> Optional[dict]:
+        return self._extractor.extract_numeric_dates(
+            input_text, [input_text[start:end] for start, end in self._numeric_spans])
+
+    def _prose_year(self, input_text: str) -> Optional[dict]:
+        key = tuple(input_text[start:end] for start, end in self._prose_spans)
+        results = self._prose_results
+        if key in results:
+            return results[key]
+
+        if len(results) >= _MAX_PROSE_RESULTS:
+            results.pop(next(iter(results), None), None)
+        results[key] = result = self._extractor.extract_prose_year(input_text)
+        return result
+
+    def _iso8601_dates(self, input_text: str) -> dict:
+        return {input_text[start:end]: DateType.FULL_EXPLICIT_DATE.name
+                for start, end in self._iso_spans}
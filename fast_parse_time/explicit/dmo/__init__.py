@@ -1,2 +1,4 @@
 from .delimited_date_classifier import DelimitedDateClassifier
 from .day_month_validator import DayMonthValidator
+from .token_position_index import TokenPositionIndex
+from .document_fingerprint import DocumentFingerprint
@@ -3,21 +3,33 @@
 """ Classify Delimited Numerical Dates """
 
 
-from fast_parse_time.explicit.dto import DateType, DateComponentType,  MIN_YEAR, MAX_YEAR
+import logging
+
+from fast_parse_time.core import configure_logger
+from fast_parse_time.explicit.dto import DateType, DateComponentType, ParserConfig, default_config
 from fast_parse_time.explicit.dmo.stdlib_date_validator import try_parse_date
 
 
 class DelimitedDateClassifier(object):
     """ Classify Delimited Numerical Dates """
 
-    def __init__(self):
+    def __init__(self, config: ParserConfig = None):
         """ Change Log
 
         Created:
             8-Apr-2024
             craigtrim@gmail.com
+        Updated:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   year window and day-first policy from a ParserConfig
+            *   library-scoped logger; unrecognized combinations logged at DEBUG
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config()
         """
-        pass
+        self.logger = configure_logger(__name__)
+        self._config = config or default_config()
 
     def _classify_token(self,
                         input_text: str) -> DateComponentType | None:
@@ -27,7 +39,7 @@ class DelimitedDateClassifier(object):
             return None
 
         # e.g., a range of viable years (given 2024, range is 1924 - 2034)
-        if MIN_YEAR <= n <= MAX_YEAR:
+        if self._config.min_year <= n <= self._config.max_year:
             return DateComponentType.YEAR
 
         if 13 <= n <= 31:
@@ -175,7 +187,9 @@ class DelimitedDateClassifier(object):
         elif date_component_types in [
             [DateComponentType.DAY_OR_MONTH, DateComponentType.DAY_OR_MONTH],
         ]:
-            return DateType.DAY_MONTH_AMBIGUOUS
+            if self._config.day_first is None:
+                return DateType.DAY_MONTH_AMBIGUOUS
+            return DateType.DAY_MONTH if self._config.day_first else DateType.MONTH_DAY
 
         # Year Only
         elif date_component_types in [
@@ -183,11 +197,11 @@ class DelimitedDateClassifier(object):
         ]:
             return DateType.YEAR_ONLY
 
-        if self.isEnabledForInfo:
+        if self.logger.isEnabledFor(logging.DEBUG):
             date_component_type_str = [
                 date_component_type.name for date_component_type in date_component_types
             ]
-            self.logger.info(
+            self.logger.debug(
                 f'Unrecognized Date Component Classification: {date_component_type_str}')
 
     def process(self,
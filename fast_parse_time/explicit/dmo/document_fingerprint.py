@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Cheap Features of a Document for Extractor Triggers """
+
+
+import re
+from collections.abc import Callable
+from threading import Lock
+
+from fast_parse_time.core import build_alternation
+from fast_parse_time.explicit.dto import MONTH_LEXICON
+
+
+def _month_name_test(month_names: frozenset[str]) -> Callable[[str], bool]:
+    month_name = re.compile(build_alternation(month_names))
+    month_name_ignorecase = re.compile(month_name.pattern, re.IGNORECASE)
+
+    def has_month_name(text: str) -> bool:
+        # a case-insensitive alternation cannot skip ahead on its first characters;
+        # for ASCII text, searching the lowercased text is the same test and ~5x faster
+        if text.isascii():
+            return month_name.search(text.lower()) is not None
+        return month_name_ignorecase.search(text) is not None
+
+    return has_month_name
+
+
+# feature name -> test over the (normalized) text
+# each is a necessary condition of at least one extractor pattern: a single
+# substring or regex search, far cheaper than the extractor it gates
+_FEATURES = {
+    'hyphen': lambda text: '-' in text,
+    'numeric': re.compile(r'\d').search,
+    'digit_pair': re.compile(r'\d\d').search,
+    'year_digits': re.compile(r'\d{4}').search,
+    'iso_time': re.compile(r'\dT\d\d:').search,
+    'ordinal': re.compile(r'\d(?:st|nd|rd|th)', re.IGNORECASE).search,
+    # anywhere, not only as a whole word: some patterns do not start at a word boundary
+    'month_name': _month_name_test(MONTH_LEXICON),
+}
+
+# month lexicon -> the feature tests with that lexicon's month-name test;
+# bounded like the compiled extractors (ExplicitTimeExtractor.for_config),
+# the oldest custom lexicon is dropped first
+_FEATURES_BY_LEXICON: dict[frozenset[str], dict] = {}
+_FEATURES_LOCK = Lock()
+_MAX_LEXICONS = 32
+
+
+def _features_for(month_names: frozenset[str]) -> dict:
+    """The feature tests with the month-name test of a custom lexicon, cached."""
+    if month_names == MONTH_LEXICON:
+        return _FEATURES
+    with _FEATURES_LOCK:
+        tests = _FEATURES_BY_LEXICON.get(month_names)
+        if tests is None:
+            if len(_FEATURES_BY_LEXICON) >= _MAX_LEXICONS:
+                del _FEATURES_BY_LEXICON[next(iter(_FEATURES_BY_LEXICON))]
+            tests = _FEATURES_BY_LEXICON[month_names] = {
+                **_FEATURES, 'month_name': _month_name_test(month_names)}
+        return tests
+
+
+class DocumentFingerprint(object):
+    """ Cheap Features of a Document for Extractor Triggers
+
+    Each feature is computed on first use and cached, so extractors that share
+    a trigger ('month_name', 'numeric') pay for it once per document.
+
+    Sample Use:
+        >>> fingerprint = DocumentFingerprint('filed in 2019')
+        >>> fingerprint.has('year_digits'), fingerprint.has('month_name')
+        (True, False)
+    """
+
+    FEATURES = frozenset(_FEATURES)
+
+    __slots__ = ('text', '_features', '_tests')
+
+    def __init__(self, input_text: str, month_names: frozenset[str] = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   trigger predicates for the explicit extractor scheduler
+
+        Args:
+            input_text (str): the text the extractors will run on
+            month_names (frozenset[str]): optional month-name lexicon of the
+                'month_name' feature; defaults to MONTH_LEXICON
+        """
+        self.text = input_text
+        self._features: dict[str, bool] = {}
+        self._tests = _FEATURES
+        if month_names is not None and month_names is not MONTH_LEXICON:
+            self._tests = _FEATURES_BY_LEXICON.get(month_names)
+            if self._tests is None:
+                self._tests = _features_for(month_names)
+
+    def has(self, feature: str) -> bool:
+        """Return True if the text has the feature.
+
+        Args:
+            feature (str): one of DocumentFingerprint.FEATURES
+
+        Raises:
+            KeyError: unknown feature
+
+        Returns:
+            bool: the (cached) feature value
+        """
+        value = self._features.get(feature)
+        if value is None:
+            value = self._features[feature] = bool(self._tests[feature](self.text))
+        return value
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Word Token Positions for Context Guards """
+
+
+import re
+from bisect import bisect_left, bisect_right
+
+from fast_parse_time.explicit.dto import MONTH_NAMES
+
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+class TokenPositionIndex(object):
+    """ Word Token Positions for Context Guards
+
+    Built once per input text with a single scan.  Context checks that used to
+    slice and rescan the text around every match ("is there a month name near
+    this year?", "is this ordinal preceded by 'of'?") become bisect lookups.
+    Month names are found on the first month check, as substrings, like the
+    window checks they replace ('mar' in 'summary' counts).
+    """
+
+    def __init__(self, input_text: str, month_names: frozenset[str] = MONTH_NAMES):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   replaces per-match prefix and window rescans in the explicit extractors
+
+        Args:
+            input_text (str): the text the extractor is matching against
+            month_names (frozenset[str]): the lowercase month-name lexicon
+        """
+        self._text = input_text
+        self._month_names = month_names
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._words: list[str] = []
+        self._month_spans: list[tuple[int, int]] | None = None
+
+        for m in _WORD_PATTERN.finditer(input_text):
+            self._starts.append(m.start())
+            self._ends.append(m.end())
+            self._words.append(m.group().lower())
+
+    def _find_months(self) -> list[tuple[int, int]]:
+        """(start, end) of every occurrence of a month name in the lowercased text, sorted."""
+        text = self._text
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # keep offsets aligned: a character whose lowercase is longer ('İ') is
+            # kept as is; no month name can match across it either way
+            lowered = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+        spans = []
+        for name in self._month_names:
+            i = lowered.find(name)
+            while i >= 0:
+                spans.append((i, i + len(name)))
+                i = lowered.find(name, i + 1)
+        spans.sort()
+        return spans
+
+    def word_before(self, pos: int) -> str | None:
+        """Return the lowercase word ending at or before `pos` if only whitespace separates them.
+
+        Args:
+            pos (int): character offset
+
+        Returns:
+            str | None: the preceding word, or None if there is none or a non-space
+            character (punctuation, digits glued to a word) intervenes
+        """
+        i = bisect_right(self._ends, pos) - 1
+        if i < 0:
+            return None
+
+        gap = self._text[self._ends[i]:pos]
+        if gap and not gap.isspace():
+            return None
+        return self._words[i]
+
+    def has_month_within(self, start: int, end: int) -> bool:
+        """Return True if a month name lies entirely within text[start:end].
+
+        The same as testing every month name as a substring of
+        text[start:end].lower().
+
+        Args:
+            start (int): window start offset (inclusive)
+            end (int): window end offset (exclusive)
+
+        Returns:
+            bool: True if a month name (full or abbreviated) is inside the window
+        """
+        spans = self._month_spans
+        if spans is None:
+            spans = self._month_spans = self._find_months()
+
+        i = bisect_left(spans, (start,))
+        while i < len(spans) and spans[i][0] < end:
+            if spans[i][1] <= end:
+                return True
+            i += 1
+        return False
@@ -2,17 +2,14 @@
 # -*- coding: UTF-8 -*-
 
 
+import warnings
 from enum import Enum, auto
-from datetime import datetime
 from typing import Optional
 
 date_delims = [
     '/', '.', '-'
 ]
 
-MAX_YEAR = datetime.now().year + 10
-MIN_YEAR = datetime.now().year - 100
-
 # Month names for written date format detection
 MONTH_NAMES_FULL = {
     'january', 'february', 'march', 'april', 'may', 'june',
@@ -64,3 +61,21 @@ class DateType(Enum):
         for date_type in DateType:
             if date_type.name == input_text:
                 return date_type
+
+
+# below the month names it builds on
+from .parser_config import MONTH_LEXICON, ParserConfig, default_config  # noqa: E402
+
+
+# the former import-time year window, now read from default_config()
+_DEPRECATED_YEARS = {'MIN_YEAR': 'min_year', 'MAX_YEAR': 'max_year'}
+
+
+def __getattr__(name: str):
+    """ MIN_YEAR and MAX_YEAR, deprecated: use default_config().min_year / max_year """
+    if name in _DEPRECATED_YEARS:
+        attribute = _DEPRECATED_YEARS[name]
+        warnings.warn(f'{name} is deprecated; use default_config().{attribute}',
+                      DeprecationWarning, stacklevel=2)
+        return getattr(default_config(), attribute)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Immutable Configuration of the Explicit Date Extractors """
+
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from time import time
+
+from fast_parse_time.explicit.dto import MONTH_NAMES
+
+
+# the default year window, relative to the current year
+YEARS_BACK = 100
+YEARS_AHEAD = 10
+
+# the default month lexicon; configs with an equal lexicon share this object,
+# so lookups keyed by the lexicon take the identity fast path
+MONTH_LEXICON = frozenset(MONTH_NAMES)
+
+
+def _min_year() -> int:
+    return date.today().year - YEARS_BACK
+
+
+def _max_year() -> int:
+    return date.today().year + YEARS_AHEAD
+
+
+@dataclass(frozen=True)
+class ParserConfig:
+    """ Immutable Configuration of the Explicit Date Extractors
+
+    The patterns and lookup tables built from a configuration are compiled once
+    and shared by every call with an equal configuration, so several
+    configurations can serve side by side without recompiling per request.
+
+    Attributes:
+        min_year: smallest 4-digit year accepted; defaults to 100 years before
+            the year the config is created in
+        max_year: largest 4-digit year accepted; defaults to 10 years after it
+        month_names: lowercase month names and abbreviations matched by the
+            month-name patterns.  Written dates ('March 15, 2024') are still
+            validated with the standard library and need English names
+        date_delims: single-character delimiters of numeric dates
+        two_digit_years: False to reject 2-digit years in hyphenated
+            month-year forms ('Oct-23', '23-Oct')
+        day_first: how to read an ambiguous day/month pair ('4/8').  None keeps
+            it DAY_MONTH_AMBIGUOUS; True reads it as DAY_MONTH (8 April),
+            False as MONTH_DAY (4 August)
+        extractors: names of the explicit extractors to run; None runs every
+            registered extractor
+
+    Sample Use:
+        >>> config = ParserConfig(day_first=True, extractors=frozenset({'extract_numeric_dates'}))
+        >>> extract_explicit_dates('due 4/8 and filed in 2019', config=config)
+        {'4/8': 'DAY_MONTH'}
+    """
+    min_year: int = field(default_factory=_min_year)
+    max_year: int = field(default_factory=_max_year)
+    month_names: frozenset[str] = MONTH_LEXICON
+    date_delims: tuple[str, ...] = ('/', '.', '-')
+    two_digit_years: bool = True
+    day_first: bool | None = None
+    extractors: frozenset[str] | None = None
+
+    def __post_init__(self):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   replaces the MIN_YEAR/MAX_YEAR constants frozen at import time
+
+        Raises:
+            ValueError: an empty year window, month lexicon or delimiter list,
+                or a delimiter that is not a single non-word character
+        """
+        # accept any iterable of names; hashing needs frozensets
+        month_names = frozenset(name.lower() for name in self.month_names)
+        if month_names == MONTH_LEXICON:
+            month_names = MONTH_LEXICON
+        object.__setattr__(self, 'month_names', month_names)
+        object.__setattr__(self, 'date_delims', tuple(self.date_delims))
+        if self.extractors is not None:
+            object.__setattr__(self, 'extractors', frozenset(self.extractors))
+
+        if self.min_year > self.max_year:
+            raise ValueError(f'Empty Year Window: {self.min_year}-{self.max_year}')
+        if not self.month_names or '' in self.month_names:
+            raise ValueError('Empty Month Name')
+        if not self.date_delims or any(
+                len(d) != 1 or d.isalnum() or d.isspace() or d == '_' for d in self.date_delims):
+            raise ValueError(f'Invalid Date Delimiters: {self.date_delims}')
+
+    def __hash__(self) -> int:
+        # configs are dictionary keys of the compiled-artifact caches on every call,
+        # so the hash is computed once; str hashes differ between processes, so it
+        # is never pickled (see __getstate__)
+        value = self.__dict__.get('_hash')
+        if value is None:
+            value = hash((
+                self.min_year, self.max_year, self.month_names, self.date_delims,
+                self.two_digit_years, self.day_first, self.extractors))
+            object.__setattr__(self, '_hash', value)
+        return value
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state.pop('_hash', None)
+        return state
+
+    @classmethod
+    def for_year(cls, year: int, **kwargs) -> 'ParserConfig':
+        """The default year window around `year` (see default_config)."""
+        return cls(min_year=year - YEARS_BACK, max_year=year + YEARS_AHEAD, **kwargs)
+
+
+# (end of its year as a timestamp, config) replaced as one tuple,
+# so readers never see a torn pair
+_DEFAULT: tuple[float, ParserConfig] | None = None
+
+
+def default_config() -> ParserConfig:
+    """
+    The configuration used when a call passes none.
+
+    Its year window follows the calendar: on the first call in a new year a
+    new configuration replaces the previous one, so a long-running process
+    never serves a stale window.
+
+    Returns:
+        ParserConfig: ParserConfig.for_year(the current year)
+    """
+    global _DEFAULT
+    current = _DEFAULT
+    # one clock read per call; the calendar year is only computed on a rollover
+    if current is None or time() >= current[0]:
+        year = date.today().year
+        current = _DEFAULT = (datetime(year + 1, 1, 1).timestamp(), ParserConfig.for_year(year))
+    return current[1]
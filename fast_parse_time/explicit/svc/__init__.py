@@ -1,5 +1,6 @@
 from .classify_numeric_components import ClassifyNumericComponents
 from .normalize_text import normalize_text
 from .preclassify_numeric_components import PreClassifyNumericComponents
+from .scan_numeric_components import ScanNumericComponents
 from .tokenize_numeric_components import TokenizeNumericComponents
 from .validate_numeric_components import ValidateNumericComponents
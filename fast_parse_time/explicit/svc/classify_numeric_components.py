@@ -3,8 +3,11 @@
 """ Classify Date/Time Extracted Comopnents """
 
 
+import logging
+
+from fast_parse_time.core import configure_logger
 from fast_parse_time.explicit.dmo import DelimitedDateClassifier
-from fast_parse_time.explicit.dto import DateType, date_delims, MIN_YEAR, MAX_YEAR
+from fast_parse_time.explicit.dto import DateType, ParserConfig, default_config
 
 
 class ClassifyNumericComponents(object):
@@ -12,30 +15,38 @@ class ClassifyNumericComponents(object):
 
     __delimited_classifer: DelimitedDateClassifier = None
 
-    def __init__(self):
+    def __init__(self, config: ParserConfig = None):
         """ Change Log
 
         Created:
             8-Apr-2024
             craigtrim@gmail.com
+        Updated:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   year window and delimiters read from a ParserConfig
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config()
         """
-        pass
+        self.logger = configure_logger(__name__)
+        self._config = config or default_config()
 
     def _classify_date_type(self,
                             input_text: str) -> DateType | None:
 
         _date_delims = [
-            date_delim for date_delim in date_delims
+            date_delim for date_delim in self._config.date_delims
             if date_delim in input_text
         ]
 
-        if len(_date_delims) >= 2 and self.isEnabledForWarning:
+        if len(_date_delims) >= 2 and self.logger.isEnabledFor(logging.WARNING):
             self.logger.warning(
                 f'Unexpected Pattern: Multiple Delimiters Found: {_date_delims} in {input_text}')
 
         elif len(_date_delims) == 1:
             if not self.__delimited_classifer:
-                self.__delimited_classifer = DelimitedDateClassifier()
+                self.__delimited_classifer = DelimitedDateClassifier(self._config)
             delimited_result = self.__delimited_classifer.process(
                 input_text=input_text, delimiter=_date_delims[0])
             if delimited_result is not None:
@@ -46,7 +57,7 @@ class ClassifyNumericComponents(object):
             def is_valid_year(candidate: str) -> bool:
                 try:
                     n = int(candidate)
-                    return MIN_YEAR <= n <= MAX_YEAR
+                    return self._config.min_year <= n <= self._config.max_year
                 except ValueError:
                     pass
                 return False
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Find and Classify Numeric Date Candidates in a Single Pass """
+
+
+import re
+import logging
+
+from fast_parse_time.core import configure_logger
+from fast_parse_time.explicit.dmo import DelimitedDateClassifier
+from fast_parse_time.explicit.dto import DateType, ParserConfig, default_config
+
+
+def _candidate_pattern(delims: tuple[str, ...]) -> re.Pattern:
+    """A whitespace-delimited token built only from characters int() can accept
+    (Unicode decimal digits, sign, underscore) and the date delimiters.
+    Any other token can never pass the numeric checks, so it is never visited."""
+    chars = ''.join(re.escape(d) for d in sorted(set(delims) | {'+', '_'}))
+    return re.compile(rf'(?<!\S)[\d{chars}]+(?!\S)')
+
+
+class ScanNumericComponents(object):
+    """ Find and Classify Numeric Date Candidates in a Single Pass
+
+    Equivalent to running PreClassifyNumericComponents, TokenizeNumericComponents
+    and ClassifyNumericComponents in sequence, without splitting the text three
+    times or trying every delimiter on every word.
+    """
+
+    __delimited_classifer: DelimitedDateClassifier = None
+
+    def __init__(self, config: ParserConfig = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   merges the pre-classify, tokenize and classify numeric stages
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config()
+        """
+        self.logger = configure_logger(__name__)
+        self._config = config or default_config()
+        self._candidate_pattern = _candidate_pattern(self._config.date_delims)
+
+    def _is_valid_number(self, value: str) -> bool:
+        """Day-of-month / month-of-year (1..31) or a year in the year window."""
+        try:
+            n = int(value)
+        except ValueError:
+            return False
+        return 1 <= n <= 31 or self._config.min_year <= n <= self._config.max_year
+
+    def _is_valid_candidate(self, token: str, delims: list[str]) -> bool:
+        for date_delim in delims:
+            # `4.5` and `4-5` are not valid partial date ranges, but 4/5 is
+            if date_delim != '/' and token.count(date_delim) == 1:
+                continue
+            if all(self._is_valid_number(part) for part in token.split(date_delim)):
+                return True
+
+        return self._is_valid_number(token)
+
+    def _looks_numeric(self, token: str) -> bool:
+        """The PreClassifyNumericComponents test for a single token."""
+        if token.isnumeric():
+            return True
+        return any(
+            part.isnumeric()
+            for date_delim in self._config.date_delims if date_delim in token
+            for part in token.split(date_delim)
+        )
+
+    def _classify(self, token: str, delims: list[str]) -> DateType | None:
+        if len(delims) >= 2 and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                f'Unexpected Pattern: Multiple Delimiters Found: {delims} in {token}')
+
+        elif len(delims) == 1:
+            if not self.__delimited_classifer:
+                self.__delimited_classifer = DelimitedDateClassifier(self._config)
+            delimited_result = self.__delimited_classifer.process(
+                input_text=token, delimiter=delims[0])
+            if delimited_result is not None:
+                return delimited_result
+
+        if '-' in token:
+            parts = token.split('-')
+            if len(parts) == 2:
+                try:
+                    year_a, year_b = int(parts[0]), int(parts[1])
+                except ValueError:
+                    return None
+                if self._config.min_year <= year_a < year_b <= self._config.max_year:
+                    return DateType.YEAR_RANGE
+
+        return None
+
+    def candidate_spans(self, input_text: str) -> list[tuple[int, int]]:
+        """(start, end) of every candidate token of the text, in input order.
+
+        The candidate pattern treats every digit alike, so texts that differ
+        only in their digits have their candidates at the same positions.
+        """
+        return [m.span() for m in self._candidate_pattern.finditer(input_text)]
+
+    def process(self,
+                input_text: str,
+                tokens: list[str] | None = None) -> dict[str, str] | None:
+        """
+        Find numeric date candidates and classify them.
+
+        Args:
+            input_text (str): The input text to be processed.
+            tokens (list[str] | None): optional; the candidate tokens of the
+                text in input order, when already known (see candidate_spans)
+
+        Returns:
+            dict[str, str] | None: candidate token -> DateType name, in input order.
+            None if the text has no numeric date candidate at all (the pre-classify
+            rejection); an empty dict if there are candidates but none classify.
+        """
+        candidates: list[tuple[str, list[str]]] = []
+
+        # tokens are deduplicated on first occurrence, preserving input order
+        seen: set[str] = set()
+
+        if tokens is None:
+            tokens = [m.group() for m in self._candidate_pattern.finditer(input_text)]
+
+        date_delims = self._config.date_delims
+        for token in tokens:
+            if token in seen:
+                continue
+            seen.add(token)
+
+            delims = [date_delim for date_delim in date_delims if date_delim in token]
+            if self._is_valid_candidate(token, delims):
+                candidates.append((token, delims))
+
+        if not candidates:
+            return None
+
+        # The historical pre-classifier gates the whole text on at least one token
+        # being numeric (str.isnumeric) on its own or around a delimiter.  A valid
+        # candidate almost always satisfies it; only signed or underscored numbers
+        # ('+5', '1_0') need the full check.
+        if not any(self._looks_numeric(token) for token, _ in candidates):
+            if not any(self._looks_numeric(token) for token in input_text.split()):
+                return None
+
+        d: dict[str, str] = {}
+        for token, delims in candidates:
+            date_type = self._classify(token, delims)
+            if date_type:
+                d[token] = date_type.name
+
+        return d
@@ -3,20 +3,27 @@
 """ Extract Elements in Text that are Date-Related """
 
 
-from fast_parse_time.explicit.dto import date_delims, MIN_YEAR, MAX_YEAR
+from fast_parse_time.explicit.dto import ParserConfig, default_config
 
 
 class TokenizeNumericComponents(object):
     """ Extract Elements in Text that are Date-Related """
 
-    def __init__(self):
+    def __init__(self, config: ParserConfig = None):
         """ Change Log
 
         Created:
             8-Apr-2024
             craigtrim@gmail.com
+        Updated:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   year window and delimiters read from a ParserConfig
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config()
         """
-        pass
+        self._config = config or default_config()
 
     def _is_valid_token(self, input_token: str) -> bool:
         """
@@ -36,7 +43,7 @@ class TokenizeNumericComponents(object):
                 return True
 
             # e.g., a range of viable years (given 2024, range is 1924 - 2034)
-            if MIN_YEAR <= n <= MAX_YEAR:
+            if self._config.min_year <= n <= self._config.max_year:
                 return True
 
         except ValueError:
@@ -86,15 +93,19 @@ class TokenizeNumericComponents(object):
         # preserve input ordering, so avoid sets
         values: list[str] = []
 
+        # membership is checked against a set; a list scan made this quadratic
+        seen: set[str] = set()
+
         for input_token in input_tokens:
 
             # preserve input ordering, but avoid duplicates
-            if input_token in values:
+            if input_token in seen:
                 continue
+            seen.add(input_token)
 
             def has_delimited_value() -> bool:
                 for date_delim in [
-                    date_delim_value for date_delim_value in date_delims
+                    date_delim_value for date_delim_value in self._config.date_delims
                     if date_delim_value in input_token
                 ]:
                     if self._is_valid_tokens(
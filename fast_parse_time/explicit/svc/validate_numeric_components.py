@@ -4,7 +4,7 @@
 
 
 from fast_parse_time.explicit.dmo import DayMonthValidator
-from fast_parse_time.explicit.dto import DateType, date_delims, MIN_YEAR, MAX_YEAR
+from fast_parse_time.explicit.dto import DateType, ParserConfig, default_config
 
 
 class ValidateNumericComponents(object):
@@ -12,18 +12,25 @@ class ValidateNumericComponents(object):
 
     __day_month_validator: DayMonthValidator = None
 
-    def __init__(self):
+    def __init__(self, config: ParserConfig = None):
         """ Change Log
 
         Created:
             8-Apr-2024
             craigtrim@gmail.com
+        Updated:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   date delimiters from a ParserConfig
+
+        Args:
+            config (ParserConfig): optional; defaults to default_config()
         """
-        pass
+        self._config = config or default_config()
 
     def _tokenize(self, explicit_date: str) -> list[str] | None:
         _date_delims = [
-            date_delim for date_delim in date_delims
+            date_delim for date_delim in self._config.date_delims
             if date_delim in explicit_date
         ]
 
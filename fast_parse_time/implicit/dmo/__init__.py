@@ -1,4 +1,5 @@
 from .digit_text_replacer import DigitTextReplacer
 from .keyword_sequence_filter import KeywordSequenceFilter
+from .number_word_parser import NumberWordParser
 from .keyword_sequence_extractor import KeywordSequenceExtractor
 from .sequence_solution_finder import SequenceSolutionFinder
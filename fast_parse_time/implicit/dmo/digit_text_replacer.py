@@ -3,8 +3,59 @@
 """ Replace Spelled-Out forms of Numbers with their Digits """
 
 
-from datetime import date
-from word2number import w2n
+import re
+
+from fast_parse_time.implicit.dmo.number_word_parser import NumberWordParser
+from fast_parse_time.implicit.dto import WEEKDAYS
+
+
+def _is_numeric(tok: str) -> bool:
+    return tok.isdigit() or ('.' in tok and tok.replace('.', '', 1).isdigit())
+
+
+def _compile_phrases(phrase_replacements: list) -> tuple:
+    """Compile PHRASE_REPLACEMENTS for token-level matching.
+
+    Returns:
+        tuple: (trie, gate_words, irregular) where
+            trie        first word -> [(words, replacement tokens)] in priority order
+            gate_words  one word of every phrase; a phrase can only occur in a
+                        text that contains one of them
+            irregular   matches the texts on which token-level matching would
+                        differ from the historical substring replacement: a
+                        phrase glued to other characters ('into date' contains
+                        'to date'), or two overlapping phrases where the one on
+                        the left has the lower priority
+    """
+    phrases = [(tuple(phrase.split()), replacement.split())
+               for phrase, replacement in phrase_replacements]
+
+    trie: dict[str, list] = {}
+    for words, replacement in phrases:
+        trie.setdefault(words[0], []).append((words, replacement))
+
+    gate_words = tuple(sorted({max(words, key=len) for words, _ in phrases}))
+
+    # trailing commas are stripped before phrases are matched
+    def pattern(words: tuple) -> str:
+        return r',* '.join(re.escape(word) for word in words)
+
+    alternatives = []
+    for words, _ in phrases:
+        alternatives.append(rf'(?<=\S){pattern(words)}')
+        alternatives.append(rf'{pattern(words)},*[^,\s]')
+
+    for low, (low_words, _) in enumerate(phrases):
+        for high_words, _ in phrases[:low]:
+            for offset in range(1, len(low_words)):
+                overlap = low_words[offset:offset + len(high_words)]
+                if high_words[:len(overlap)] == overlap:
+                    combined = low_words[:offset] + high_words
+                    if len(combined) < len(low_words):
+                        combined = low_words
+                    alternatives.append(pattern(combined))
+
+    return trie, gate_words, re.compile('|'.join(alternatives))
 
 
 class DigitTextReplacer(object):
@@ -109,8 +160,41 @@ class DigitTextReplacer(object):
             *   Handle named weekday references (next friday, last monday)
                 https://github.com/craigtrim/fast-parse-time/issues/11
                 https://github.com/craigtrim/fast-parse-time/issues/12
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   Combine multi-token cardinals ('twenty five', 'one hundred and ten')
+                with a compiled number-word lexicon instead of word2number
+            *   Normalize tokens in one pass; phrases are matched with a token trie
+            *   Weekday references become symbolic day counts ('next:friday');
+                normalization no longer reads the clock
         """
-        pass
+        self._cardinals = NumberWordParser()
+        self._phrase_trie, self._phrase_gate, self._irregular_phrases = \
+            _compile_phrases(self.PHRASE_REPLACEMENTS)
+
+        # words that need more than being copied to the output
+        self._special_words = frozenset().union(
+            self._phrase_trie, ['and'], self.FUTURE_WEEKDAY_PREFIXES,
+            self.PAST_WEEKDAY_PREFIXES, NumberWordParser.STARTERS,
+            self.INDEFINITE_ARTICLES, self.INFORMAL_QUANTITIES,
+            self.UNIT_SINGULAR_TO_PLURAL)
+
+    @classmethod
+    def vocabulary(cls) -> frozenset:
+        """Every word a normalization step reads or rewrites.
+
+        A token (lowercase, trailing commas stripped) outside this set is only
+        ever copied to the output unchanged, unless it contains a digit, a '-'
+        joining number words, or a phrase glued to other characters.
+
+        Returns:
+            frozenset: the words
+        """
+        return frozenset().union(
+            (word for phrase, _ in cls.PHRASE_REPLACEMENTS for word in phrase.split()),
+            ['and'], cls.FUTURE_WEEKDAY_PREFIXES, cls.PAST_WEEKDAY_PREFIXES,
+            cls.WEEKDAY_NAMES, NumberWordParser.STARTERS, cls.INDEFINITE_ARTICLES,
+            cls.INFORMAL_QUANTITIES, cls.UNIT_SINGULAR_TO_PLURAL, cls.COMPOUND_UNIT_WORDS)
 
     def _remove_compound_and(self, tokens: list) -> list:
         """Remove 'and' tokens that act as connectors between compound unit pairs.
@@ -131,24 +215,27 @@ class DigitTextReplacer(object):
             #20 - Gap: compound multi-unit expressions not supported
             https://github.com/craigtrim/fast-parse-time/issues/20
         """
-        def _is_numeric(tok: str) -> bool:
-            return tok.isdigit() or ('.' in tok and tok.replace('.', '', 1).isdigit())
-
         result = []
-        n = len(tokens)
         for i, token in enumerate(tokens):
-            if token == 'and' and i >= 2 and i + 1 < n:
-                prev = tokens[i - 1]
-                prev_prev = tokens[i - 2]
-                # Only remove 'and' when pattern is: digit unit 'and' digit
-                # e.g., '1 year and 2 months' → remove; 'next week and 5 days' → keep
-                if (prev in self.COMPOUND_UNIT_WORDS
-                        and _is_numeric(prev_prev)
-                        and _is_numeric(tokens[i + 1])):
-                    continue  # skip this compound connector 'and'
+            if token == 'and' and self._is_compound_and(tokens, i):
+                continue  # skip this compound connector 'and'
             result.append(token)
         return result
 
+    def _is_compound_and(self, tokens: list, i: int) -> bool:
+        """True if the 'and' at tokens[i] connects two N-unit pairs.
+
+        Neighbours are compared without trailing commas, so this works on raw
+        tokens as well as on the output of _strip_trailing_commas.
+        """
+        if i < 2 or i + 1 >= len(tokens):
+            return False
+        # Only remove 'and' when pattern is: digit unit 'and' digit
+        # e.g., '1 year and 2 months' → remove; 'next week and 5 days' → keep
+        return (tokens[i - 1].rstrip(',') in self.COMPOUND_UNIT_WORDS
+                and _is_numeric(tokens[i - 2].rstrip(','))
+                and _is_numeric(tokens[i + 1].rstrip(',')))
+
     def _strip_trailing_commas(self, tokens: list) -> list:
         """Strip trailing commas from tokens.
 
@@ -206,25 +293,25 @@ class DigitTextReplacer(object):
         for i, token in enumerate(result):
             if token in self.UNIT_SINGULAR_TO_PLURAL and i > 0:
                 prev = result[i - 1]
-                if prev.isdigit() and int(prev) > 1:
+                if prev.isdecimal() and int(prev) > 1:
                     result[i] = self.UNIT_SINGULAR_TO_PLURAL[token]
         return result
 
     def _replace_weekday_refs(self, tokens: list) -> list:
-        """Replace named weekday references with computed day offsets.
+        """Replace named weekday references with symbolic day counts.
 
-        'next friday'  → ['5', 'days', 'from', 'now']  (if today is Sunday)
-        'last monday'  → ['6', 'days', 'ago']           (if today is Sunday)
-        'this friday'  → ['5', 'days', 'from', 'now']
-        'coming wed'   → ['3', 'days', 'from', 'now']
-        'past tuesday' → ['5', 'days', 'ago']
+        'next friday'  → ['next:friday', 'days', 'from', 'now']
+        'this fri'     → ['next:friday', 'days', 'from', 'now']
+        'coming wed'   → ['next:wednesday', 'days', 'from', 'now']
+        'last mon'     → ['last:monday', 'days', 'ago']
+        'past tuesday' → ['last:tuesday', 'days', 'ago']
 
-        Cardinality is always 1-7: the number of days to/from the target weekday.
+        The count depends on the reference date, so it is left symbolic here and
+        computed after extraction (ResolveTimeReferences.resolve_weekday).
         """
         if len(tokens) < 2:
             return tokens
 
-        today_wd = date.today().weekday()  # Monday=0, Sunday=6
         result = []
         i = 0
         while i < len(tokens):
@@ -232,27 +319,28 @@ class DigitTextReplacer(object):
             if i + 1 < len(tokens):
                 next_token = tokens[i + 1]
                 if next_token in self.WEEKDAY_NAMES:
-                    target_wd = self.WEEKDAY_NAMES[next_token]
+                    weekday = WEEKDAYS[self.WEEKDAY_NAMES[next_token]]
                     if token in self.FUTURE_WEEKDAY_PREFIXES:
-                        days = (target_wd - today_wd) % 7
-                        if days == 0:
-                            days = 7  # 'next' always means upcoming, not today
-                        result.extend([str(days), 'days', 'from', 'now'])
+                        result.extend([f'next:{weekday}', 'days', 'from', 'now'])
                         i += 2
                         continue
                     elif token in self.PAST_WEEKDAY_PREFIXES:
-                        days = (today_wd - target_wd) % 7
-                        if days == 0:
-                            days = 7  # 'last' always means most recent past
-                        result.extend([str(days), 'days', 'ago'])
+                        result.extend([f'last:{weekday}', 'days', 'ago'])
                         i += 2
                         continue
             result.append(token)
             i += 1
         return result
 
-    def process(self,
-                tokens: list) -> list:
+    def _process_stepwise(self,
+                          tokens: list) -> list:
+        """One pass per normalization step.
+
+        Used for the rare inputs on which the single-pass normalizer cannot
+        reproduce substring phrase replacement exactly (see _compile_phrases),
+        or whose tokens contain whitespace.  A rule changed here must change in
+        process too; the pipeline tests check both agree over the vocabulary.
+        """
         # Strip trailing commas before any other processing
         # (handles comma-separated compound expressions: '1 year, 2 months ago')
         tokens = self._strip_trailing_commas(tokens)
@@ -270,6 +358,10 @@ class DigitTextReplacer(object):
         # Replace named weekday references with computed day offsets
         tokens = self._replace_weekday_refs(tokens)
 
+        # Replace spelled-out cardinals with digits: 'twenty five' -> '25'
+        # ('a hundred' is a cardinal, so this runs before articles become '1')
+        tokens = self._cardinals.process(tokens)
+
         normalized = []
 
         for token in tokens:
@@ -280,12 +372,145 @@ class DigitTextReplacer(object):
             elif token in self.INFORMAL_QUANTITIES:
                 normalized.append(self.INFORMAL_QUANTITIES[token])
             else:
-                try:
-                    normalized.append(str(w2n.word_to_num(token)))
-                except ValueError:
-                    normalized.append(token)
+                normalized.append(token)
 
         # Normalize singular abbreviated units to plural for N > 1
         normalized = self._normalize_unit_plurals(normalized)
 
         return normalized
+
+    def process(self,
+                tokens: list) -> list:
+        """
+        Normalize relative-time tokens in a single left-to-right pass.
+
+        Per token, in the order the steps have always been applied: strip
+        trailing commas, drop compound 'and' connectors, replace phrases, round
+        floats, resolve weekday references, combine number words, map articles
+        and informal quantities, pluralize abbreviated units.
+
+        Args:
+            tokens (list): lowercase whitespace-split tokens
+
+        Returns:
+            list: normalized tokens
+        """
+        if not tokens:
+            return []
+
+        joined = ' '.join(tokens)
+
+        # tokens containing whitespace are re-split by substring phrase replacement
+        if not joined.isprintable() or joined.count(' ') != len(tokens) - 1:
+            return self._process_stepwise(tokens)
+
+        match_phrases = False
+        for word in self._phrase_gate:
+            if word in joined:
+                match_phrases = True
+                if self._irregular_phrases.search(joined):
+                    return self._process_stepwise(tokens)
+                break
+
+        phrase_trie = self._phrase_trie
+        weekday_names = self.WEEKDAY_NAMES
+        future_prefixes = self.FUTURE_WEEKDAY_PREFIXES
+        past_prefixes = self.PAST_WEEKDAY_PREFIXES
+        cardinals = self._cardinals
+        starters = NumberWordParser.STARTERS
+        special_words = self._special_words
+
+        result = []
+        n = len(tokens)
+        i = 0
+
+        while i < n:
+            token = tokens[i]
+
+            # the common case: a plain word no step applies to
+            if token.isalpha() and token not in special_words:
+                result.append(token)
+                i += 1
+                continue
+
+            token = token.rstrip(',')
+
+            # a token that was only commas disappears
+            if not token:
+                i += 1
+                continue
+
+            if token == 'and' and self._is_compound_and(tokens, i):
+                i += 1
+                continue
+
+            if match_phrases and token in phrase_trie:
+                replaced = False
+                for words, replacement in phrase_trie[token]:
+                    k = len(words)
+                    if i + k <= n and all(
+                            tokens[i + j].rstrip(',') == words[j] for j in range(1, k)):
+                        # replacements are already normalized tokens
+                        result.extend(replacement)
+                        i += k
+                        replaced = True
+                        break
+                if replaced:
+                    continue
+
+            if '.' in token:
+                try:
+                    token = str(int(float(token)))
+                except ValueError:
+                    pass
+
+            if token in future_prefixes or token in past_prefixes:
+                j = i + 1
+                while j < n and not tokens[j].rstrip(','):
+                    j += 1
+                next_token = tokens[j].rstrip(',') if j < n else None
+                if next_token in weekday_names:
+                    weekday = WEEKDAYS[weekday_names[next_token]]
+                    if token in future_prefixes:
+                        result.extend([f'next:{weekday}', 'days', 'from', 'now'])
+                    else:
+                        result.extend([f'last:{weekday}', 'days', 'ago'])
+                    i = j + 1
+                    continue
+
+            if token.isdecimal():
+                if not token.isascii() or token[0] == '0':
+                    token = str(int(token))
+
+            elif token in starters or '-' in token:
+                # the cardinal's words, skipping tokens that were only commas
+                window, positions = [token], [i]
+                j = i + 1
+                while j < n:
+                    following = tokens[j].rstrip(',')
+                    if following:
+                        if following != 'and' and following not in starters and '-' not in following:
+                            break
+                        window.append(following)
+                        positions.append(j)
+                    j += 1
+                found = cardinals.read(window, 0)
+                if found is not None:
+                    end, value = found
+                    result.append(str(value))
+                    i = positions[end - 1] + 1
+                    continue
+
+            if token in self.INDEFINITE_ARTICLES:
+                token = '1'
+            elif token in self.INFORMAL_QUANTITIES:
+                token = self.INFORMAL_QUANTITIES[token]
+            elif token in self.UNIT_SINGULAR_TO_PLURAL and result:
+                prev = result[-1]
+                if prev.isdecimal() and int(prev) > 1:
+                    token = self.UNIT_SINGULAR_TO_PLURAL[token]
+
+            result.append(token)
+            i += 1
+
+        return result
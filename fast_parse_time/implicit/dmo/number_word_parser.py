@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Combine Spelled-Out Cardinal Numbers into Digit Tokens """
+
+
+# token kinds
+_ZERO = 0
+_UNIT = 1       # one .. nine
+_TEEN = 2       # ten .. nineteen
+_TENS = 3       # twenty .. ninety
+_HUNDRED = 4
+_SCALE = 5      # thousand, million, billion
+_AND = 6        # connector inside a cardinal: 'one hundred and ten'
+_ARTICLE = 7    # 'a hundred', 'an hundred'
+
+_WORDS = {
+    'zero': (_ZERO, 0),
+    'one': (_UNIT, 1), 'two': (_UNIT, 2), 'three': (_UNIT, 3),
+    'four': (_UNIT, 4), 'five': (_UNIT, 5), 'six': (_UNIT, 6),
+    'seven': (_UNIT, 7), 'eight': (_UNIT, 8), 'nine': (_UNIT, 9),
+    'ten': (_TEEN, 10), 'eleven': (_TEEN, 11), 'twelve': (_TEEN, 12),
+    'thirteen': (_TEEN, 13), 'fourteen': (_TEEN, 14), 'fifteen': (_TEEN, 15),
+    'sixteen': (_TEEN, 16), 'seventeen': (_TEEN, 17), 'eighteen': (_TEEN, 18),
+    'nineteen': (_TEEN, 19),
+    'twenty': (_TENS, 20), 'thirty': (_TENS, 30), 'forty': (_TENS, 40),
+    'fifty': (_TENS, 50), 'sixty': (_TENS, 60), 'seventy': (_TENS, 70),
+    'eighty': (_TENS, 80), 'ninety': (_TENS, 90),
+    'hundred': (_HUNDRED, 100),
+    'thousand': (_SCALE, 1_000),
+    'million': (_SCALE, 1_000_000),
+    'billion': (_SCALE, 1_000_000_000),
+}
+
+
+def _compile_lexicon() -> dict[str, tuple]:
+    """token -> tuple of (kind, value) parts, including hyphenated forms.
+
+    'twenty-one' .. 'ninety-nine' and every '<number>-hundred', '<number>-thousand'
+    etc. are precomputed, so the common hyphenated cardinals are a single dict
+    lookup like any other word.
+    """
+    lexicon = {word: (part,) for word, part in _WORDS.items()}
+
+    numbers = {word: (part,) for word, part in _WORDS.items() if part[0] in (_UNIT, _TEEN, _TENS)}
+    for tens, tens_part in _WORDS.items():
+        if tens_part[0] == _TENS:
+            for unit, unit_part in _WORDS.items():
+                if unit_part[0] == _UNIT:
+                    numbers[f'{tens}-{unit}'] = (tens_part, unit_part)
+
+    lexicon.update(numbers)
+    for number, parts in numbers.items():
+        for scale in ('hundred', 'thousand', 'million', 'billion'):
+            lexicon[f'{number}-{scale}'] = parts + (_WORDS[scale],)
+    return lexicon
+
+
+_LEXICON = _compile_lexicon()
+
+_ARTICLES = {'a', 'an'}
+
+# tokens that can start a cardinal without a hyphen split
+_STARTERS = frozenset(_LEXICON) | _ARTICLES
+
+
+class _Cardinal(object):
+    """ State of one cardinal being read left to right """
+
+    __slots__ = ('total', 'group', 'last', 'last_scale')
+
+    def __init__(self):
+        self.total = 0          # completed thousand/million/billion groups
+        self.group = 0          # value below the last scale word
+        self.last = None        # kind of the last part accepted
+        self.last_scale = 0     # scales must descend: 'million ... thousand'
+
+    def accept(self, kind: int, value: int) -> bool:
+        """Apply one part; False if it cannot continue this cardinal."""
+        last = self.last
+        if last == _ZERO:
+            return False
+
+        if kind == _ZERO:
+            if last is not None:
+                return False
+        elif kind == _UNIT:
+            if last not in (None, _TENS, _HUNDRED, _SCALE, _AND):
+                return False
+            self.group += value
+        elif kind in (_TEEN, _TENS):
+            if last not in (None, _HUNDRED, _SCALE, _AND):
+                return False
+            self.group += value
+        elif kind == _HUNDRED:
+            if last in (None, _ARTICLE):
+                # 'hundred years ago' reads as 'a hundred'
+                self.group = 100
+            elif last in (_UNIT, _TEEN, _TENS) and self.group < 100:
+                self.group *= 100
+            else:
+                return False
+        elif kind == _SCALE:
+            if last in (None, _ARTICLE):
+                self.group = 1
+            elif last not in (_UNIT, _TEEN, _TENS, _HUNDRED):
+                return False
+            if self.last_scale and value >= self.last_scale:
+                return False
+            self.total += self.group * value
+            self.group = 0
+            self.last_scale = value
+        else:
+            return False
+
+        self.last = kind
+        return True
+
+    @property
+    def is_complete(self) -> bool:
+        return self.last not in (None, _AND, _ARTICLE)
+
+    @property
+    def value(self) -> int:
+        return self.total + self.group
+
+
+class NumberWordParser(object):
+    """ Combine Spelled-Out Cardinal Numbers into Digit Tokens
+
+    e.g., ['twenty', 'five', 'days']          => ['25', 'days']
+          ['one', 'hundred', 'and', 'ten']     => ['110']
+          ['twenty-three', 'choices']         => ['23', 'choices']
+
+    Words are looked up in a precompiled lexicon and combined with a small
+    state machine in one pass; tokens that are not number words are passed
+    through without any parsing attempt.
+    """
+
+    # every token a cardinal can start with, except hyphenated forms
+    STARTERS = _STARTERS
+
+    # the words any hyphenated cardinal is built from ('five-hundred-thousand')
+    WORDS = frozenset(_WORDS)
+
+    def __init__(self):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   replaces per-token word2number calls in DigitTextReplacer
+        """
+        pass
+
+    @staticmethod
+    def _parts(token: str) -> tuple | None:
+        parts = _LEXICON.get(token)
+        if parts is not None or '-' not in token:
+            return parts
+
+        # rarer hyphenated forms: every piece must be a number word
+        parts = ()
+        for piece in token.split('-'):
+            part = _WORDS.get(piece)
+            if part is None:
+                return None
+            parts += (part,)
+        return parts
+
+    def read(self,
+             tokens: list,
+             start: int) -> tuple[int, int] | None:
+        """
+        Read the longest cardinal starting at tokens[start].
+
+        Args:
+            tokens (list): lowercase tokens
+            start (int): index of the first token
+
+        Returns:
+            tuple[int, int] | None: (end, value) where tokens[start:end] spell
+            `value`, or None if no cardinal starts here
+        """
+        n = len(tokens)
+        i = start
+        cardinal = _Cardinal()
+
+        # an article only starts a cardinal directly before a scale word
+        if tokens[i] in _ARTICLES and i + 1 < n:
+            following = self._parts(tokens[i + 1])
+            if following and following[0][0] in (_HUNDRED, _SCALE):
+                cardinal.last = _ARTICLE
+                i += 1
+
+        # the longest complete cardinal read so far
+        end, value = start, None
+        while i < n:
+            token = tokens[i]
+            if token == 'and':
+                if cardinal.last not in (_HUNDRED, _SCALE) or i + 1 >= n:
+                    break
+                following = self._parts(tokens[i + 1])
+                if not following or following[0][0] not in (_UNIT, _TEEN, _TENS):
+                    break
+                cardinal.last = _AND
+                i += 1
+                continue
+
+            parts = self._parts(token)
+            if parts is None:
+                break
+
+            # a hyphenated token is all or nothing
+            if not all(cardinal.accept(kind, part_value) for kind, part_value in parts):
+                break
+
+            i += 1
+            if cardinal.is_complete:
+                end, value = i, cardinal.value
+
+        if value is None:
+            return None
+        return end, value
+
+    def process(self,
+                tokens: list) -> list:
+        """
+        Replace runs of number words with a single digit token.
+
+        Args:
+            tokens (list): lowercase tokens
+
+        Returns:
+            list: tokens with each cardinal replaced by its digits; digit tokens
+            are normalized ('05' => '5'); all other tokens are unchanged
+        """
+        result = []
+        n = len(tokens)
+        i = 0
+
+        while i < n:
+            token = tokens[i]
+
+            if token.isdecimal():
+                result.append(str(int(token)) if not token.isascii() or token[0] == '0' else token)
+                i += 1
+                continue
+
+            # the common case: not a number word at all
+            if token not in _STARTERS and '-' not in token:
+                result.append(token)
+                i += 1
+                continue
+
+            found = self.read(tokens, i)
+            if found is None:
+                result.append(token)
+                i += 1
+            else:
+                i, value = found
+                result.append(str(value))
+
+        return result
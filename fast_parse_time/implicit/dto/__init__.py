@@ -2,6 +2,45 @@
 # -*- coding: UTF-8 -*-
 
 
+from hashlib import blake2b
+from pathlib import Path
+
 from .index_by_keyterm_kb import d_index_by_keyterm_kb
 from .index_by_slot_kb import d_index_by_slot_kb
 from .keyterm_counter_kb import d_keyterm_counter_kb
+from .weekday_kb import WEEKDAYS, WEEKDAY_FRAME, WEEKDAY_TOKENS, d_weekday_slot_kb
+
+
+# Weekday slots are symbolic (resolved against a reference date after
+# extraction), so they are merged in here rather than generated into the KB files
+for _slot, _solution in d_weekday_slot_kb.items():
+    if _slot not in d_index_by_slot_kb:
+        d_index_by_slot_kb[_slot] = _solution
+        for _keyterm in _slot.split():
+            d_index_by_keyterm_kb.setdefault(_keyterm, []).append(_slot)
+            d_keyterm_counter_kb[_keyterm] = d_keyterm_counter_kb.get(_keyterm, 0) + 1
+
+
+_KB_MODULES = ('index_by_keyterm_kb', 'index_by_slot_kb', 'keyterm_counter_kb', 'weekday_kb')
+
+_kb_fingerprint = None
+
+
+def kb_fingerprint() -> str:
+    """
+    Content hash of the KB modules.
+
+    Anything derived from the KB (e.g. persisted parse results) can be keyed
+    by it, so regenerating the KB invalidates it.  The files are read once,
+    on the first call.
+
+    Returns:
+        str: a hex digest
+    """
+    global _kb_fingerprint
+    if _kb_fingerprint is None:
+        digest = blake2b(digest_size=16)
+        for name in _KB_MODULES:
+            digest.update((Path(__file__).parent / f'{name}.py').read_bytes())
+        _kb_fingerprint = digest.hexdigest()
+    return _kb_fingerprint
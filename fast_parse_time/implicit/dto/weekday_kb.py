@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Symbolic weekday slots: 'next friday' and 'last monday' are found without
+# reading the clock.
+#
+# The DigitTextReplacer rewrites a weekday reference as a day count whose
+# cardinality is a symbolic token:
+#     'next friday', 'this fri', 'coming friday' -> ['next:friday', 'days', 'from', 'now']
+#     'last friday', 'past fri'                  -> ['last:friday', 'days', 'ago']
+# so it takes part in sequences exactly like a digit would ('in next:friday
+# days from now' is trimmed to its slot, compounds still split on it).
+#
+# The slots below mirror the day slots of a digit cardinality; the solution
+# keeps the symbolic cardinality, and ResolveTimeReferences.resolve_weekday
+# turns it into a day count from a reference date once extraction is done.
+#
+# Related GitHub Issues:
+#     #11 - Gap: named weekday references not supported (next friday, last monday)
+#           https://github.com/craigtrim/fast-parse-time/issues/11
+#     #12 - feat: Support forward day-of-week references (next Friday, next Monday)
+#           https://github.com/craigtrim/fast-parse-time/issues/12
+
+from .index_by_slot_kb import Slot
+
+
+# ISO order: WEEKDAYS[date.weekday()]
+WEEKDAYS = (
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+)
+
+WEEKDAY_FRAME = 'weekday'
+
+# 'next:friday' counts forward to the coming Friday, 'last:friday' back to the previous one
+WEEKDAY_DIRECTIONS = ('next', 'last')
+
+WEEKDAY_TOKENS = frozenset(
+    f'{direction}:{weekday}'
+    for direction in WEEKDAY_DIRECTIONS
+    for weekday in WEEKDAYS
+)
+
+# the day slots of a digit cardinality ('2 days ago' -> Slot(2, 'day', 'past'))
+_DAY_SLOT_TEMPLATES = {
+    '{} days ago': 'past',
+    '{} days back': 'past',
+    '{} days before now': 'past',
+    '{} days prior': 'past',
+    'last {} days': 'past',
+    'past {} days': 'past',
+    '{} days from now': 'future',
+    'in {} days': 'future',
+    'next {} days': 'future',
+}
+
+d_weekday_slot_kb = {
+    template.format(token): Slot(token, WEEKDAY_FRAME, tense)
+    for token in sorted(WEEKDAY_TOKENS)
+    for template, tense in _DAY_SLOT_TEMPLATES.items()
+}
@@ -4,14 +4,26 @@
 
 
 import re
+import logging
+from datetime import date
 from typing import Optional
-from baseblock import ServiceEventGenerator
 
-from fast_parse_time.core import configure_logger, Stopwatch
+from fast_parse_time.core import (
+    AnchorWindows,
+    build_alternation,
+    configure_logger,
+    get_event_sink,
+    stage,
+    Stopwatch,
+)
+from fast_parse_time.core.metrics import METRICS
+from fast_parse_time.implicit.dto import WEEKDAY_FRAME, WEEKDAY_TOKENS, d_keyterm_counter_kb
 from fast_parse_time.implicit.dmo import DigitTextReplacer
+from fast_parse_time.implicit.dmo import NumberWordParser
 from fast_parse_time.implicit.dmo import KeywordSequenceFilter
 from fast_parse_time.implicit.dmo import KeywordSequenceExtractor
 from fast_parse_time.implicit.dmo import SequenceSolutionFinder
+from fast_parse_time.implicit.svc.resolve_time_references import ResolveTimeReferences
 
 
 # All recognized time unit words (singular, plural, abbreviated forms)
@@ -63,19 +75,80 @@ _COMPACT_UNIT_MAP = {
 #   (\d+(?:\.\d+)?) - one or more digits, optionally followed by decimal point and digits
 #   (mo|min|d|w|m|y|h|s) - unit letter(s), ordered by length (mo and min before m and s)
 #   \b         - word boundary
+#   (?=\s+(ago|back|before)\b) - optional lookahead capturing a following tense
+#                marker (case-sensitive), so no second match is needed per token
 # Related GitHub Issues:
 #     #57 - Support compact number+letter unit tokens (1d, 2y) in relative time parsing
+#     #58 - Support 'before' as past-tense marker and singular uninflected time frames
 #     #59 - Support decimal/float cardinalities in relative time expressions
 #     https://github.com/craigtrim/fast-parse-time/issues/59
 _COMPACT_TOKEN_PATTERN = re.compile(
-    r'\b(\d+(?:\.\d+)?)(mo|min|d|w|m|y|h|s)\b',
+    r'\b(\d+(?:\.\d+)?)(mo|min|d|w|m|y|h|s)\b'
+    r'(?:(?=(?-i:\s+\b(ago|back|before)\b))|)',
     re.IGNORECASE
 )
 
+# Anchor-window extraction (see AnalyzeTimeReferences.anchor_windows).
+# Sequences are contiguous keyterm runs, so any token the normalizer leaves as a
+# non-keyterm separates them.  A window covers the whole run around an anchor;
+# context only has to cover phrases glued to a neighbouring token ('xhalf an
+# hour') and the tense marker after a compact token.
+_ANCHOR_CONTEXT_TOKENS = 2
+
+# Run members too common to anchor a window.  No slot in the KB is made of
+# these words and numbers alone (the normalizer turns 'a', 'several', 'twelve'
+# into digits), so a run without any other token never has a solution; the
+# rest of a phrase ('the day before yesterday', 'half an hour') is kept by the
+# run of its other words.
+_WEAK_WORDS = frozenset(
+    {'a', 'an', 'in', 'of', 'from', 'this', 'coming', 'the', 'to', 'after', 'half', 'and'}
+    | NumberWordParser.WORDS
+    | set(DigitTextReplacer.INFORMAL_QUANTITIES))
+
+
+# ASCII digits and commas to spaces, for AnalyzeTimeReferences.has_word_anchor
+_DIGITS_AND_COMMAS = str.maketrans('0123456789,', ' ' * 11)
+
+# Sequence memo: extracted sequence (token tuple) -> [filtered sequence or None,
+# solution or None].  Documents share few sequences ('5 days ago', 'last week')
+# among many, so this saves the KB lookups and keyterm set intersections of
+# most sequences even when no two documents are alike.  The solution is
+# _UNSOLVED until a lookup first needs it.  Sequences hold no reference-date
+# dependent values (weekday references stay symbolic), so entries never expire.
+_SEQUENCE_MEMO: dict[tuple, list] = {}
+_MAX_SEQUENCE_MEMO = 2 ** 16
+_UNSOLVED = object()
+
+
+def _compile_anchor_pattern(words: set) -> re.Pattern:
+    """Matches a whole token that is one of words, a number or that the normalizer acts on."""
+    number_word = build_alternation(NumberWordParser.WORDS)
+    single_word_phrases = build_alternation(
+        phrase for phrase, _ in DigitTextReplacer.PHRASE_REPLACEMENTS if ' ' not in phrase)
+
+    return re.compile(
+        rf'{build_alternation(words)},*'
+        rf'|{number_word}(?:-{number_word})+,*'
+        r'|,+'   # comma-only tokens are dropped, joining their neighbours
+        # digits, non-ASCII word characters (lowercasing may map them to a
+        # keyterm), or a one-word phrase glued to other characters
+        rf'|\S*?(?:[^\W_a-zA-Z]|{single_word_phrases})\S*',
+        re.IGNORECASE)
+
+
+def _compile_anchor_patterns() -> tuple[re.Pattern, re.Pattern]:
+    """(anchor, run member) patterns for AnalyzeTimeReferences.anchor_windows."""
+    # digit keyterms are matched through the digit branch
+    members = {word for word in set(d_keyterm_counter_kb) | DigitTextReplacer.vocabulary()
+               if not word.isdecimal()}
+    return _compile_anchor_pattern(members - _WEAK_WORDS), _compile_anchor_pattern(members)
+
 
 class AnalyzeTimeReferences(object):
     """ Analyze Time References in Text """
 
+    __anchor_patterns: tuple[re.Pattern, re.Pattern] = None
+
     def __init__(self):
         """ Change Log
 
@@ -87,21 +160,74 @@ class AnalyzeTimeReferences(object):
             craigtrim@gmail.com
             *   Add compound multi-unit expression support
                 https://github.com/craigtrim/fast-parse-time/issues/20
+            19-Oct-2026
+            craigtrim@gmail.com
+            *   Event records are only generated when an event sink is registered
+            *   Compact tokens are expanded in one pass with the tense-marker
+                lookahead folded into the token pattern
+            *   Weekday references are extracted as symbolic slots and resolved
+                against a reference date in process(); _process never reads the clock
+            *   Filtered sequences and their solutions are memoized per sequence
+            *   has_word_anchor tells log templates which lines need no relative pass
         """
         self.logger = configure_logger(__name__)
-        self._generate_event = ServiceEventGenerator().process
 
         self._digit_replacer = DigitTextReplacer().process
         self._filter_sequences = KeywordSequenceFilter().process
         self._extract_sequences = KeywordSequenceExtractor().process
         self._find_solutions = SequenceSolutionFinder().process
 
+    @classmethod
+    def anchor_windows(cls, input_text: str) -> AnchorWindows:
+        """Reduce input text to the windows the relative pipeline can match in.
+
+        Anchors are digits, keyterms and words the normalizer acts on, except
+        the most common ones ('a', 'in', 'of', ...).  Each window covers the run
+        of such tokens around its anchor, so process() finds the same
+        solutions in the reduced text as in the input.
+
+        Args:
+            input_text (str): the text to reduce
+
+        Returns:
+            AnchorWindows: the reduced text is AnchorWindows.text
+        """
+        if cls.__anchor_patterns is None:
+            cls.__anchor_patterns = _compile_anchor_patterns()
+        anchor_pattern, run_pattern = cls.__anchor_patterns
+        return AnchorWindows(input_text, anchor_pattern, _ANCHOR_CONTEXT_TOKENS,
+                             run_pattern=run_pattern)
+
+    @classmethod
+    def has_word_anchor(cls, input_text: str) -> bool:
+        """Return True if the text has an anchor other than its ASCII digits.
+
+        Without one, the numbers of the text can only form runs with the most
+        common words (see _WEAK_WORDS), which never have a solution: process()
+        finds nothing in the text, whatever its digits.  A compact token
+        ('5d', '2h') counts as a word anchor.
+
+        Args:
+            input_text (str): the text to test
+
+        Returns:
+            bool: False if every line that differs from the text only in its
+            ASCII digits has no relative time reference
+        """
+        if _COMPACT_TOKEN_PATTERN.search(input_text):
+            return True
+        if cls.__anchor_patterns is None:
+            cls.__anchor_patterns = _compile_anchor_patterns()
+        anchor_pattern = cls.__anchor_patterns[0]
+        return any(anchor_pattern.fullmatch(token)
+                   for token in set(input_text.translate(_DIGITS_AND_COMMAS).split()))
+
     @staticmethod
     def _is_numeric(token: str) -> bool:
-        """Return True if token is an integer or decimal digit string."""
+        """Return True if token is an integer or decimal digit string, or a weekday count."""
         return token.isdigit() or (
             '.' in token and token.replace('.', '', 1).isdigit()
-        )
+        ) or token in WEEKDAY_TOKENS
 
     @staticmethod
     def _expand_compact_tokens(input_text: str) -> str:
@@ -128,47 +254,65 @@ class AnalyzeTimeReferences(object):
             #57 - Support compact number+letter unit tokens (1d, 2y) in relative time parsing
             https://github.com/craigtrim/fast-parse-time/issues/57
         """
-        # Pattern to detect if a tense marker follows the compact token
-        # Looks for: compact token + optional whitespace + tense marker
-        # Related GitHub Issue:
-        #     #58 - Support 'before' as past-tense marker and singular uninflected time frames
-        #     https://github.com/craigtrim/fast-parse-time/issues/58
-        tense_markers_pattern = r'\b(ago|back|before)\b'
+        return AnalyzeTimeReferences._expand_compact_tokens_with_offsets(input_text)[0]
 
-        def replace_compact_token(match):
-            """Replace a compact token with expanded form."""
-            cardinality_str = match.group(1)
-            unit_letter = match.group(2).lower()
-            match_end = match.end()
+    @staticmethod
+    def _expand_compact_tokens_with_offsets(input_text: str) -> tuple[str, list]:
+        """Expand compact tokens in one pass and record where each expansion went.
+
+        Args:
+            input_text (str): input text that may contain compact tokens
+
+        Returns:
+            tuple[str, list]: the expanded text, and one
+            (start, end, expanded_start, expanded_end) tuple per expanded token,
+            mapping its span in input_text to its span in the expanded text
+        """
+        pieces = []
+        offsets = []
+        position = 0        # end of the previous match in input_text
+        length = 0          # length of the expanded text built so far
+
+        for match in _COMPACT_TOKEN_PATTERN.finditer(input_text):
+            cardinality_str, unit_letter, tense_marker = match.groups()
 
             # Reject zero cardinality (truncate decimal to int first)
-            cardinality = int(float(cardinality_str))
+            try:
+                cardinality = int(float(cardinality_str))
+            except OverflowError:
+                continue  # a digit run too long to be a float is not a duration
             if cardinality == 0:
-                return match.group(0)  # return original token unchanged
+                continue  # leave the original token unchanged
 
             # Map unit letter to full unit name (singular form)
-            unit_name = _COMPACT_UNIT_MAP.get(unit_letter)
+            unit_name = _COMPACT_UNIT_MAP.get(unit_letter.lower())
             if not unit_name:
-                return match.group(0)  # return original if no mapping found
+                continue
 
             # Pluralize unit name if cardinality > 1
             # Standard pluralization: add 's' to the singular form
             if cardinality > 1:
                 unit_name = unit_name + 's'
 
-            # Check if a tense marker follows the compact token
-            remaining_text = input_text[match_end:]
-            has_tense_marker = re.match(r'^\s+(' + tense_markers_pattern + ')', remaining_text)
-
             # If no tense marker follows, add 'ago' for implicit past
-            if has_tense_marker:
-                # Tense marker present, just expand the token
-                return f'{cardinality_str} {unit_name}'
+            if tense_marker:
+                expansion = f'{cardinality_str} {unit_name}'
             else:
-                # No tense marker, add 'ago' for implicit past
-                return f'{cardinality_str} {unit_name} ago'
+                expansion = f'{cardinality_str} {unit_name} ago'
+
+            start, end = match.span()
+            pieces.append(input_text[position:start])
+            length += start - position
+            offsets.append((start, end, length, length + len(expansion)))
+            pieces.append(expansion)
+            length += len(expansion)
+            position = end
+
+        if not offsets:
+            return input_text, offsets
 
-        return _COMPACT_TOKEN_PATTERN.sub(replace_compact_token, input_text)
+        pieces.append(input_text[position:])
+        return ''.join(pieces), offsets
 
     def _extract_compound_sub_tokens(self, tokens: list) -> Optional[list]:
         """Detect and expand a compound multi-unit token list.
@@ -245,9 +389,53 @@ class AnalyzeTimeReferences(object):
         Returns:
             list: solutions found (0 or 1 entries)
         """
-        seqs = self._extract_sequences(sub_tokens)
-        seqs = self._filter_sequences(seqs)
-        return self._find_solutions(seqs)
+        entries = self._memo_entries(self._extract_sequences(sub_tokens))
+        return self._memo_solutions(entries)
+
+    def _memo_entries(self, sequences: list) -> list:
+        """Return the memo entry of each sequence, filtering the sequences not seen before.
+
+        Args:
+            sequences (list): extracted keyterm sequences
+
+        Returns:
+            list: one [filtered sequence or None, solution] entry per sequence
+        """
+        memo = _SEQUENCE_MEMO
+        entries = []
+        misses = 0
+        for sequence in sequences:
+            key = tuple(sequence)
+            entry = memo.get(key)
+            if entry is None:
+                misses += 1
+                filtered = self._filter_sequences([sequence])
+                entry = [filtered[0] if filtered else None, _UNSOLVED]
+                if len(memo) >= _MAX_SEQUENCE_MEMO:
+                    # the oldest entry; another thread may have taken it already
+                    memo.pop(next(iter(memo), None), None)
+                memo[key] = entry
+            entries.append(entry)
+
+        if METRICS.enabled and sequences:
+            METRICS.inc('fast_parse_time_cache_requests', ('relative_sequences', 'hit'),
+                        len(sequences) - misses)
+            METRICS.inc('fast_parse_time_cache_requests', ('relative_sequences', 'miss'), misses)
+        return entries
+
+    def _memo_solutions(self, entries: list) -> list:
+        """Return the solutions of the memo entries, finding those not found before."""
+        solutions = []
+        for entry in entries:
+            filtered, solution = entry
+            if filtered is None:
+                continue
+            if solution is _UNSOLVED:
+                found = self._find_solutions([filtered])
+                solution = entry[1] = found[0] if found else None
+            if solution is not None:
+                solutions.append(solution)
+        return solutions
 
     def _process(self,
                  input_text: str) -> dict:
@@ -256,17 +444,23 @@ class AnalyzeTimeReferences(object):
         # Related GitHub Issue:
         #     #57 - Support compact number+letter unit tokens (1d, 2y) in relative time parsing
         #     https://github.com/craigtrim/fast-parse-time/issues/57
-        input_text = self._expand_compact_tokens(input_text)
+        with stage('relative.expand_compact_tokens'):
+            input_text = self._expand_compact_tokens(input_text)
 
         tokens = input_text.lower().strip().split()
 
-        tokens = self._digit_replacer(tokens)
+        with stage('relative.digit_text_replacer'):
+            tokens = self._digit_replacer(tokens)
 
         # Extract sequences before KB filtering (needed for compound detection below)
-        all_sequences = self._extract_sequences(tokens)
+        with stage('relative.extract_sequences'):
+            all_sequences = self._extract_sequences(tokens)
 
-        sequences = self._filter_sequences(all_sequences)
-        solutions = self._find_solutions(sequences)
+        with stage('relative.filter_sequences'):
+            entries = self._memo_entries(all_sequences)
+            sequences = [list(entry[0]) for entry in entries if entry[0] is not None]
+        with stage('relative.find_solutions'):
+            solutions = self._memo_solutions(entries)
 
         # --- Compound expansion ---
         # For each sequence that didn't resolve via the normal pipeline, attempt
@@ -284,11 +478,14 @@ class AnalyzeTimeReferences(object):
         #     #20 - Gap: compound multi-unit expressions not supported
         #     https://github.com/craigtrim/fast-parse-time/issues/20
         compound_solutions = []
-        for seq in all_sequences:
-            expanded = self._extract_compound_sub_tokens(seq)
-            if expanded:
-                for sub_tokens in expanded:
-                    compound_solutions.extend(self._solve_sub_tokens(sub_tokens))
+        with stage('relative.compound'):
+            for seq in all_sequences:
+                expanded = self._extract_compound_sub_tokens(seq)
+                if expanded:
+                    if METRICS.enabled:
+                        METRICS.inc('fast_parse_time_compound_expansions')
+                    for sub_tokens in expanded:
+                        compound_solutions.extend(self._solve_sub_tokens(sub_tokens))
 
         # Use compound results when they yield more solutions (handles partial-match bug)
         if len(compound_solutions) > len(solutions):
@@ -301,33 +498,78 @@ class AnalyzeTimeReferences(object):
             'solutions': solutions
         }
 
+    @staticmethod
+    def _resolve_weekdays(solutions: list,
+                          reference: Optional[date]) -> list:
+        """Resolve symbolic weekday slots ('next friday') to day offsets.
+
+        Args:
+            solutions (list): the solutions of _process
+            reference (Optional[date]): the date the text is relative to;
+                today when None.  The clock is only read if a weekday was found
+
+        Returns:
+            list: the solutions, each weekday solution replaced by Slot(days, 'day', tense)
+        """
+        if not any(solution.frame == WEEKDAY_FRAME for solution in solutions):
+            return solutions
+
+        if reference is None:
+            reference = date.today()
+        return [ResolveTimeReferences.resolve_weekday(solution, reference)
+                if solution.frame == WEEKDAY_FRAME else solution
+                for solution in solutions]
+
     def process(self,
-                input_text: str) -> Optional[list]:
-        sw = Stopwatch()
+                input_text: str,
+                reference: Optional[date] = None) -> Optional[list]:
+        """Find the relative time references in the text.
 
-        d_result = self._process(input_text)
+        Extraction (_process) depends on the text alone; only the weekday
+        references ('next friday', 'last monday') depend on the reference date,
+        and are resolved against it at the end.
 
-        # COR-80; Generate an Event Record
-        d_event = self._generate_event(
-            service_name=__name__,
-            event_name='analyze-time-references',
-            stopwatch=sw,
-            data=d_result)
+        Args:
+            input_text (str): the text to analyze
+            reference (Optional[date]): the date weekday references are relative
+                to (a datetime works too); today when None
 
-        if not d_result['solutions'] or not len(d_result['solutions']):
-            self.logger.debug('\n'.join([
-                'No Solutions Found',
-                f'\tTotal Time: {str(sw)}',
-                f'\tInput Text: {input_text}']))
+        Returns:
+            dict: 'result' is the list of solutions, 'events' the event records
+        """
+        event_sink = get_event_sink()
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        sw = Stopwatch() if event_sink or is_debug else None
 
-        else:
-            self.logger.debug('\n'.join([
-                'Time Reference Solutions Found',
-                f'\tTotal Time: {str(sw)}',
-                f'\tInput Text: {input_text}',
-                f"\tTotal Solutions: {len(d_result['solutions'])}"]))
+        d_result = self._process(input_text)
+        d_result['solutions'] = self._resolve_weekdays(d_result['solutions'], reference)
+
+        # COR-80; Generate an Event Record (only when a sink is installed)
+        events = []
+        if event_sink:
+            d_event = event_sink(
+                service_name=__name__,
+                event_name='analyze-time-references',
+                stopwatch=sw,
+                data=d_result)
+            if d_event is not None:
+                events.append(d_event)
+
+        if is_debug:
+            if not d_result['solutions'] or not len(d_result['solutions']):
+                self.logger.debug('\n'.join([
+                    'No Solutions Found',
+                    f'\tTotal Time: {str(sw)}',
+                    f'\tInput Text: {input_text}']))
+
+            else:
+                self.logger.debug('\n'.join([
+                    'Time Reference Solutions Found',
+                    f'\tTotal Time: {str(sw)}',
+                    f'\tInput Text: {input_text}',
+                    f"\tTotal Solutions: {len(d_result['solutions'])}"]))
 
         return {
             'result': d_result['solutions'],
-            'events': [d_event]
+            'events': events
         }
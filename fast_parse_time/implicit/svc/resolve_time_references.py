@@ -3,10 +3,14 @@
 """ Resolve Time Solutions Located in the Text """
 
 
+import logging
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
 
 from fast_parse_time.core import configure_logger, Stopwatch
+from fast_parse_time.implicit.dto import WEEKDAYS
+from fast_parse_time.implicit.dto.index_by_slot_kb import Slot
 
 
 class ResolveTimeReferences(object):
@@ -21,6 +25,31 @@ class ResolveTimeReferences(object):
         """
         self.logger = configure_logger(__name__)
 
+    @staticmethod
+    def resolve_weekday(solution: Slot, reference: date) -> Slot:
+        """Turn a symbolic weekday solution into a day count from the reference date.
+
+        On a Sunday:
+            Slot('next:friday', 'weekday', 'future') → Slot(5, 'day', 'future')
+            Slot('last:monday', 'weekday', 'past')   → Slot(6, 'day', 'past')
+
+        The count is always 1-7: 'next' never means today, and neither does 'last'.
+
+        Args:
+            solution (Slot): a solution with a WEEKDAY_TOKENS cardinality
+            reference (date): the date the text is relative to
+
+        Returns:
+            Slot: Slot(days, 'day', tense)
+        """
+        direction, weekday = solution.cardinality.split(':')
+        target_wd = WEEKDAYS.index(weekday)
+        if direction == 'next':
+            days = (target_wd - reference.weekday()) % 7
+        else:
+            days = (reference.weekday() - target_wd) % 7
+        return Slot(days or 7, 'day', solution.tense)
+
     @staticmethod
     def _get_timedelta(solution: list) -> timedelta:
         x = solution.cardinality
@@ -67,19 +96,21 @@ class ResolveTimeReferences(object):
                 solutions: list,
                 current_time: datetime) -> str | None:
 
-        sw = Stopwatch()
-
         if not solutions or not len(solutions):
             return None
 
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        sw = Stopwatch() if is_debug else None
+
         new_time = self._process(solutions=solutions,
                                  current_time=current_time)
 
-        self.logger.debug('\n'.join([
-            'Time Resolution Completd',
-            f'\tTotal Time: {str(sw)}',
-            f'\tTotal Solutions:  {len(solutions)}',
-            f'\tInput Time: {current_time}',
-            f'\tOutput Time: {new_time}']))
+        if is_debug:
+            self.logger.debug('\n'.join([
+                'Time Resolution Completd',
+                f'\tTotal Time: {str(sw)}',
+                f'\tTotal Solutions:  {len(solutions)}',
+                f'\tInput Time: {current_time}',
+                f'\tOutput Time: {new_time}']))
 
         return new_time
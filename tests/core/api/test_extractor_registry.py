@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the explicit extractor registry, its triggers and the scheduler."""
+
+import re
+
+import pytest
+
+from fast_parse_time import (
+    ExplicitExtractor,
+    extract_explicit_dates,
+    parse_dates,
+    register_extractor,
+    unregister_extractor,
+)
+from fast_parse_time.explicit.bp import EXPLICIT_EXTRACTORS, ExtractorRegistry
+from fast_parse_time.explicit.dmo import DocumentFingerprint
+from fast_parse_time.explicit.dmo import document_fingerprint
+from fast_parse_time.explicit.dto import default_config
+from fast_parse_time.explicit.svc import normalize_text
+
+
+QUARTER = re.compile(r'\bQ[1-4] \d{4}\b')
+
+SAMPLES = [
+    'Meeting on 04/08/2024 about issues from 5 days ago',
+    'The contract was signed on March 3, 2025 and renewed in 2026.',
+    'Released Oct-23, reviewed 2023-Oct, shipped in Oct 23',
+    'Deployed 2017-02-03T09:04:08Z on the 12th day of December, 2001',
+    'Revenue grew from 2014 to 2016 and between 2010 and 2020, 2025-26',
+    'the 3rd of March, Dec 12th, 15th March 2018 and on Oct 23',
+    'we may decide on the market junior decimal',
+    'ſep-23 ıan 2020 ＭＡＲ 2020 １２/０５/２０２０ 3RD OF MARCH',
+    'nothing to see here',
+    '',
+]
+
+
+def _extract_quarters(text: str) -> dict:
+    return {m.group(): 'QUARTER' for m in QUARTER.finditer(text)}
+
+
+@pytest.fixture
+def quarters():
+    register_extractor(ExplicitExtractor(
+        'extract_quarters', _extract_quarters, precedence=80,
+        trigger=lambda fingerprint: 'Q' in fingerprint.text))
+    yield
+    unregister_extractor('extract_quarters')
+
+
+class TestDocumentFingerprint:
+
+    def test_features(self):
+        fingerprint = DocumentFingerprint('filed in 2019-03-05T10:00:00Z on the 3rd')
+        assert fingerprint.has('numeric')
+        assert fingerprint.has('year_digits')
+        assert fingerprint.has('iso_time')
+        assert fingerprint.has('ordinal')
+        assert fingerprint.has('hyphen')
+        assert not fingerprint.has('month_name')
+
+    def test_month_name_ignores_case(self):
+        assert DocumentFingerprint('DECIDED').has('month_name')
+        assert DocumentFingerprint('ſep-23').has('month_name')
+        assert not DocumentFingerprint('ſ ep').has('month_name')
+
+    def test_unknown_feature(self):
+        with pytest.raises(KeyError):
+            DocumentFingerprint('text').has('weekday')
+
+    def test_custom_lexicon(self):
+        lexicon = frozenset({'mär', 'märz'})
+        assert DocumentFingerprint('am 3. März', lexicon).has('month_name')
+        assert not DocumentFingerprint('on 3 March', lexicon).has('month_name')
+
+    def test_custom_lexicons_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(document_fingerprint, '_FEATURES_BY_LEXICON', {})
+        for i in range(document_fingerprint._MAX_LEXICONS + 10):
+            assert DocumentFingerprint(f'month{i}', frozenset({f'month{i}'})).has('month_name')
+        assert len(document_fingerprint._FEATURES_BY_LEXICON) == document_fingerprint._MAX_LEXICONS
+
+
+class TestBuiltinTriggers:
+
+    @pytest.mark.parametrize('text', SAMPLES)
+    def test_trigger_is_necessary(self, text):
+        """An extractor that would find something is never skipped."""
+        text = normalize_text(text)
+        fingerprint = DocumentFingerprint(text)
+        for extractor in EXPLICIT_EXTRACTORS.extractors:
+            if not extractor.trigger(fingerprint):
+                assert not extractor.extract(text, default_config()), extractor.name
+
+    def test_only_triggered_extractors_are_scheduled(self):
+        scheduled = EXPLICIT_EXTRACTORS.schedule(DocumentFingerprint('filed in 2019'))
+        assert [e.name for e in scheduled] == ['extract_numeric_dates', 'extract_prose_year']
+
+    def test_nothing_scheduled_without_digits(self):
+        assert EXPLICIT_EXTRACTORS.schedule(DocumentFingerprint('we may decide in march')) == []
+
+
+class TestCustomExtractors:
+
+    def test_registered_extractor_runs(self, quarters):
+        assert extract_explicit_dates('Q3 2024 closed on 04/08/2024') == {
+            '04/08/2024': 'FULL_EXPLICIT_DATE', 'Q3 2024': 'QUARTER'}
+        assert [d.text for d in parse_dates('Q3 2024 closed on 04/08/2024').explicit_dates] == [
+            '04/08/2024', 'Q3 2024']
+
+    def test_unregister_restores_builtins(self, quarters):
+        unregister_extractor('extract_quarters')
+        try:
+            assert extract_explicit_dates('Q3 2024 closed on 04/08/2024') == {
+                '04/08/2024': 'FULL_EXPLICIT_DATE'}
+        finally:
+            register_extractor(ExplicitExtractor(
+                'extract_quarters', _extract_quarters, precedence=80))
+
+    def test_duplicate_name(self, quarters):
+        with pytest.raises(ValueError):
+            register_extractor(ExplicitExtractor('extract_quarters', _extract_quarters, 90))
+
+    def test_unregister_unknown(self):
+        with pytest.raises(KeyError):
+            unregister_extractor('extract_nothing')
+
+    def test_trigger_false_skips_extractor(self):
+        calls = []
+        registry = ExtractorRegistry([ExplicitExtractor(
+            'spy', lambda text: calls.append(text), 10,
+            trigger=lambda fingerprint: fingerprint.has('numeric'))])
+        registry.run('no digits here')
+        registry.run('one digit: 7')
+        assert calls == ['one digit: 7']
+
+
+class TestMerge:
+
+    def _registry(self, overwrite: bool) -> ExtractorRegistry:
+        return ExtractorRegistry([
+            ExplicitExtractor('second', lambda text: {'a': 'SECOND', 'c': 'SECOND'}, 20,
+                              overwrite=overwrite),
+            ExplicitExtractor('first', lambda text: {'a': 'FIRST', 'b': 'FIRST'}, 10),
+        ])
+
+    def test_higher_precedence_overwrites(self):
+        result = self._registry(overwrite=True).run('text')
+        assert list(result.items()) == [('a', 'SECOND'), ('b', 'FIRST'), ('c', 'SECOND')]
+
+    def test_fill_only(self):
+        result = self._registry(overwrite=False).run('text')
+        assert list(result.items()) == [('a', 'FIRST'), ('b', 'FIRST'), ('c', 'SECOND')]
+
+    def test_deadline_runs_first_then_cheapest(self):
+        calls = []
+
+        def extractor(name: str):
+            return lambda text: calls.append(name) or {name: name}
+
+        registry = ExtractorRegistry([
+            ExplicitExtractor('first', extractor('first'), 10, cost=100),
+            ExplicitExtractor('costly', extractor('costly'), 20, cost=50),
+            ExplicitExtractor('cheap', extractor('cheap'), 30, cost=1),
+        ])
+        remaining = iter([False, True])
+        result = registry.run('text', is_out_of_time=lambda: next(remaining))
+        assert calls == ['first', 'cheap']
+        assert list(result) == ['first', 'cheap']
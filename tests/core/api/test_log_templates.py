@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for log-template-aware extraction in parse_dates_batch."""
+
+import re
+import random
+from datetime import datetime
+
+import pytest
+
+from fast_parse_time import (
+    DedupeTable,
+    ExplicitExtractor,
+    ParserConfig,
+    parse_dates,
+    parse_dates_batch,
+    register_extractor,
+    unregister_extractor,
+)
+from fast_parse_time import api
+from fast_parse_time.explicit.bp import LogTemplate
+
+
+SUNDAY = datetime(2026, 10, 18)
+
+TEMPLATES = [
+    'job 1842 finished in 35 ms status=200',
+    'invoice 55120 dated 04/08/2024 for client 12',
+    '2024-03-15T10:22:31Z worker 7 renewed, expires 12/31/2025',
+    'revenue grew from 2014 to 2016 in shard 3',
+    'build 881 released in 2019, patched 2020-21',
+    'filed 13/25/2024 by node 4',
+    'nothing but 3 numbers 41 and 5926',
+    'reviewed on March 3, 2025 by reviewer 12',
+    'job 77 will retry in 5 minutes',
+]
+
+QUARTER = re.compile(r'\bQ[1-4] \d{4}\b')
+
+
+def _values(results):
+    return [(r.explicit_dates, r.relative_times) for r in results]
+
+
+def _variants(text: str, count: int, seed: int = 7) -> list[str]:
+    """The text with its digits replaced at random, as the lines of one template."""
+    rng = random.Random(f'{seed}:{text}')
+    return [re.sub(r'\d', lambda _: str(rng.randint(0, 9)), text) for _ in range(count)]
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """The texts parse_dates_batch parsed in full."""
+    texts = []
+    parse = api.parse_dates
+    monkeypatch.setattr(api, 'parse_dates', lambda text, **kwargs: texts.append(text) or parse(text, **kwargs))
+    return texts
+
+
+class TestLogTemplates:
+
+    @pytest.mark.parametrize('config', [None, ParserConfig(min_year=1800, day_first=True)])
+    def test_same_as_parse_dates(self, config):
+        lines = [line for text in TEMPLATES for line in _variants(text, 40)]
+        result = parse_dates_batch(lines, log_templates=True, config=config, reference=SUNDAY)
+        expected = [parse_dates(line, config=config, reference=SUNDAY) for line in lines]
+        assert _values(result) == _values(expected)
+
+    def test_lines_of_a_template_are_replayed(self, parsed):
+        lines = ['job 1842 done 2024-03-15T10:22:31Z', 'job 1907 done 2024-03-16T08:00:00Z',
+                 'job 2210 done 2024-03-17T11:45:09Z']
+        result = parse_dates_batch(lines, log_templates=True)
+        assert parsed == []
+        assert [[d.text for d in r.explicit_dates] for r in result] == [
+            ['2024-03-15'], ['2024-03-16'], ['2024-03-17']]
+
+    def test_invalid_numbers_are_still_checked(self):
+        first, second = parse_dates_batch(['filed 04/08/2024 by node 4', 'filed 14/38/2024 by node 4'],
+                                          log_templates=True)
+        assert [d.text for d in first.explicit_dates] == ['04/08/2024']
+        assert second.explicit_dates == []
+
+    @pytest.mark.parametrize('text', [
+        'reviewed on March 3, 2025 by reviewer 12',
+        'job 77 will retry in 5 minutes',
+    ])
+    def test_month_names_and_relative_words_are_parsed_in_full(self, text, parsed):
+        lines = _variants(text, 5)
+        templates = DedupeTable()
+        parse_dates_batch(lines, templates=templates, reference=SUNDAY)
+        assert parsed == lines
+        assert templates.get((LogTemplate.signature(text), api.default_config())) is api._NO_TEMPLATE
+
+    def test_templates_table_is_reused(self, parsed):
+        templates = DedupeTable()
+        parse_dates_batch(['job 1842 finished in 2019'], templates=templates)
+        parse_dates_batch(['job 5521 finished in 2021'], templates=templates)
+        assert parsed == []
+        assert templates.stats()['entries'] == 1
+
+    def test_registered_extractor_is_relearned(self):
+        templates = DedupeTable()
+        before, = parse_dates_batch(['job 1842 closed Q3 2025'], templates=templates)
+        register_extractor(ExplicitExtractor(
+            'extract_quarters', lambda text: {m.group(): 'QUARTER' for m in QUARTER.finditer(text)},
+            precedence=80, trigger=lambda fingerprint: 'Q' in fingerprint.text))
+        try:
+            after, = parse_dates_batch(['job 1907 closed Q4 2025'], templates=templates)
+        finally:
+            unregister_extractor('extract_quarters')
+        assert 'Q3 2025' not in [d.text for d in before.explicit_dates]
+        assert 'Q4 2025' in [d.text for d in after.explicit_dates]
+
+    def test_requires_dedupe(self):
+        with pytest.raises(ValueError):
+            parse_dates_batch(TEMPLATES, dedupe=False, log_templates=True)
+
+
+class TestLogTemplate:
+
+    def test_signature(self):
+        assert LogTemplate.signature('job 1842 at 10:22') == LogTemplate.signature('job 9031 at 07:05')
+        assert LogTemplate.signature('job 1842') != LogTemplate.signature('job 184')
+
+    def test_extract(self):
+        template = LogTemplate.learn('job 1842 done 2024-03-15T10:22:31Z')
+        assert template.extract('job 1907 done 2024-03-16T08:00:00Z') == {'2024-03-16': 'FULL_EXPLICIT_DATE'}
+
+    def test_prose_year(self):
+        template = LogTemplate.learn('revenue grew from 2014 to 2016')
+        for text in _variants('revenue grew from 2014 to 2016', 20):
+            assert template.extract(text) == (api.extract_explicit_dates(text) or {})
+
+    @pytest.mark.parametrize('text', ['reviewed on March 3, 2025', 'revenue 2014 \u2013 2016'])
+    def test_not_learned(self, text):
+        assert LogTemplate.learn(text) is None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for parse_dates_batch and the dedupe table behind it."""
+
+from datetime import datetime
+
+import pytest
+
+from fast_parse_time import (
+    DedupeTable,
+    ParserConfig,
+    enable_metrics,
+    disable_metrics,
+    metrics_snapshot,
+    parse_dates,
+    parse_dates_batch,
+    reset_metrics,
+)
+
+
+SUNDAY = datetime(2026, 10, 18)
+
+LINES = [
+    'job 1842 failed 5 days ago',
+    'invoice dated 04/08/2024 is overdue',
+    'nothing to report',
+    'ship it next friday',
+    'March 3, 2025 and renewed in 2026',
+]
+
+
+def _values(result):
+    return result.explicit_dates, result.relative_times
+
+
+class TestResults:
+
+    def test_same_as_parse_dates(self):
+        results = parse_dates_batch(LINES * 3, reference=SUNDAY)
+        assert [_values(r) for r in results] == [
+            _values(parse_dates(text, reference=SUNDAY)) for text in LINES * 3]
+
+    def test_without_dedupe(self):
+        results = parse_dates_batch(LINES * 2, dedupe=False, reference=SUNDAY)
+        assert results[0] is not results[len(LINES)]
+        assert [_values(r) for r in results] == [
+            _values(parse_dates(text, reference=SUNDAY)) for text in LINES * 2]
+
+    def test_duplicates_share_a_result(self):
+        results = parse_dates_batch(['filed 5 days ago', '  filed\t5 days  ago\n', 'filed 6 days ago'])
+        assert results[0] is results[1]
+        assert results[0] is not results[2]
+
+    def test_spans_come_from_normalized_text(self):
+        results = parse_dates_batch(['on Jun\n20,\n2011'])
+        assert [d.text for d in results[0].explicit_dates] == ['Jun 20, 2011']
+
+    def test_config(self):
+        config = ParserConfig(min_year=1800)
+        assert [d.text for d in parse_dates_batch(['in 1850'], config=config)[0].explicit_dates] == ['1850']
+        assert parse_dates_batch(['in 1850'])[0].explicit_dates == []
+
+    def test_generator_and_empty_input(self):
+        assert parse_dates_batch(iter([])) == []
+        assert len(parse_dates_batch(text for text in LINES)) == len(LINES)
+
+
+class TestTable:
+
+    def test_stats(self):
+        table = DedupeTable()
+        parse_dates_batch(LINES * 4, table=table)
+        stats = table.stats()
+        assert (stats['entries'], stats['hits'], stats['misses']) == (5, 15, 5)
+        assert stats['evictions'] == 0
+        assert 0 < stats['bytes'] == stats['peak_bytes'] <= stats['max_bytes']
+
+    def test_shared_across_batches(self):
+        table = DedupeTable()
+        first = parse_dates_batch(LINES, table=table, reference=SUNDAY)
+        second = parse_dates_batch(LINES, table=table, reference=SUNDAY)
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_keyed_by_reference_weekday(self):
+        table = DedupeTable()
+        sunday, = parse_dates_batch(['next friday'], table=table, reference=SUNDAY)
+        monday, = parse_dates_batch(['next friday'], table=table, reference=datetime(2026, 10, 19))
+        assert (sunday.relative_times[0].cardinality, monday.relative_times[0].cardinality) == (5, 4)
+
+    def test_bounded(self):
+        table = DedupeTable(max_bytes=4096)
+        texts = [f'job {i} failed {i % 9 + 1} days ago' for i in range(200)]
+        results = parse_dates_batch(texts * 2, table=table)
+        assert table.bytes <= table.max_bytes
+        assert table.evictions > 0
+        assert [_values(r) for r in results] == [_values(parse_dates(t)) for t in texts * 2]
+
+    def test_least_recently_used_is_evicted(self):
+        table = DedupeTable(max_bytes=1000)
+        table.put('a', 1, 300)
+        table.put('b', 2, 300)
+        assert table.get('a') == 1
+        table.put('c', 3, 300)
+        assert (table.get('a'), table.get('b'), table.get('c')) == (1, None, 3)
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            DedupeTable(max_bytes=0)
+
+
+def test_metrics():
+    reset_metrics()
+    enable_metrics()
+    try:
+        parse_dates_batch(['5 days ago'] * 3)
+        samples = metrics_snapshot()['fast_parse_time_cache_requests']['samples']
+        counts = {s['labels']['result']: s['value'] for s in samples
+                  if s['labels']['cache'] == 'batch_dedupe'}
+        assert counts == {'hit': 2, 'miss': 1}
+    finally:
+        disable_metrics()
+        reset_metrics()
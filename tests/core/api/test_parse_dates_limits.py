@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the deadline_ms and max_input_chars options of parse_dates."""
+
+import pytest
+
+from fast_parse_time import parse_dates, enable_metrics, disable_metrics, reset_metrics, metrics_snapshot
+
+
+# a 1 ns budget, spent before the first check
+EXPIRED = 1e-6
+
+
+class TestNotTruncated:
+    """Without limits (or within them) results are unchanged."""
+
+    def test_default_not_truncated(self):
+        result = parse_dates('Meeting on 04/08/2024 about issues from 5 days ago')
+        assert result.truncated is False
+
+    def test_generous_limits_match_unlimited(self):
+        text = 'Meeting on 04/08/2024 about issues from 5 days ago'
+        limited = parse_dates(text, deadline_ms=60_000, max_input_chars=10_000)
+        assert limited.truncated is False
+        assert limited == parse_dates(text)
+
+    def test_text_exactly_at_limit(self):
+        text = 'filed in 2019'
+        result = parse_dates(text, max_input_chars=len(text))
+        assert result.truncated is False
+        assert len(result.explicit_dates) == 1
+
+
+class TestMaxInputChars:
+
+    def test_dates_beyond_limit_are_dropped(self):
+        text = 'Meeting on 04/08/2024 and later on 05/09/2025'
+        result = parse_dates(text, max_input_chars=22)
+        assert result.truncated is True
+        assert [d.text for d in result.explicit_dates] == ['04/08/2024']
+
+    def test_token_at_cut_is_not_split(self):
+        """A date straddling the limit is dropped, not returned as a fragment."""
+        text = 'Meeting on 04/08/2024'
+        result = parse_dates(text, max_input_chars=len(text) - 2)
+        assert result.truncated is True
+        assert result.explicit_dates == []
+
+    def test_single_long_token(self):
+        result = parse_dates('9' * 100_000, max_input_chars=1_000)
+        assert result.truncated is True
+        assert result.has_dates is False
+
+    def test_zero(self):
+        result = parse_dates('filed in 2019', max_input_chars=0)
+        assert result.truncated is True
+        assert result.has_dates is False
+
+    def test_negative(self):
+        with pytest.raises(ValueError):
+            parse_dates('filed in 2019 and 2020', max_input_chars=-1)
+
+
+class TestDeadline:
+
+    @pytest.mark.parametrize('deadline_ms', [0, -1, float('nan')])
+    def test_not_positive(self, deadline_ms):
+        with pytest.raises(ValueError):
+            parse_dates('filed in 2019', deadline_ms=deadline_ms)
+
+    def test_expired_deadline_returns_partial_result(self):
+        result = parse_dates('Meeting on 04/08/2024 about issues from 5 days ago', deadline_ms=EXPIRED)
+        assert result.truncated is True
+        # the first extractor always runs; later stages are skipped
+        assert [d.text for d in result.explicit_dates] == ['04/08/2024']
+        assert result.relative_times == []
+
+    def test_truncations_are_counted(self):
+        enable_metrics()
+        reset_metrics()
+        try:
+            parse_dates('filed in 2019', deadline_ms=EXPIRED)
+            parse_dates('filed in 2019 and 2020', max_input_chars=10)
+            samples = metrics_snapshot()['fast_parse_time_truncated']['samples']
+        finally:
+            disable_metrics()
+            reset_metrics()
+        assert {s['labels']['reason']: s['value'] for s in samples} == {
+            'deadline': 1, 'max_input_chars': 1}
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for ParserConfig and the compiled extractors cached per configuration."""
+
+import dataclasses
+import os
+import pickle
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+
+from fast_parse_time import ParserConfig, extract_explicit_dates, parse_dates
+from fast_parse_time.explicit.bp import ExplicitTimeExtractor
+from fast_parse_time.explicit.bp import explicit_time_extractor
+from fast_parse_time.explicit.dto import MONTH_LEXICON, default_config
+from fast_parse_time.explicit.dto import parser_config
+
+
+NUMERIC_ONLY = frozenset({'extract_numeric_dates'})
+
+
+class TestDefaultConfig:
+
+    def test_year_window_follows_the_calendar(self):
+        year = date.today().year
+        config = default_config()
+        assert (config.min_year, config.max_year) == (year - 100, year + 10)
+        assert default_config() is config
+
+    def test_rolls_over_after_new_year(self, monkeypatch):
+        stale = ParserConfig.for_year(1990)
+        monkeypatch.setattr(parser_config, '_DEFAULT', (0.0, stale))
+        config = default_config()
+        assert config is not stale
+        assert config.max_year == date.today().year + 10
+
+    def test_equals_a_new_config(self):
+        assert ParserConfig() == default_config()
+        assert hash(ParserConfig()) == hash(default_config())
+
+    def test_unpickled_in_another_process(self):
+        # the hash of the month names depends on the process's hash seed
+        config = ParserConfig(min_year=1900, extractors=NUMERIC_ONLY)
+        code = ('import pickle, sys; from fast_parse_time import ParserConfig; '
+                'sys.stdout.buffer.write(pickle.dumps(ParserConfig(min_year=1900, '
+                "extractors=frozenset({'extract_numeric_dates'}))))")
+        for seed in ('7', '123'):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            other = pickle.loads(subprocess.run([sys.executable, '-c', code], env=env,
+                                                capture_output=True, check=True).stdout)
+            assert other == config
+            assert other in {config}
+
+    def test_deprecated_year_constants(self):
+        from fast_parse_time.explicit import dto
+        with pytest.warns(DeprecationWarning):
+            assert dto.MIN_YEAR == default_config().min_year
+        with pytest.warns(DeprecationWarning):
+            assert dto.MAX_YEAR == default_config().max_year
+
+
+class TestValidation:
+
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            default_config().min_year = 1900
+
+    def test_empty_year_window(self):
+        with pytest.raises(ValueError):
+            ParserConfig(min_year=2030, max_year=2020)
+
+    def test_empty_month_name(self):
+        with pytest.raises(ValueError):
+            ParserConfig(month_names=[])
+        with pytest.raises(ValueError):
+            ParserConfig(month_names=['jan', ''])
+
+    @pytest.mark.parametrize('date_delims', [(), ('',), ('//',), ('x',), (' ',), ('_',)])
+    def test_invalid_delimiters(self, date_delims):
+        with pytest.raises(ValueError):
+            ParserConfig(date_delims=date_delims)
+
+    def test_iterables_are_normalized(self):
+        config = ParserConfig(month_names=['Jan', 'FEB'], date_delims=['/'],
+                              extractors=['extract_numeric_dates'])
+        assert config.month_names == frozenset({'jan', 'feb'})
+        assert config.date_delims == ('/',)
+        assert config.extractors == NUMERIC_ONLY
+
+    def test_default_lexicon_is_shared(self):
+        assert ParserConfig(month_names=set(MONTH_LEXICON)).month_names is MONTH_LEXICON
+
+
+class TestYearWindow:
+
+    def test_default_window_rejects_old_years(self):
+        assert extract_explicit_dates('records from 1850 to 1860, filed in 1855') == {}
+
+    def test_wider_window(self):
+        config = ParserConfig(min_year=1800)
+        assert extract_explicit_dates('records from 1850 to 1860, filed in 1855', config=config) == {
+            '1850-1860': 'YEAR_RANGE', '1855': 'YEAR_ONLY'}
+
+    def test_narrower_window(self):
+        config = ParserConfig(min_year=2000, max_year=2010)
+        assert extract_explicit_dates('since 1999, by 2005, in 2011', config=config) == {
+            '2005': 'YEAR_ONLY'}
+
+    def test_numeric_components(self):
+        config = ParserConfig(min_year=1800)
+        assert extract_explicit_dates('born 1850-1860 or 04/08/1850', config=config) == {
+            '04/08/1850': 'FULL_EXPLICIT_DATE', '1850-1860': 'YEAR_RANGE'}
+        assert extract_explicit_dates('born 1850-1860 or 04/08/1850') == {}
+
+
+class TestPolicies:
+
+    @pytest.mark.parametrize('day_first, expected', [
+        (None, 'DAY_MONTH_AMBIGUOUS'),
+        (True, 'DAY_MONTH'),
+        (False, 'MONTH_DAY'),
+    ])
+    def test_day_first(self, day_first, expected):
+        config = ParserConfig(day_first=day_first)
+        assert extract_explicit_dates('due 4/8', config=config) == {'4/8': expected}
+
+    def test_day_first_keeps_unambiguous_dates(self):
+        config = ParserConfig(day_first=False)
+        assert extract_explicit_dates('due 25/12 and 12/25', config=config) == {
+            '25/12': 'DAY_MONTH', '12/25': 'MONTH_DAY'}
+
+    def test_two_digit_years(self):
+        config = ParserConfig(two_digit_years=False)
+        assert extract_explicit_dates('Oct-23 and 2023-Oct', config=config) == {
+            '2023-Oct': 'YEAR_MONTH'}
+
+    def test_date_delims(self):
+        config = ParserConfig(date_delims=('/',))
+        assert extract_explicit_dates('on 15/03/2024 or 15.03.2024', config=config) == {
+            '15/03/2024': 'FULL_EXPLICIT_DATE'}
+
+
+class TestLexicon:
+
+    def test_custom_month_names(self):
+        config = ParserConfig(month_names={'januar', 'mai', 'okt'})
+        assert extract_explicit_dates('Januar-2024, the 3rd of Mai, in Okt 23', config=config) == {
+            'Januar-2024': 'MONTH_YEAR', 'the 3rd of Mai': 'DAY_MONTH', 'Okt 23': 'MONTH_YEAR'}
+
+    def test_custom_month_names_replace_the_default(self):
+        config = ParserConfig(month_names={'januar'})
+        assert extract_explicit_dates('March-2024 and the 3rd of March', config=config) == {}
+
+
+class TestEnabledExtractors:
+
+    def test_only_enabled_extractors_run(self):
+        config = ParserConfig(extractors=NUMERIC_ONLY)
+        assert extract_explicit_dates('on 04/08/2024 since 2019 and Oct-23', config=config) == {
+            '04/08/2024': 'FULL_EXPLICIT_DATE'}
+
+    def test_unknown_extractor(self):
+        with pytest.raises(ValueError):
+            extract_explicit_dates('on 04/08/2024', config=ParserConfig(extractors={'extract_nothing'}))
+
+    def test_parse_dates(self):
+        result = parse_dates('on 04/08/2024 since 2019, 5 days ago',
+                             config=ParserConfig(extractors=NUMERIC_ONLY))
+        assert [d.text for d in result.explicit_dates] == ['04/08/2024']
+        assert len(result.relative_times) == 1
+
+
+class TestCompiledCache:
+
+    def test_equal_configs_share_one_extractor(self):
+        a = ExplicitTimeExtractor.for_config(ParserConfig(min_year=1700, day_first=True))
+        b = ExplicitTimeExtractor.for_config(ParserConfig(min_year=1700, day_first=True))
+        c = ExplicitTimeExtractor.for_config(ParserConfig(min_year=1700, day_first=False))
+        assert a is b
+        assert a is not c
+
+    def test_bounded(self):
+        for year in range(1000, 1000 + 2 * explicit_time_extractor._MAX_COMPILED):
+            ExplicitTimeExtractor.for_config(ParserConfig(min_year=year))
+        assert len(explicit_time_extractor._COMPILED) <= explicit_time_extractor._MAX_COMPILED
+        # the current default is compiled again on its next use
+        assert extract_explicit_dates('on 04/08/2024') == {'04/08/2024': 'FULL_EXPLICIT_DATE'}
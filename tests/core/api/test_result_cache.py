@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the persistent result cache used by parse_dates_batch."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from fast_parse_time import (
+    ParserConfig,
+    PersistentCache,
+    open_result_cache,
+    parse_dates,
+    parse_dates_batch,
+)
+from fast_parse_time import api
+
+
+SUNDAY = datetime(2026, 10, 18)
+
+LINES = [
+    'job 1842 failed 5 days ago',
+    'invoice dated 04/08/2024 is overdue',
+    'nothing to report',
+    'ship it next friday',
+    'Deployed 2017-02-03T09:04:08Z, reviewed March 3, 2025',
+]
+
+
+def _values(results):
+    return [(r.explicit_dates, r.relative_times) for r in results]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'results.sqlite')
+
+
+class TestResultCache:
+
+    def test_second_run_reads_the_cache(self, path):
+        with open_result_cache(path) as cache:
+            first = parse_dates_batch(LINES * 2, cache=cache, reference=SUNDAY)
+            assert (cache.hits, cache.misses) == (0, len(LINES))
+
+        with open_result_cache(path) as cache:
+            second = parse_dates_batch(LINES, cache=cache, reference=SUNDAY)
+            assert (cache.hits, cache.misses) == (len(LINES), 0)
+
+        expected = _values(parse_dates(text, reference=SUNDAY) for text in LINES)
+        assert _values(first) == expected * 2
+        assert _values(second) == expected
+
+    def test_keyed_by_config_and_weekday(self, path):
+        with open_result_cache(path) as cache:
+            parse_dates_batch(['in 1850', 'next friday'], cache=cache, reference=SUNDAY)
+            old, = parse_dates_batch(['in 1850'], cache=cache, config=ParserConfig(min_year=1800))
+            friday, = parse_dates_batch(['next friday'], cache=cache, reference=datetime(2026, 10, 19))
+        assert [d.text for d in old.explicit_dates] == ['1850']
+        assert friday.relative_times[0].cardinality == 4
+
+    def test_new_kb_empties_the_cache(self, path, monkeypatch):
+        with open_result_cache(path) as cache:
+            parse_dates_batch(LINES, cache=cache)
+            assert len(cache) == len(LINES)
+
+        monkeypatch.setattr(api, 'kb_fingerprint', lambda: 'regenerated')
+        with open_result_cache(path) as cache:
+            assert len(cache) == 0
+
+    def test_requires_dedupe(self, path):
+        with open_result_cache(path) as cache, pytest.raises(ValueError):
+            parse_dates_batch(LINES, dedupe=False, cache=cache)
+
+    def test_wal_mode(self, path):
+        open_result_cache(path).close()
+        assert sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+class TestPersistentCache:
+
+    def test_bulk_reads_and_writes(self, path):
+        with PersistentCache(path) as cache:
+            cache.put_many({b'a': 'one', b'b': 'two'})
+            assert cache.get_many([b'a', b'b', b'c']) == {b'a': 'one', b'b': 'two'}
+            assert cache.stats()['bytes'] == len(b'a' + b'one' + b'b' + b'two')
+
+    def test_multibyte_values_count_in_bytes(self, path):
+        value = 'ü' * 48   # 96 bytes in UTF-8
+        with PersistentCache(path, max_bytes=1000) as cache:
+            for i in range(20):
+                cache.put_many({f'{i:04}'.encode(): value})
+            stats = cache.stats()
+            stored = sum(len(k) + len(v.encode()) for k, v in cache.get_many(
+                f'{i:04}'.encode() for i in range(20)).items())
+        assert stats['bytes'] == stored <= 1000
+        assert stats['entries'] == 10
+
+    def test_first_value_is_kept(self, path):
+        with PersistentCache(path) as cache:
+            cache.put_many({b'a': 'one'})
+            cache.put_many({b'a': 'uno'})
+            assert cache.get_many([b'a']) == {b'a': 'one'}
+            assert cache.stats()['bytes'] == 4
+
+    def test_bounded(self, path):
+        with PersistentCache(path, max_bytes=1000) as cache:
+            for i in range(20):
+                cache.put_many({f'{i:04}'.encode(): 'x' * 96})
+            stats = cache.stats()
+        assert stats['bytes'] <= 1000
+        assert stats['evictions'] == 20 - stats['entries']
+
+    def test_smaller_budget_on_open(self, path):
+        with PersistentCache(path) as cache:
+            cache.put_many({f'{i:04}'.encode(): 'x' * 96 for i in range(20)})
+        with PersistentCache(path, max_bytes=500) as cache:
+            assert cache.stats()['bytes'] <= 500
+
+    def test_namespace(self, path):
+        with PersistentCache(path, namespace='1.0') as cache:
+            cache.put_many({b'a': 'one'})
+        with PersistentCache(path, namespace='1.0') as cache:
+            assert len(cache) == 1
+        with PersistentCache(path, namespace='2.0') as cache:
+            assert len(cache) == 0
+
+    def test_invalid_budget(self, path):
+        with pytest.raises(ValueError):
+            PersistentCache(path, max_bytes=0)
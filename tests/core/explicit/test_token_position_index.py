@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import unittest
+from fast_parse_time.explicit.dmo import TokenPositionIndex
+from fast_parse_time import extract_explicit_dates
+from fast_parse_time.explicit.dto import MONTH_NAMES
+
+
+class TokenPositionIndexTest(unittest.TestCase):
+
+    def test_word_before(self):
+        text = 'the 3rd of  March'
+        index = TokenPositionIndex(text)
+        self.assertEqual(index.word_before(text.index('March')), 'of')
+        self.assertEqual(index.word_before(text.index(' of')), '3rd')
+        self.assertIsNone(index.word_before(0))
+
+    def test_word_before_requires_whitespace_gap(self):
+        text = 'of, March'
+        index = TokenPositionIndex(text)
+        self.assertIsNone(index.word_before(text.index('March')))
+
+    def test_has_month_within(self):
+        text = '31 Oct 2021-28 Nov 2021'
+        index = TokenPositionIndex(text)
+        self.assertTrue(index.has_month_within(0, text.index('2021')))
+        self.assertTrue(index.has_month_within(text.index('-28') + 3, len(text)))
+        self.assertFalse(index.has_month_within(text.index('2021'), text.index('Nov')))
+
+    def test_month_names_are_substrings(self):
+        # the same as the window check it replaces: 'mar' inside 'summary' counts
+        text = 'the summary said 2021-28 was decided'
+        index = TokenPositionIndex(text)
+        self.assertTrue(index.has_month_within(0, text.index('2021')))
+        self.assertTrue(index.has_month_within(text.index('28') + 2, len(text)))
+        self.assertFalse(index.has_month_within(text.index(' said'), text.index('2021')))
+
+    def test_same_as_lowercased_window_check(self):
+        text = 'OCTOBER 2021, aprİl and Octo 2021'
+        index = TokenPositionIndex(text)
+        for start in range(len(text) + 1):
+            for end in range(start, len(text) + 5):
+                expected = any(m in text[start:end].lower() for m in MONTH_NAMES)
+                self.assertEqual(index.has_month_within(start, end), expected, (start, end))
+
+
+class ProseYearGuardTest(unittest.TestCase):
+
+    def test_written_month_range_is_not_year_range(self):
+        result = extract_explicit_dates('from 31 Oct 2021-28 Nov 2021')
+        self.assertNotIn('2021-28', result)
+
+    def test_words_containing_month_names_on_both_sides(self):
+        # 'mar' in 'summary' and 'dec' in 'decided' suppress the range, as they always have
+        result = extract_explicit_dates('the summary covers 2021-28 as decided') or {}
+        self.assertNotIn('2021-28', result)
+
+    def test_year_in_range_not_repeated_as_year_only(self):
+        result = extract_explicit_dates('from 2004 to 2008 and in 2008')
+        self.assertEqual(result, {'2004-2008': 'YEAR_RANGE'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for the optional event sink.
+
+Event records are off by default and only built when a sink is registered.
+"""
+
+import sys
+
+import pytest
+
+from fast_parse_time import (
+    extract_relative_times,
+    register_event_sink,
+    clear_event_sink,
+)
+from fast_parse_time.implicit.svc import AnalyzeTimeReferences
+
+
+@pytest.fixture(autouse=True)
+def _no_sink():
+    clear_event_sink()
+    yield
+    clear_event_sink()
+
+
+def test_no_events_by_default():
+    """Without a sink the events list is empty."""
+    result = AnalyzeTimeReferences().process('5 days ago')
+    assert result['events'] == []
+    assert len(result['result']) == 1
+
+
+def test_sink_receives_event():
+    """A registered sink is called once per analyzed document."""
+    calls = []
+
+    def sink(service_name, event_name, stopwatch, data):
+        calls.append((service_name, event_name, data))
+        return {'event': event_name}
+
+    register_event_sink(sink)
+    result = AnalyzeTimeReferences().process('5 days ago')
+
+    assert len(calls) == 1
+    assert calls[0][1] == 'analyze-time-references'
+    assert len(calls[0][2]['solutions']) == 1
+    assert result['events'] == [{'event': 'analyze-time-references'}]
+
+
+def test_sink_returning_none():
+    """A sink that returns None contributes no event record."""
+    register_event_sink(lambda **kwargs: None)
+    result = AnalyzeTimeReferences().process('5 days ago')
+    assert result['events'] == []
+
+
+def test_public_api_unchanged_with_sink():
+    """Installing a sink does not change extraction results."""
+    register_event_sink(lambda **kwargs: {})
+    times = extract_relative_times('5 days ago')
+    assert times[0].cardinality == 5
+
+
+def test_non_callable_sink_rejected():
+    """Registering a non-callable raises TypeError."""
+    with pytest.raises(TypeError):
+        register_event_sink('not a sink')
+
+
+def test_baseblock_not_imported_by_default():
+    """Importing and using the library does not import baseblock."""
+    import subprocess
+    code = (
+        'import sys; import fast_parse_time; '
+        'fast_parse_time.parse_dates("5 days ago"); '
+        'print("baseblock" in sys.modules)'
+    )
+    out = subprocess.run([sys.executable, '-c', code],
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'False'
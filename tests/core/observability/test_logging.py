@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for library-scoped logging.
+
+The library must never reconfigure the root logger, and must not emit
+log records unless the host application enables debug logging.
+"""
+
+import logging
+
+from fast_parse_time import parse_dates
+from fast_parse_time.core import configure_logger
+
+
+def test_root_logger_level_untouched():
+    """Parsing must not change the root logger level or add handlers."""
+    root = logging.getLogger()
+    level, handlers = root.level, list(root.handlers)
+    root.setLevel(logging.WARNING)
+    try:
+        parse_dates('Meeting on 04/08/2024 about issues from 5 days ago')
+        assert root.level == logging.WARNING
+        assert root.handlers == handlers
+    finally:
+        root.setLevel(level)
+
+
+def test_package_logger_has_null_handler():
+    """The package logger carries a NullHandler for unconfigured applications."""
+    handlers = logging.getLogger('fast_parse_time').handlers
+    assert any(isinstance(h, logging.NullHandler) for h in handlers)
+
+
+def test_configure_logger_is_library_scoped():
+    """configure_logger returns a logger within the package hierarchy."""
+    logger = configure_logger('fast_parse_time.explicit.bp.explicit_time_extractor')
+    assert logger.name.startswith('fast_parse_time')
+
+
+def test_no_records_at_info(caplog):
+    """No records are emitted at INFO for ordinary extraction."""
+    with caplog.at_level(logging.INFO, logger='fast_parse_time'):
+        parse_dates('Event on March 15, 2024 and 04/08/2024')
+    assert not [r for r in caplog.records if r.name.startswith('fast_parse_time')]
+
+
+def test_records_at_debug(caplog):
+    """Classification details are available when debug logging is enabled."""
+    with caplog.at_level(logging.DEBUG, logger='fast_parse_time'):
+        parse_dates('Event on 04/08/2024')
+    messages = [r.getMessage() for r in caplog.records]
+    assert any('Date Classification' in m for m in messages)
+
+
+def test_unrecognized_delimited_token(caplog):
+    """A delimited token whose parts classify as no date returns nothing, and is logged at DEBUG."""
+    assert parse_dates('due 61/51 and 26/26').explicit_dates == []
+
+    with caplog.at_level(logging.DEBUG, logger='fast_parse_time'):
+        assert parse_dates('due 26/26').explicit_dates == []
+    messages = [r.getMessage() for r in caplog.records]
+    assert any('Unrecognized Date Component Classification' in m for m in messages)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for process-wide metrics counters and the OpenMetrics export.
+"""
+
+import pytest
+
+from fast_parse_time import (
+    parse_dates,
+    enable_metrics,
+    disable_metrics,
+    reset_metrics,
+    metrics_snapshot,
+    render_openmetrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    reset_metrics()
+    enable_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+def _samples(name: str) -> list:
+    return metrics_snapshot()[name]['samples']
+
+
+def _value(name: str, **labels) -> float:
+    for sample in _samples(name):
+        if sample['labels'] == labels:
+            return sample['value']
+    return 0
+
+
+def test_disabled_by_default():
+    """Nothing is counted unless metrics are enabled."""
+    reset_metrics()
+    parse_dates('filed in 2019')
+    assert _samples('fast_parse_time_documents') == []
+
+
+def test_documents_counted(metrics):
+    """Each parse_dates call counts one document per pipeline."""
+    parse_dates('filed in 2019')
+    parse_dates('nothing to see here')
+    assert _value('fast_parse_time_documents', pipeline='explicit') == 2
+    assert _value('fast_parse_time_documents', pipeline='relative') == 2
+
+
+def test_prefilter_rejections(metrics):
+    """Documents without digits or month names are rejected by prefilters."""
+    parse_dates('nothing to see here')
+    assert _value('fast_parse_time_prefilter_rejected', check='numeric') == 1
+    assert _value('fast_parse_time_prefilter_rejected', check='month_name') == 1
+
+
+def test_extractor_hits(metrics):
+    """Hits are attributed to the extractor that produced them."""
+    parse_dates('filed in 2019 and again on 04/08/2024')
+    assert _value('fast_parse_time_extractor_hits', extractor='extract_prose_year') == 1
+    assert _value('fast_parse_time_extractor_hits', extractor='extract_numeric_dates') == 1
+
+
+def test_relative_solutions_and_compound(metrics):
+    """Relative solutions are counted by frame and tense; compounds are counted."""
+    parse_dates('1 year and 2 months ago')
+    assert _value('fast_parse_time_relative_solutions', frame='year', tense='past') == 1
+    assert _value('fast_parse_time_relative_solutions', frame='month', tense='past') == 1
+    assert _value('fast_parse_time_compound_expansions') == 1
+
+
+def test_latency_histogram(metrics):
+    """Latency is recorded in fixed cumulative buckets."""
+    parse_dates('5 days ago')
+    parse_dates('5 days ago')
+    sample = [s for s in _samples('fast_parse_time_latency_seconds')
+              if s['labels'] == {'api': 'parse_dates'}][0]
+    assert sample['count'] == 2
+    assert sample['buckets']['+Inf'] == 2
+    assert sample['sum'] > 0
+    counts = list(sample['buckets'].values())
+    assert counts == sorted(counts)
+
+
+def test_render_openmetrics(metrics):
+    """The text export follows the OpenMetrics exposition format."""
+    parse_dates('filed in 2019')
+    text = render_openmetrics()
+    assert '# TYPE fast_parse_time_documents counter' in text
+    assert 'fast_parse_time_documents_total{pipeline="explicit"} 1' in text
+    assert 'fast_parse_time_latency_seconds_bucket{api="parse_dates",le="+Inf"} 1' in text
+    assert text.endswith('# EOF\n')
+
+
+def test_reset(metrics):
+    """reset_metrics zeroes all series."""
+    parse_dates('filed in 2019')
+    reset_metrics()
+    assert _samples('fast_parse_time_documents') == []
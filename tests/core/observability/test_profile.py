@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for the per-stage timing profile.
+"""
+
+from fast_parse_time import parse_dates, profile_stages, StageProfile
+from fast_parse_time.core import active_profile
+
+
+TEXT = 'Meeting on 04/08/2024 about issues from 1 year and 2 months ago'
+
+# triggers every explicit extractor (a month name, an ordinal, an ISO 8601 time)
+TEXT_ALL_EXTRACTORS = TEXT + ', reported Oct-23 on the 3rd of March 2024-01-05T10:00:00Z'
+
+
+def test_no_profile_by_default():
+    """parse_dates does not attach a profile unless asked."""
+    result = parse_dates(TEXT)
+    assert result.profile is None
+    assert active_profile() is None
+
+
+def test_profile_true_attaches_stages():
+    """parse_dates(profile=True) returns per-stage timings and call counts."""
+    result = parse_dates(TEXT_ALL_EXTRACTORS, profile=True)
+    assert isinstance(result.profile, StageProfile)
+
+    stages = result.profile.to_dict()
+    for name in [
+        'parse_dates',
+        'explicit.normalize_text',
+        'explicit.extract_numeric_dates',
+        'explicit.extract_written_dates',
+        'explicit.extract_hyphen_month_year',
+        'explicit.extract_prose_year',
+        'explicit.extract_iso8601_dates',
+        'explicit.extract_ordinal_dates',
+        'explicit.extract_space_month_number',
+        'relative.expand_compact_tokens',
+        'relative.digit_text_replacer',
+        'relative.extract_sequences',
+        'relative.filter_sequences',
+        'relative.find_solutions',
+        'relative.compound',
+    ]:
+        assert stages[name]['calls'] == 1
+        assert stages[name]['total_ns'] >= 0
+
+
+def test_untriggered_extractors_do_not_run():
+    """Extractors whose trigger does not hold (no month name here) get no stage."""
+    stages = parse_dates(TEXT, profile=True).profile.to_dict()
+    assert stages['explicit.extract_numeric_dates']['calls'] == 1
+    assert stages['explicit.extract_prose_year']['calls'] == 1
+    assert 'explicit.extract_written_dates' not in stages
+    assert 'explicit.extract_iso8601_dates' not in stages
+
+
+def test_profile_does_not_change_results():
+    """Profiling is observational only."""
+    assert parse_dates(TEXT, profile=True) == parse_dates(TEXT)
+
+
+def test_profile_aggregates_across_batch():
+    """profile_stages() aggregates call counts across many documents."""
+    with profile_stages() as prof:
+        for _ in range(5):
+            parse_dates(TEXT)
+    assert prof.to_dict()['parse_dates']['calls'] == 5
+    assert active_profile() is None
+
+
+def test_nested_profile_merges_into_outer():
+    """A per-document profile inside a batch profile is merged outward."""
+    with profile_stages() as outer:
+        inner = parse_dates(TEXT, profile=True).profile
+        parse_dates(TEXT)
+    assert inner.to_dict()['parse_dates']['calls'] == 1
+    assert outer.to_dict()['parse_dates']['calls'] == 2
+
+
+def test_str_renders_table():
+    """The string form lists each stage."""
+    text = str(parse_dates(TEXT, profile=True).profile)
+    assert 'explicit.extract_prose_year' in text
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for the slow-input capture ring buffer.
+"""
+
+import io
+import json
+
+import pytest
+
+from fast_parse_time import (
+    parse_dates,
+    record_slow_inputs,
+    stop_recording_slow_inputs,
+    SlowInputRecorder,
+)
+from fast_parse_time.core import get_slow_input_recorder
+
+
+@pytest.fixture(autouse=True)
+def _no_recorder():
+    stop_recording_slow_inputs()
+    yield
+    stop_recording_slow_inputs()
+
+
+def test_off_by_default():
+    """No recorder is installed unless requested."""
+    parse_dates('5 days ago')
+    assert get_slow_input_recorder() is None
+
+
+def test_keeps_n_slowest():
+    """Without a threshold the recorder keeps the N slowest inputs."""
+    recorder = SlowInputRecorder(capacity=2)
+    for i, elapsed_ns in enumerate([5, 1, 9, 3, 7]):
+        recorder.offer(f'text {i}', elapsed_ns * 1_000_000)
+    assert [r['text'] for r in recorder.records()] == ['text 2', 'text 4']
+
+
+def test_threshold_ring_buffer():
+    """With a threshold the recorder keeps the most recent inputs above it."""
+    recorder = SlowInputRecorder(capacity=2, threshold_ms=4)
+    for i, elapsed_ns in enumerate([5, 1, 9, 3, 7]):
+        recorder.offer(f'text {i}', elapsed_ns * 1_000_000)
+    assert sorted(r['text'] for r in recorder.records()) == ['text 2', 'text 4']
+
+
+def test_invalid_capacity():
+    """Capacity must be positive."""
+    with pytest.raises(ValueError):
+        SlowInputRecorder(capacity=0)
+
+
+def test_parse_dates_records_stages_and_sizes():
+    """parse_dates feeds the installed recorder with timings and sizes."""
+    recorder = record_slow_inputs(capacity=5)
+    parse_dates('Meeting on 04/08/2024 about issues from 5 days ago')
+
+    records = recorder.records()
+    assert len(records) == 1
+    record = records[0]
+    assert record['chars'] == len('Meeting on 04/08/2024 about issues from 5 days ago')
+    assert record['tokens'] == 9
+    assert record['elapsed_ms'] > 0
+    assert 'explicit.extract_numeric_dates' in record['stages']
+
+
+def test_recording_does_not_change_results():
+    """Recording is observational only."""
+    text = 'Meeting on 04/08/2024 about issues from 5 days ago'
+    expected = parse_dates(text)
+    record_slow_inputs()
+    assert parse_dates(text) == expected
+    assert parse_dates(text).profile is None
+
+
+def test_dump_jsonl():
+    """Records are dumped one JSON object per line, slowest first."""
+    recorder = SlowInputRecorder(capacity=3)
+    recorder.offer('fast', 1_000_000)
+    recorder.offer('slow', 9_000_000)
+
+    buffer = io.StringIO()
+    assert recorder.dump_jsonl(buffer) == 2
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [line['text'] for line in lines] == ['slow', 'fast']
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import random
+import re
+import unittest
+from fast_parse_time import extract_explicit_dates, extract_relative_times, parse_dates
+from fast_parse_time.core import AnchorWindows
+from fast_parse_time.core.anchor_windows import SEPARATOR
+from fast_parse_time.implicit.dto import d_index_by_slot_kb
+from fast_parse_time.implicit.svc.analyze_time_references import _WEAK_WORDS
+
+
+DIGITS = re.compile(r'\S*\d\S*')
+
+FILLER = ('the quarterly report was reviewed by the board and then filed '
+          'with a note in the archive of this office ').split()
+
+SAMPLES = [
+    'The contract was signed on 04/08/2024 and renewed on March 3, 2025.',
+    'We shipped the fix 5 days ago and the follow-up in 2 weeks.',
+    'The day before yesterday the meeting moved to next Friday.',
+    'It took half an hour, maybe 3 hours and 20 minutes in total.',
+    'Revenue grew from 2014 to 2016, as of December 2021 it was flat.',
+    'See you in a couple of days, or several weeks from now.',
+    'Deployed 5h ago; rollback 2d later, on the 3rd of December.',
+    'The record dates from 1990-08-09T01:18:06Z, and overmorrow is set.',
+]
+
+
+def _document(seed: int, words: int) -> str:
+    rng = random.Random(seed)
+    parts = []
+    while len(parts) < words:
+        if rng.random() < 0.02:
+            parts.append(rng.choice(SAMPLES))
+        else:
+            parts.append(rng.choice(FILLER))
+    return ' '.join(parts)
+
+
+class AnchorWindowsTest(unittest.TestCase):
+
+    def test_reduced_text(self):
+        windows = AnchorWindows(
+            'we talked about it at length and agreed on 5 days of rework', DIGITS, 1)
+        self.assertEqual(windows.text, f'{SEPARATOR}on 5 days{SEPARATOR}')
+        self.assertEqual(windows.anchor_count, 1)
+
+    def test_no_anchor(self):
+        windows = AnchorWindows('nothing to see here', DIGITS, 2)
+        self.assertEqual(windows.text, '')
+        self.assertEqual(windows.spans, [])
+        self.assertEqual(windows.coverage, 0.0)
+
+    def test_anchor_inside_token_is_whole_token(self):
+        windows = AnchorWindows('alpha beta x5y gamma delta', DIGITS, 0)
+        self.assertEqual(windows.spans, [(11, 14)])
+
+    def test_close_anchors_share_one_window(self):
+        text = 'a b 1 c 2 d e f g h 3 i'
+        windows = AnchorWindows(text, DIGITS, 1)
+        self.assertEqual([text[start:end] for start, end in windows.spans], ['b 1 c 2 d', 'h 3 i'])
+
+    def test_windows_reach_text_edges(self):
+        text = '  1 a b c d e f g h 2  '
+        windows = AnchorWindows(text, DIGITS, 3)
+        self.assertEqual(windows.spans, [(0, 9), (14, 23)])
+        self.assertTrue(windows.text.startswith('  1 a b'))
+        self.assertTrue(windows.text.endswith('g h 2  '))
+
+    def test_context_chars_snap_to_tokens(self):
+        text = 'one two three four 7 five six seven eight'
+        windows = AnchorWindows(text, DIGITS, 0, context_chars=6)
+        self.assertEqual(windows.text, f'{SEPARATOR}three four 7 five six{SEPARATOR}')
+
+    def test_run_pattern_extends_over_run(self):
+        text = 'zip foo a b c 1 d e bar baz qux'
+        run = re.compile(r'[a-e]|\d')
+        windows = AnchorWindows(text, DIGITS, 1, run_pattern=run)
+        self.assertEqual(windows.text, f'{SEPARATOR}foo a b c 1 d e bar{SEPARATOR}')
+
+    def test_long_tokens(self):
+        text = ' '.join(['x' * 1000, 'y' * 700, '9', 'z' * 900, 'w'])
+        windows = AnchorWindows(text, DIGITS, 1)
+        self.assertEqual(windows.text, f"{SEPARATOR}{'y' * 700} 9 {'z' * 900}{SEPARATOR}")
+
+    def test_many_distinct_anchors(self):
+        text = ' '.join(f'n{i} {i} filler words here' for i in range(200))
+        windows = AnchorWindows(text, DIGITS, 0)
+        self.assertEqual(windows.anchor_count, 400)
+        self.assertEqual(windows.spans[:2], [(0, 4), (23, 27)])
+
+    def test_to_original(self):
+        text = 'aaa bbb 1 ccc ddd eee fff 2 ggg'
+        windows = AnchorWindows(text, DIGITS, 0)
+        for start, end in windows.spans:
+            offset = windows.text.index(text[start:end])
+            self.assertEqual(windows.to_original(offset), start)
+        with self.assertRaises(ValueError):
+            windows.to_original(1)
+
+
+class AnchorWindowsExtractionTest(unittest.TestCase):
+
+    def test_samples(self):
+        for text in SAMPLES:
+            self.assertEqual(extract_explicit_dates(text, anchor_windows=True),
+                             extract_explicit_dates(text), text)
+            self.assertEqual(
+                [vars(result) for result in extract_relative_times(text, anchor_windows=True)],
+                [vars(result) for result in extract_relative_times(text)], text)
+
+    def test_long_documents(self):
+        for seed in range(5):
+            text = _document(seed, 3000)
+            full = parse_dates(text)
+            windowed = parse_dates(text, anchor_windows=True)
+            self.assertEqual(windowed.explicit_dates, full.explicit_dates)
+            self.assertEqual(windowed.relative_times, full.relative_times)
+
+    def test_no_slot_is_weak_words_only(self):
+        # a run of weak words alone must never have a solution
+        for slot in d_index_by_slot_kb:
+            self.assertFalse(
+                all(token in _WEAK_WORDS or token.replace('.', '', 1).isdigit()
+                    for token in slot.split()), slot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import random
+import re
+import unittest
+from fast_parse_time.core import build_alternation
+from fast_parse_time.explicit.dto import MONTH_NAMES
+
+
+class BuildAlternationTest(unittest.TestCase):
+
+    def test_prefixes_are_factored(self):
+        self.assertEqual(
+            build_alternation(['jan', 'january', 'june', 'jun', 'jul', 'july']),
+            'j(?:an(?:uary)?|u(?:ly?|ne?))')
+
+    def test_single_word(self):
+        self.assertEqual(build_alternation(['may']), 'may')
+
+    def test_special_characters_are_escaped(self):
+        pattern = re.compile(build_alternation(['a.m.', 'a+b']))
+        self.assertTrue(pattern.fullmatch('a.m.'))
+        self.assertIsNone(pattern.fullmatch('axmx'))
+        self.assertTrue(pattern.fullmatch('a+b'))
+
+    def test_space_matches_whitespace_run(self):
+        pattern = re.compile(build_alternation(['as of', 'as']))
+        self.assertEqual(pattern.match('as \t of').group(), 'as \t of')
+        self.assertEqual(pattern.match('as if').group(), 'as')
+
+    def test_empty_lexicon(self):
+        with self.assertRaises(ValueError):
+            build_alternation(['', ''])
+
+    def test_same_matches_as_longest_first_alternation(self):
+        flat = re.compile('|'.join(sorted(MONTH_NAMES, key=len, reverse=True)), re.I)
+        trie = re.compile(build_alternation(MONTH_NAMES), re.I)
+
+        rng = random.Random(42)
+        alphabet = 'januarybcdeghilmoprstvJMS ,.'
+        names = sorted(MONTH_NAMES)
+        for _ in range(2000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            text += rng.choice(names) + rng.choice(['', 'ber', 'e', ' 5'])
+            self.assertEqual(
+                [m.span() for m in flat.finditer(text)],
+                [m.span() for m in trie.finditer(text)], text)
+
+
+if __name__ == '__main__':
+    unittest.main()
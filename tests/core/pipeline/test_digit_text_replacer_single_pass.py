@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import itertools
+import random
+import unittest
+from fast_parse_time.implicit.dmo import DigitTextReplacer, NumberWordParser
+
+
+INPUTS = [
+    '',
+    'nothing to see here',
+    '1 year, 2 months ago',
+    '1 year and 2 months ago',
+    'next week and 5 days',
+    'the day before yesterday',
+    'day after tomorrow we leave',
+    'overmorrow',
+    'sales till date and to date',
+    'half an hour ago and half a day later',
+    'half a day before yesterday',
+    'into date and up to dated files',
+    'behalf an hour',
+    'xovermorrow',
+    'to , date',
+    'to, date',
+    '7.2 hours ago and 22.355 days ago',
+    'next friday and last mon',
+    'next , friday',
+    'twenty five days ago',
+    'one hundred , and ten days',
+    'a hundred days and a few hours and several weeks',
+    '5 min ago and 1 min ago and 3 hr from now',
+    '05 days ago',
+]
+
+
+# tokens outside the vocabulary that steps still read: digits, floats, commas,
+# hyphenated cardinals, and words a phrase can be glued to
+OTHER_TOKENS = ['5', '05', '1', '7.2', 'x', 'days,', 'and,', ',', 'to,',
+                'into', 'dated', 'twenty-five', 'one-hundred', 'five-hundred-thousand']
+
+
+def _vocabulary_sequences() -> list:
+    """Token sequences covering every word a normalization step reads."""
+    words = sorted(DigitTextReplacer.vocabulary()) + OTHER_TOKENS
+    phrases = [phrase.split() for phrase, _ in DigitTextReplacer.PHRASE_REPLACEMENTS]
+    context = ['5', '1', 'and', 'a', 'next', 'last', 'days', 'hour', ',', 'x', 'twenty', 'hundred']
+    number_words = sorted(NumberWordParser.WORDS | {'and', 'a', 'an'}) + ['5', ',', 'days', 'min']
+
+    sequences = [[word] for word in words]
+    for word, other in itertools.product(words, context):
+        sequences += [[word, other], [other, word]]
+    for phrase, word in itertools.product(phrases, words):
+        sequences += [[word] + phrase, phrase + [word]]
+    sequences += [list(pair) for pair in itertools.product(number_words, repeat=2)]
+
+    rng = random.Random(40)
+    sequences += [[rng.choice(words) for _ in range(rng.randint(3, 7))] for _ in range(20_000)]
+    return sequences
+
+
+class SinglePassNormalizerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.replacer = DigitTextReplacer()
+
+    def test_matches_stepwise(self):
+        for text in INPUTS:
+            tokens = text.split()
+            with self.subTest(text=text):
+                self.assertEqual(
+                    self.replacer.process(list(tokens)),
+                    self.replacer._process_stepwise(list(tokens)))
+
+    def test_matches_stepwise_over_the_vocabulary(self):
+        # every normalization rule lives in both paths; they must not drift apart
+        mismatches = [
+            tokens for tokens in _vocabulary_sequences()
+            if self.replacer.process(list(tokens)) != self.replacer._process_stepwise(list(tokens))]
+        self.assertEqual(mismatches[:10], [])
+
+    def test_tokens_with_whitespace(self):
+        tokens = ['half an', 'hour', 'a\tday']
+        self.assertEqual(
+            self.replacer.process(tokens),
+            self.replacer._process_stepwise(tokens))
+
+    def test_phrase_replacement(self):
+        self.assertEqual(
+            self.replacer.process('the day before yesterday'.split()),
+            ['2', 'days', 'ago'])
+        self.assertEqual(
+            self.replacer.process('half a day before yesterday'.split()),
+            ['half', '1', '2', 'days', 'ago'])
+
+    def test_substring_phrase_replacement_is_kept(self):
+        # historical behaviour of replacing phrases in the joined text
+        self.assertEqual(self.replacer.process('into date'.split()), ['intoday'])
+
+    def test_superscript_before_unit(self):
+        self.assertEqual(self.replacer.process(['²', 'hr']), ['²', 'hr'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import unittest
+from fast_parse_time.implicit.dmo import DigitTextReplacer, NumberWordParser
+from fast_parse_time import extract_relative_times
+
+
+class NumberWordParserTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.parser = NumberWordParser()
+
+    def _parse(self, text: str) -> list:
+        return self.parser.process(text.split())
+
+    def test_single_words(self):
+        self.assertEqual(self._parse('three days'), ['3', 'days'])
+        self.assertEqual(self._parse('zero days'), ['0', 'days'])
+        self.assertEqual(self._parse('twelve hours'), ['12', 'hours'])
+
+    def test_multi_token_cardinals(self):
+        self.assertEqual(self._parse('twenty five days ago'), ['25', 'days', 'ago'])
+        self.assertEqual(self._parse('one hundred and ten'), ['110'])
+        self.assertEqual(self._parse('one thousand two hundred and five'), ['1205'])
+        self.assertEqual(self._parse('five hundred thousand'), ['500000'])
+        self.assertEqual(self._parse('nineteen hundred'), ['1900'])
+
+    def test_hyphenated(self):
+        self.assertEqual(self._parse('twenty-three choices'), ['23', 'choices'])
+        self.assertEqual(self._parse('twenty-five-hundred'), ['2500'])
+        self.assertEqual(self._parse('twenty-thirteen'), ['twenty-thirteen'])
+        self.assertEqual(self._parse('one-time'), ['one-time'])
+
+    def test_article_before_scale(self):
+        self.assertEqual(self._parse('a hundred days'), ['100', 'days'])
+        self.assertEqual(self._parse('a day'), ['a', 'day'])
+
+    def test_bare_scale(self):
+        self.assertEqual(self._parse('hundred years'), ['100', 'years'])
+        self.assertEqual(self._parse('thousand years'), ['1000', 'years'])
+        self.assertEqual(self._parse('million years'), ['1000000', 'years'])
+        self.assertEqual(self._parse('hundred and ten'), ['110'])
+
+    def test_sequences_that_do_not_combine(self):
+        self.assertEqual(self._parse('one two three'), ['1', '2', '3'])
+        self.assertEqual(self._parse('twenty twenty'), ['20', '20'])
+        self.assertEqual(self._parse('one thousand one million'), ['1001', '1000000'])
+
+    def test_and_outside_a_cardinal_is_kept(self):
+        self.assertEqual(self._parse('one hundred and apples'), ['100', 'and', 'apples'])
+        self.assertEqual(self._parse('twenty and five'), ['20', 'and', '5'])
+        self.assertEqual(self._parse('one hundred and'), ['100', 'and'])
+
+    def test_digits(self):
+        self.assertEqual(self._parse('05 12 ٣'), ['5', '12', '3'])
+        # not decimal: int() would reject it, so it is left alone
+        self.assertEqual(self._parse('²'), ['²'])
+
+    def test_digit_text_replacer(self):
+        self.assertEqual(
+            DigitTextReplacer().process('twenty five days and a few hours'.split()),
+            ['25', 'days', 'and', '1', '3', 'hours'])
+
+
+class MultiTokenCardinalTest(unittest.TestCase):
+
+    def _cardinality(self, text: str) -> int:
+        results = extract_relative_times(text)
+        self.assertEqual(len(results), 1)
+        return results[0].cardinality
+
+    def test_space_separated_compound(self):
+        self.assertEqual(self._cardinality('twenty five days ago'), 25)
+
+    def test_hundreds_with_and(self):
+        self.assertEqual(self._cardinality('one hundred and ten days ago'), 110)
+
+    def test_hundreds(self):
+        self.assertEqual(self._cardinality('five hundred years ago'), 500)
+
+    def test_bare_scale(self):
+        self.assertEqual(self._cardinality('hundred years ago'), 100)
+        self.assertEqual(self._cardinality('thousand years ago'), 1000)
+        self.assertEqual(self._cardinality('1 hundred days ago'), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import unittest
+from fast_parse_time.explicit.dto import ParserConfig
+from fast_parse_time.explicit.svc import (
+    ClassifyNumericComponents,
+    PreClassifyNumericComponents,
+    ScanNumericComponents,
+    TokenizeNumericComponents,
+)
+
+
+INPUTS = [
+    'nothing to see here',
+    'Meeting on 04/08/2024 about 12/25',
+    'Leap Year: 02/29/2024 and 02/29/2024 again',
+    'version 4.5 and 4-5 and 4/5',
+    'dates 2014-2015 and 12/25-2020 and 1.2.2020',
+    'signed +5 and underscored 1_0 and 2_024',
+    'only +5 here',
+    'arabic-indic ٠٤/٠٨/٢٠٢٤ digits',
+    'Noise[12-25-2023]end',
+    'filed in 2019 with 31 items',
+    '0/5 and 5/0 and 99/99',
+    '2024-03-15 2024.03.15 15.03.2024',
+    '1/2/3/4 and 5--6 and //',
+    '½ of 3/4 things',
+]
+
+
+class ScanNumericComponentsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.scanner = ScanNumericComponents()
+
+    @staticmethod
+    def _three_stage(input_text: str, config: ParserConfig = None) -> dict[str, str] | None:
+        if not PreClassifyNumericComponents().process(input_text):
+            return None
+        tokens = TokenizeNumericComponents(config).process(input_text)
+        if not tokens:
+            return {}
+        return ClassifyNumericComponents(config).process(tokens) or {}
+
+    def test_matches_three_stage_pipeline(self):
+        for input_text in INPUTS:
+            expected = self._three_stage(input_text)
+            actual = self.scanner.process(input_text)
+            with self.subTest(input_text=input_text):
+                self.assertEqual(actual or {}, expected or {})
+                if expected:
+                    self.assertEqual(list(actual), list(expected))
+
+    def test_year_window_from_config(self):
+        config = ParserConfig(min_year=1800, max_year=1900)
+        input_text = 'ledger dated 04/08/1875 and 04/08/2024'
+        expected = self._three_stage(input_text, config)
+        self.assertEqual(expected, {'04/08/1875': 'FULL_EXPLICIT_DATE'})
+        self.assertEqual(ScanNumericComponents(config).process(input_text), expected)
+        self.assertEqual(self._three_stage(input_text), {'04/08/2024': 'FULL_EXPLICIT_DATE'})
+
+    def test_no_candidates_is_none(self):
+        self.assertIsNone(self.scanner.process('nothing to see here'))
+        self.assertIsNone(self.scanner.process('version 4.5 and 4-5'))
+
+    def test_unclassified_candidates_are_empty(self):
+        self.assertEqual(self.scanner.process('filed in 2019'), {})
+
+    def test_duplicates_classified_once(self):
+        self.assertEqual(
+            self.scanner.process('04/08/2024 then 04/08/2024'),
+            {'04/08/2024': 'FULL_EXPLICIT_DATE'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the per-sequence memo of filtered sequences and their solutions."""
+
+import pytest
+
+from fast_parse_time import extract_relative_times
+from fast_parse_time.implicit.dmo import KeywordSequenceFilter, SequenceSolutionFinder
+from fast_parse_time.implicit.svc import AnalyzeTimeReferences
+from fast_parse_time.implicit.svc import analyze_time_references
+
+
+TEXTS = [
+    'we shipped 5 days ago and again last week',
+    'from here show me all 5 items all the history from 5 days ago',
+    'next friday, or 3 hours from now',
+    'nothing to see here',
+]
+
+
+@pytest.fixture
+def memo(monkeypatch):
+    """An empty memo for the test; the shared one is restored afterwards."""
+    memo = {}
+    monkeypatch.setattr(analyze_time_references, '_SEQUENCE_MEMO', memo)
+    return memo
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_same_as_unmemoized(text, memo):
+    analyzer = AnalyzeTimeReferences()
+    tokens = analyzer._process(text)['tokens']
+    sequences = analyzer._extract_sequences(tokens)
+    filtered = KeywordSequenceFilter().process(sequences)
+    expected = SequenceSolutionFinder().process(filtered)
+
+    for _ in range(2):
+        result = analyzer._process(text)
+        assert result['sequences'] == filtered
+        assert result['solutions'] == expected
+
+
+def test_repeated_sequences_are_not_filtered_again(memo, monkeypatch):
+    calls = []
+    analyzer = AnalyzeTimeReferences()
+    filter_sequences = analyzer._filter_sequences
+    monkeypatch.setattr(analyzer, '_filter_sequences',
+                        lambda sequences: calls.append(sequences) or filter_sequences(sequences))
+
+    first = analyzer.process('filed 5 days ago')['result']
+    second = analyzer.process('reopened 5 days ago by the owner')['result']
+    assert first == second
+    assert calls == [[['5', 'days', 'ago']]]
+
+
+def test_compound_sub_tokens_use_the_memo(memo):
+    for _ in range(2):
+        result = extract_relative_times('1 year and 2 months ago')
+        assert [(r.cardinality, r.frame, r.tense) for r in result] == [(1, 'year', 'past'), (2, 'month', 'past')]
+    assert ('1', 'year', 'ago') in memo
+    assert ('2', 'months', 'ago') in memo
+
+
+def test_bounded(memo, monkeypatch):
+    monkeypatch.setattr(analyze_time_references, '_MAX_SEQUENCE_MEMO', 8)
+    for n in range(1, 30):
+        assert extract_relative_times(f'{n} days ago')[0].cardinality == n
+    assert len(memo) <= 8
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for the single-pass compact-token expansion in AnalyzeTimeReferences.
+
+The tense-marker lookahead is part of the token pattern, so each compact token
+is matched once; the expansion also reports the original and expanded spans.
+"""
+
+import re
+
+import pytest
+
+from fast_parse_time.implicit.svc.analyze_time_references import (
+    AnalyzeTimeReferences,
+    _COMPACT_UNIT_MAP,
+)
+
+expand = AnalyzeTimeReferences._expand_compact_tokens
+expand_with_offsets = AnalyzeTimeReferences._expand_compact_tokens_with_offsets
+
+
+# the two-pattern implementation the folded pattern replaced
+_LEGACY_TOKEN = re.compile(r'\b(\d+(?:\.\d+)?)(mo|min|d|w|m|y|h|s)\b', re.IGNORECASE)
+_LEGACY_MARKER = re.compile(r'\s+\b(ago|back|before)\b')
+
+
+def legacy_expand(input_text: str) -> str:
+    def replace(match):
+        cardinality_str, unit_letter = match.group(1), match.group(2)
+        if int(float(cardinality_str)) == 0:
+            return match.group(0)
+        unit_name = _COMPACT_UNIT_MAP[unit_letter.lower()]
+        if int(float(cardinality_str)) > 1:
+            unit_name += 's'
+        if _LEGACY_MARKER.match(input_text[match.end():]):
+            return f'{cardinality_str} {unit_name}'
+        return f'{cardinality_str} {unit_name} ago'
+    return _LEGACY_TOKEN.sub(replace, input_text)
+
+
+@pytest.mark.parametrize('text', [
+    '1d ago', '2w', '3mo ago', 'posted 5h', '10min back', '30s before',
+    '2.5h', '1.5d ago', '0d ago', '0.5h', '5D AGO', '5d AGO', '5d  ago',
+    '1d ago and 2w', '1d,2w', 'agod 4y agony', '3m before the 2y',
+    'no compact tokens here', '', '7h\tago', '1y back then 0w',
+])
+def test_matches_legacy_expansion(text):
+    assert expand(text) == legacy_expand(text)
+
+
+def test_implicit_ago():
+    assert expand('posted 5h') == 'posted 5 hours ago'
+    assert expand('1w') == '1 week ago'
+
+
+def test_explicit_marker_not_duplicated():
+    assert expand('5h ago') == '5 hours ago'
+    assert expand('2y before') == '2 years before'
+
+
+def test_marker_is_case_sensitive():
+    # input is expanded before lowercasing; an upper-case marker is not seen
+    assert expand('5h AGO') == '5 hours ago AGO'
+
+
+def test_zero_cardinality_not_expanded():
+    assert expand('0d ago') == '0d ago'
+    text, offsets = expand_with_offsets('0.5h and 0w')
+    assert text == '0.5h and 0w'
+    assert offsets == []
+
+
+def test_overlong_digit_run_not_expanded():
+    text = '9' * 400 + 'd'
+    assert expand(text) == text
+
+
+def test_offsets_map_original_to_expanded_spans():
+    original = 'posted 5h, edited 1d ago'
+    text, offsets = expand_with_offsets(original)
+    assert text == 'posted 5 hours ago, edited 1 day ago'
+    assert [original[s:e] for s, e, _, _ in offsets] == ['5h', '1d']
+    assert [text[s:e] for _, _, s, e in offsets] == ['5 hours ago', '1 day']
+
+
+def test_no_tokens_returns_input_unchanged():
+    original = 'nothing compact'
+    text, offsets = expand_with_offsets(original)
+    assert text is original
+    assert offsets == []
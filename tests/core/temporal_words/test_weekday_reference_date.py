@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Tests for resolving named weekday references against an explicit reference date.
+
+Weekday references are extracted as symbolic slots ('next:friday') and only
+turned into a day count at the end, against the `reference` argument, so the
+same text and reference always give the same result.
+
+Related GitHub Issues:
+    #11 - Gap: named weekday references not supported (next friday, last monday)
+          https://github.com/craigtrim/fast-parse-time/issues/11
+    #12 - feat: Support forward day-of-week references (e.g. 'next Friday', 'next Monday')
+          https://github.com/craigtrim/fast-parse-time/issues/12
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from fast_parse_time import (
+    RelativeTime,
+    get_date_range,
+    parse_and_resolve,
+    parse_dates,
+    parse_time_references,
+    resolve_to_datetime,
+    resolve_to_timedelta,
+)
+from fast_parse_time.implicit.dto import WEEKDAY_TOKENS
+from fast_parse_time.implicit.dto.index_by_slot_kb import Slot
+from fast_parse_time.implicit.svc import AnalyzeTimeReferences, ResolveTimeReferences
+
+
+SUNDAY = datetime(2026, 10, 18, 9, 30)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('next friday', RelativeTime(5, 'day', 'future')),
+    ('this fri', RelativeTime(5, 'day', 'future')),
+    ('coming monday', RelativeTime(1, 'day', 'future')),
+    ('next sunday', RelativeTime(7, 'day', 'future')),
+    ('last monday', RelativeTime(6, 'day', 'past')),
+    ('past sat', RelativeTime(1, 'day', 'past')),
+    ('last sunday', RelativeTime(7, 'day', 'past')),
+])
+def test_resolved_against_reference(text, expected):
+    assert parse_time_references(text, reference=SUNDAY) == [expected]
+
+
+@pytest.mark.parametrize('day', range(7))
+def test_every_reference_weekday(day):
+    reference = date(2026, 10, 19 + day)     # Monday + day
+    result = parse_time_references('next wednesday and last wednesday', reference=reference)
+    assert [r.cardinality for r in result] == [(2 - day) % 7 or 7, (day - 2) % 7 or 7]
+
+
+def test_result_does_not_depend_on_the_clock():
+    text = 'ship it next friday, review it last tuesday'
+    assert parse_time_references(text, reference=SUNDAY) == parse_time_references(
+        text, reference=SUNDAY.date())
+
+
+def test_non_weekday_references_ignore_reference():
+    assert parse_time_references('5 days ago', reference=SUNDAY) == parse_time_references('5 days ago')
+
+
+def test_process_is_symbolic():
+    solutions = AnalyzeTimeReferences()._process('next friday or last mon')['solutions']
+    assert [s.cardinality for s in solutions] == ['next:friday', 'last:monday']
+    assert {s.cardinality for s in solutions} <= WEEKDAY_TOKENS
+
+
+def test_resolve_weekday():
+    solution = Slot('next:friday', 'weekday', 'future')
+    assert ResolveTimeReferences.resolve_weekday(solution, SUNDAY) == Slot(5, 'day', 'future')
+
+
+def test_compound_with_weekday():
+    result = parse_time_references('next friday 3 days ago', reference=SUNDAY)
+    assert [r.frame for r in result] == ['day', 'day']
+
+
+class TestResolvedApis:
+
+    def test_resolve_to_datetime(self):
+        assert resolve_to_datetime('next friday', reference=SUNDAY) == [datetime(2026, 10, 23, 9, 30)]
+
+    def test_resolve_to_timedelta(self):
+        assert [d.days for d in resolve_to_timedelta('last friday', reference=SUNDAY)] == [-2]
+
+    def test_parse_dates(self):
+        result = parse_dates('due 04/08/2024, follow up next tue', reference=SUNDAY)
+        assert result.relative_times == [RelativeTime(2, 'day', 'future')]
+
+    def test_parse_and_resolve(self):
+        assert parse_and_resolve('last monday', reference=SUNDAY)['resolved'] == [
+            datetime(2026, 10, 12, 9, 30)]
+
+    def test_get_date_range(self):
+        assert get_date_range('from last friday to next friday', reference=SUNDAY) == (
+            datetime(2026, 10, 16, 9, 30), datetime(2026, 10, 23, 9, 30))